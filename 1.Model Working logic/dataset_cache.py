@@ -0,0 +1,156 @@
+"""Memory-mapped cache of the preprocessed training set.
+
+Decoding every JPEG and holding the whole dataset as float64 costs minutes and
+8 bytes per pixel. build_cache() decodes dataset/<label>/ once into 64x64 uint8
+`.npy` files (1 byte per pixel) keyed by a hash of the file list and IMG_SIZE;
+later runs with the same files reuse the cache without decoding anything.
+load_cache() memory-maps it, and make_batch_sequence() normalizes to float32
+one batch at a time, so only a single batch is ever held as floats.
+
+    python dataset_cache.py            # build (or reuse) the cache
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+
+DATASET_DIR = 'dataset'
+CACHE_DIR = 'cache'
+IMG_SIZE = 64
+WORKERS = min(8, os.cpu_count() or 1)
+
+
+def list_dataset(dataset_dir=DATASET_DIR):
+    """Return (class names, [(path, label index)]) in a stable, sorted order"""
+    class_names = sorted(name for name in os.listdir(dataset_dir)
+                         if os.path.isdir(os.path.join(dataset_dir, name)))
+    files = []
+    for idx, label in enumerate(class_names):
+        class_folder = os.path.join(dataset_dir, label)
+        for file in sorted(os.listdir(class_folder)):
+            files.append((os.path.join(class_folder, file), idx))
+    return class_names, files
+
+
+def cache_key(files, img_size=IMG_SIZE):
+    """Hash of IMG_SIZE plus every source path, size and mtime"""
+    digest = hashlib.sha1(f"img_size={img_size}\n".encode())
+    for path, label in files:
+        stat = os.stat(path)
+        digest.update(f"{path}|{label}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def _cache_paths(cache_dir, key):
+    stem = os.path.join(cache_dir, f"dataset_{key}")
+    return {"images": stem + "_images.npy", "labels": stem + "_labels.npy", "meta": stem + "_meta.json"}
+
+
+def _load_resized(path, img_size):
+    img = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return None
+    return cv2.resize(img, (img_size, img_size))
+
+
+def build_cache(dataset_dir=DATASET_DIR, img_size=IMG_SIZE, cache_dir=CACHE_DIR, workers=WORKERS):
+    """Decode the dataset into the cache unless an identical one exists; returns the meta path"""
+    class_names, files = list_dataset(dataset_dir)
+    key = cache_key(files, img_size)
+    paths = _cache_paths(cache_dir, key)
+    if os.path.exists(paths["meta"]):
+        print(f"✅ Reusing dataset cache: {paths['meta']}")
+        return paths["meta"]
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_images = paths["images"] + ".tmp"
+    images = np.lib.format.open_memmap(tmp_images, mode="w+", dtype=np.uint8,
+                                       shape=(len(files), img_size, img_size))
+    labels = np.empty(len(files), dtype=np.int32)
+    count, failed = 0, []
+
+    print(f"🔧 Building dataset cache from {len(files)} images...")
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        decoded = pool.map(lambda item: _load_resized(item[0], img_size), files, chunksize=64)
+        for (path, label), img in zip(files, decoded):
+            if img is None:
+                print(f"Error reading: {path}")
+                failed.append(path)
+                continue
+            images[count] = img
+            labels[count] = label
+            count += 1
+    images.flush()
+    del images
+
+    # The meta file is written last: its presence marks a complete cache
+    os.replace(tmp_images, paths["images"])
+    np.save(paths["labels"], labels[:count])
+    with open(paths["meta"] + ".tmp", "w") as f:
+        json.dump({
+            "key": key,
+            "dataset_dir": dataset_dir,
+            "img_size": img_size,
+            "count": count,
+            "class_names": class_names,
+            "images": os.path.basename(paths["images"]),
+            "labels": os.path.basename(paths["labels"]),
+            "failed": failed,
+        }, f, indent=2)
+    os.replace(paths["meta"] + ".tmp", paths["meta"])
+    print(f"✅ Cached {count} images ({count * img_size * img_size / 1e6:.1f} MB) → {paths['meta']}")
+    return paths["meta"]
+
+
+def load_cache(meta_path):
+    """Memory-map a cache: returns (uint8 images (N, S, S), int32 labels (N,), label_map)"""
+    with open(meta_path, "r") as f:
+        meta = json.load(f)
+    folder = os.path.dirname(meta_path)
+    images = np.load(os.path.join(folder, meta["images"]), mmap_mode="r")[:meta["count"]]
+    labels = np.load(os.path.join(folder, meta["labels"]), mmap_mode="r")
+    label_map = {name: idx for idx, name in enumerate(meta["class_names"])}
+    return images, labels, label_map
+
+
+def make_batch_sequence(images, labels, indices, num_classes, batch_size=32, shuffle=True, seed=None):
+    """Keras Sequence that reads batches from the memory-mapped cache.
+
+    Each batch is gathered from the mmap (indices sorted for sequential reads),
+    then scaled to float32 [0, 1] and one-hot encoded - nothing else is
+    materialized as floats.
+    """
+    from tensorflow.keras.utils import Sequence
+
+    class CachedBatches(Sequence):
+        def __init__(self):
+            super().__init__()
+            self.indices = np.array(indices)
+            self.rng = np.random.default_rng(seed)
+            self.eye = np.eye(num_classes, dtype=np.float32)
+            if shuffle:
+                self.rng.shuffle(self.indices)
+
+        def __len__(self):
+            return (len(self.indices) + batch_size - 1) // batch_size
+
+        def __getitem__(self, i):
+            batch_idx = np.sort(self.indices[i * batch_size:(i + 1) * batch_size])
+            x = images[batch_idx].astype(np.float32)
+            x *= 1 / 255.0
+            return x[..., np.newaxis], self.eye[labels[batch_idx]]
+
+        def on_epoch_end(self):
+            if shuffle:
+                self.rng.shuffle(self.indices)
+
+    return CachedBatches()
+
+
+if __name__ == "__main__":
+    meta_path = build_cache()
+    X, y, label_map = load_cache(meta_path)
+    print(f"Images: {X.shape} {X.dtype} | Labels: {y.shape} | Classes: {len(label_map)}")
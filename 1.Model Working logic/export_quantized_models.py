@@ -0,0 +1,209 @@
+import argparse
+import json
+import os
+import random
+import time
+
+import cv2
+import numpy as np
+import tensorflow as tf
+
+from test_model import evaluate
+
+# === CONFIGURATION ===
+MODEL_PATH = 'model/sign_model.h5'
+LABEL_MAP_PATH = 'model/label_map.npy'
+DATASET_DIR = 'dataset'            # Representative samples for INT8 calibration
+TEST_DIR = 'dataset_test'          # Scored with test_model.evaluate()
+OUTPUT_DIR = 'model'
+REPORT_PATH = os.path.join(OUTPUT_DIR, 'quantization_report.json')
+IMG_SIZE = 64
+REPRESENTATIVE_SAMPLES = 300
+MAX_ACCURACY_DROP = 1.0            # Percentage points a variant may lose vs float32
+# =======================
+
+VARIANTS = ("float32", "dynamic", "float16", "int8")
+
+
+def preprocess(path):
+    """Same preprocessing as training: gray, 64x64, [0, 1]"""
+    img = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return None
+    img = cv2.resize(img, (IMG_SIZE, IMG_SIZE))
+    return (img / 255.0).astype(np.float32).reshape(IMG_SIZE, IMG_SIZE, 1)
+
+
+def labeled_files(folder):
+    files = []
+    for label in sorted(os.listdir(folder)):
+        label_folder = os.path.join(folder, label)
+        if not os.path.isdir(label_folder):
+            continue
+        for file in sorted(os.listdir(label_folder)):
+            files.append((os.path.join(label_folder, file), label))
+    return files
+
+
+def representative_dataset(samples=REPRESENTATIVE_SAMPLES, seed=0):
+    """Evenly sample calibration images across every dataset/<label>/ folder"""
+    by_label = {}
+    for path, label in labeled_files(DATASET_DIR):
+        by_label.setdefault(label, []).append(path)
+    rng = random.Random(seed)
+    per_label = max(1, samples // max(1, len(by_label)))
+    chosen = []
+    for paths in by_label.values():
+        chosen += rng.sample(paths, min(per_label, len(paths)))
+    rng.shuffle(chosen)
+
+    def generator():
+        for path in chosen:
+            img = preprocess(path)
+            if img is not None:
+                yield [img[np.newaxis]]
+    return generator
+
+
+def convert(model, variant):
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if variant == "dynamic":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    elif variant == "float16":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif variant == "int8":
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset()
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+    return converter.convert()
+
+
+class TFLiteClassifier:
+    """Batch-1 TFLite runner that (de)quantizes int8 input/output when needed"""
+
+    def __init__(self, path, num_threads):
+        self.interpreter = tf.lite.Interpreter(model_path=path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self.input = self.interpreter.get_input_details()[0]
+        self.output = self.interpreter.get_output_details()[0]
+
+    def predict(self, img):
+        batch = img[np.newaxis]
+        if self.input["dtype"] != np.float32:
+            scale, zero_point = self.input["quantization"]
+            info = np.iinfo(self.input["dtype"])
+            batch = np.clip(np.round(batch / scale + zero_point), info.min, info.max)
+        self.interpreter.set_tensor(self.input["index"], batch.astype(self.input["dtype"]))
+        self.interpreter.invoke()
+        output = self.interpreter.get_tensor(self.output["index"])[0]
+        if output.dtype != np.float32:
+            scale, zero_point = self.output["quantization"]
+            output = (output.astype(np.float32) - zero_point) * scale
+        return output
+
+    def predict_batch(self, batch):
+        return np.stack([self.predict(img) for img in batch])
+
+
+class KerasClassifier:
+    def __init__(self, model):
+        self.model = model
+
+    def predict(self, img):
+        return self.model(img[np.newaxis], training=False).numpy()[0]
+
+    def predict_batch(self, batch):
+        return self.model.predict_on_batch(batch)
+
+
+def score(classifier, idx_to_label):
+    result = evaluate(classifier.predict_batch, idx_to_label, TEST_DIR)
+    return result["accuracy"], result["total"]
+
+
+def latency_ms(classifier, runs=300, warmup=30):
+    img = np.random.default_rng(0).random((IMG_SIZE, IMG_SIZE, 1), dtype=np.float32)
+    for _ in range(warmup):
+        classifier.predict(img)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        classifier.predict(img)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def recommend(rows):
+    """Fastest TFLite variant within MAX_ACCURACY_DROP of the float32 baseline"""
+    baseline = next(row["accuracy"] for row in rows if row["variant"] == "float32")
+    candidates = [row for row in rows
+                  if row["variant"] in VARIANTS and row["accuracy"] >= baseline - MAX_ACCURACY_DROP]
+    return min(candidates, key=lambda row: (row["latency_ms"], row["size_kb"]))["variant"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export quantized TFLite variants and compare them")
+    parser.add_argument("--threads", type=int, default=1,
+                        help="Interpreter threads used for the latency column")
+    parser.add_argument("--variants", nargs="+", default=list(VARIANTS), choices=VARIANTS)
+    args = parser.parse_args()
+    if "float32" not in args.variants:
+        args.variants.insert(0, "float32")
+
+    model = tf.keras.models.load_model(MODEL_PATH)
+    label_map = np.load(LABEL_MAP_PATH, allow_pickle=True).item()
+    idx_to_label = {v: k for k, v in label_map.items()}
+
+    keras = KerasClassifier(model)
+    accuracy, test_images = score(keras, idx_to_label)
+    print(f"Scored Keras baseline on {test_images} images from {TEST_DIR}/")
+    rows = [{
+        "variant": "keras_h5",
+        "path": MODEL_PATH,
+        "accuracy": accuracy,
+        "size_kb": os.path.getsize(MODEL_PATH) / 1024,
+        "latency_ms": latency_ms(keras),
+    }]
+
+    for variant in args.variants:
+        path = os.path.join(OUTPUT_DIR, f"sign_model_{variant}.tflite")
+        print(f"🔧 Exporting {variant} → {path}")
+        with open(path, "wb") as f:
+            f.write(convert(model, variant))
+        classifier = TFLiteClassifier(path, args.threads)
+        rows.append({
+            "variant": variant,
+            "path": path,
+            "accuracy": score(classifier, idx_to_label)[0],
+            "size_kb": os.path.getsize(path) / 1024,
+            "latency_ms": latency_ms(classifier),
+        })
+
+    recommended = recommend(rows)
+
+    print(f"\n{'variant':<10} {'accuracy':>9} {'size (KB)':>10} {'latency (ms)':>13}")
+    print("-" * 45)
+    for row in rows:
+        marker = "  ← recommended" if row["variant"] == recommended else ""
+        print(f"{row['variant']:<10} {row['accuracy']:>8.2f}% {row['size_kb']:>10.1f} "
+              f"{row['latency_ms']:>13.3f}{marker}")
+
+    with open(REPORT_PATH, "w") as f:
+        json.dump({
+            "test_images": test_images,
+            "threads": args.threads,
+            "max_accuracy_drop": MAX_ACCURACY_DROP,
+            "recommended": recommended,
+            "variants": rows,
+        }, f, indent=2)
+
+    print(f"\n✅ Report saved to: {REPORT_PATH}")
+    print(f"→ Copy model/sign_model_{recommended}.tflite and {REPORT_PATH} into "
+          f"'2.exe logic formation/model/' and set \"model_variant\": \"auto\" in settings.json")
+
+
+if __name__ == "__main__":
+    main()
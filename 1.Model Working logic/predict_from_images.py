@@ -1,51 +1,185 @@
+import argparse
+import csv
+import glob
+import json
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
 import cv2
 import numpy as np
-from tensorflow.keras.models import load_model
 
-# Load model and label map
-model = load_model('model/sign_model.h5')
-label_map = np.load('model/label_map.npy', allow_pickle=True).item()
-idx_to_label = {v: k for k, v in label_map.items()}
+MODEL_PATH = 'model/sign_model.h5'
+LABEL_MAP_PATH = 'model/label_map.npy'
 IMG_SIZE = 64
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
 
-# Folder containing test images
+# Folder containing test images (used when no input is given)
 test_folder = "test_sequence"
 
-# Get sorted image files (e.g., 01_A.jpg, 02_B.jpg for proper order)
-image_files = sorted([
-    f for f in os.listdir(test_folder)
-    if f.lower().endswith(('.jpg', '.jpeg', '.png'))
-])
+SPECIAL_CHARS = {"space": " ", "nothing": ".", "del": ","}
+
+
+def collect_files(inputs):
+    """Expand directories (recursively) and glob patterns into a sorted list of images.
+
+    Sorting by path keeps names like 01_A.jpg, 02_B.jpg in sentence order.
+    """
+    files = set()
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            for folder, _, names in os.walk(pattern):
+                files.update(os.path.join(folder, n) for n in names
+                             if n.lower().endswith(IMAGE_EXTENSIONS))
+        else:
+            files.update(p for p in glob.glob(pattern, recursive=True)
+                         if p.lower().endswith(IMAGE_EXTENSIONS))
+    return sorted(files)
 
-sentence = ""
 
-print("\n--- Predictions ---")
-for filename in image_files:
-    path = os.path.join(test_folder, filename)
+def load_image(path):
+    """Worker: decode and resize one image to uint8 (None if unreadable)"""
     img = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
     if img is None:
-        print(f"❌ Could not load: {filename}")
-        continue
-
-    # Preprocess image
-    img = cv2.resize(img, (IMG_SIZE, IMG_SIZE))
-    img = img / 255.0
-    img = img.reshape(1, IMG_SIZE, IMG_SIZE, 1)
-
-    prediction = model.predict(img, verbose=0)
-    pred_index = np.argmax(prediction)
-    pred_class = idx_to_label[pred_index]
-    confidence = prediction[0][pred_index]
-
-    # Build sentence without any repeat delay
-    sentence += {
-        "space": " ",
-        "nothing": ".",
-        "del": ","
-    }.get(pred_class, pred_class)
-
-    print(f"{filename} → {pred_class} ({confidence*100:.2f}%)")
-
-print("\n✅ Final Sentence Prediction:")
-print("→", sentence)
+        return None
+    return cv2.resize(img, (IMG_SIZE, IMG_SIZE))
+
+
+def load_chunk(paths):
+    """Worker: decode a run of consecutive files (one pickling round trip per chunk)"""
+    return [load_image(path) for path in paths]
+
+
+def decoded_images(files, chunk_size, workers):
+    """Yield the decoded image (or None) of every file, in order.
+
+    At most `workers * 2` chunks are queued or finished but not yet consumed,
+    so when the model is slower than the decoders they wait instead of piling
+    up decoded images; memory stays flat however many files there are.
+    """
+    if workers <= 1:
+        yield from map(load_image, files)
+        return
+    chunks = (files[i:i + chunk_size] for i in range(0, len(files), chunk_size))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(load_chunk, chunk))
+            if len(in_flight) >= workers * 2:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def decoded_batches(files, batch_size, workers):
+    """Yield (paths, float32 batch, unreadable paths) in filename order.
+
+    Decoding is spread over a process pool with a bounded number of chunks in
+    flight (see decoded_images), so batches come out in the same order as
+    `files`.
+    """
+    images = decoded_images(files, max(1, batch_size // max(1, workers)), workers)
+    paths, batch, failed = [], [], []
+    for path, img in zip(files, images):
+        if img is None:
+            failed.append(path)
+        else:
+            paths.append(path)
+            batch.append(img)
+        if len(paths) + len(failed) == batch_size:
+            yield paths, _to_batch(batch), failed
+            paths, batch, failed = [], [], []
+    if paths or failed:
+        yield paths, _to_batch(batch), failed
+
+
+def _to_batch(images):
+    if not images:
+        return np.empty((0, IMG_SIZE, IMG_SIZE, 1), dtype=np.float32)
+    return (np.stack(images).astype(np.float32) / 255.0)[..., np.newaxis]
+
+
+class ResultWriter:
+    """Streams one row per image to a .jsonl or .csv file as batches finish"""
+    FIELDS = ("file", "prediction", "confidence", "error")
+
+    def __init__(self, path):
+        self.file = open(path, "w", encoding="utf-8", newline="")
+        self.csv = None
+        if path.lower().endswith(".csv"):
+            self.csv = csv.DictWriter(self.file, fieldnames=self.FIELDS)
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.csv:
+            self.csv.writerow(row)
+        else:
+            self.file.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Predict signs from image folders or globs")
+    parser.add_argument("inputs", nargs="*", default=[test_folder],
+                        help="Directories (searched recursively) or glob patterns, e.g. 'recordings/**/*.jpg'")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Decoding processes (1 = decode in this process)")
+    parser.add_argument("--output", help="Stream results to this .jsonl or .csv file")
+    parser.add_argument("--quiet", action="store_true", help="Don't print a line per image")
+    args = parser.parse_args()
+
+    from tensorflow.keras.models import load_model
+
+    # Load model and label map
+    model = load_model(MODEL_PATH)
+    label_map = np.load(LABEL_MAP_PATH, allow_pickle=True).item()
+    idx_to_label = {v: k for k, v in label_map.items()}
+
+    files = collect_files(args.inputs)
+    print(f"\n--- Predictions ({len(files)} images) ---")
+    writer = ResultWriter(args.output) if args.output else None
+    sentence = ""
+
+    try:
+        for paths, batch, failed in decoded_batches(files, args.batch_size, args.workers):
+            for path in failed:
+                print(f"❌ Could not load: {path}")
+                if writer:
+                    writer.write({"file": path, "prediction": None, "confidence": None, "error": "unreadable"})
+            if not paths:
+                continue
+
+            prediction = model.predict_on_batch(batch)
+            for path, probs in zip(paths, prediction):
+                pred_index = int(np.argmax(probs))
+                pred_class = idx_to_label[pred_index]
+                confidence = float(probs[pred_index])
+
+                # Build sentence without any repeat delay
+                sentence += SPECIAL_CHARS.get(pred_class, pred_class)
+
+                if not args.quiet:
+                    print(f"{os.path.relpath(path)} → {pred_class} ({confidence*100:.2f}%)")
+                if writer:
+                    writer.write({"file": path, "prediction": pred_class,
+                                  "confidence": round(confidence, 6), "error": None})
+            if writer:
+                writer.flush()
+    finally:
+        if writer:
+            writer.close()
+
+    print("\n✅ Final Sentence Prediction:")
+    print("→", sentence)
+    if args.output:
+        print(f"✅ Results written to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
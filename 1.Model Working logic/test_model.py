@@ -1,40 +1,173 @@
+import argparse
+import collections
+import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import cv2
 import numpy as np
-from tensorflow.keras.models import load_model
 
 MODEL_PATH = 'model/sign_model.h5'
 LABEL_MAP_PATH = 'model/label_map.npy'
 TEST_DIR = 'dataset_test'
 IMG_SIZE = 64
+BATCH_SIZE = 128
+WORKERS = min(8, os.cpu_count() or 1)
+
+
+def list_test_images(test_dir):
+    """Return [(image path, true label)] for every file under test_dir/<label>/"""
+    items = []
+    for label in sorted(os.listdir(test_dir)):
+        label_folder = os.path.join(test_dir, label)
+        if not os.path.isdir(label_folder):
+            continue
+        for file in sorted(os.listdir(label_folder)):
+            items.append((os.path.join(label_folder, file), label))
+    return items
+
+
+def load_image(path):
+    """Decode + resize one image to a uint8 IMG_SIZE x IMG_SIZE array (None if unreadable)"""
+    img = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return None
+    return cv2.resize(img, (IMG_SIZE, IMG_SIZE))
+
+
+def stream_batches(items, batch_size=BATCH_SIZE, workers=WORKERS, skipped=None):
+    """Decode images in a thread pool and yield (float32 batch, labels) in file order.
+
+    Only a few batches are decoded ahead of the consumer, so memory stays flat
+    however large the test set is. Unreadable files are appended to `skipped`.
+    """
+    lookahead = batch_size * 4
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = collections.deque()
+        items = iter(items)
+        batch = np.empty((batch_size, IMG_SIZE, IMG_SIZE, 1), dtype=np.float32)
+        labels = []
+
+        def refill():
+            for path, label in items:
+                pending.append((path, label, pool.submit(load_image, path)))
+                if len(pending) >= lookahead:
+                    break
+
+        refill()
+        while pending:
+            path, label, future = pending.popleft()
+            if len(pending) < lookahead // 2:
+                refill()
+
+            img = future.result()
+            if img is None:
+                if skipped is not None:
+                    skipped.append(path)
+                print(f"Skipping (unreadable image): {path}")
+                continue
+
+            np.multiply(img, 1 / 255.0, out=batch[len(labels), :, :, 0], casting="unsafe")
+            labels.append(label)
+            if len(labels) == batch_size:
+                yield batch, labels
+                batch = np.empty_like(batch)
+                labels = []
+
+        if labels:
+            yield batch[:len(labels)], labels
+
+
+def evaluate(predict_fn, idx_to_label, test_dir=TEST_DIR, batch_size=BATCH_SIZE, workers=WORKERS):
+    """Score a batch predictor on test_dir.
+
+    predict_fn takes a float32 (N, IMG_SIZE, IMG_SIZE, 1) batch and returns
+    (N, num_classes) probabilities. Returns overall and per-class accuracy,
+    the confusion matrix (rows = true label) and throughput.
+    """
+    class_names = [idx_to_label[i] for i in range(len(idx_to_label))]
+    class_index = {name: i for i, name in enumerate(class_names)}
+    confusion = np.zeros((len(class_names), len(class_names)), dtype=np.int64)
+    skipped = []
+    unknown = collections.Counter()
+
+    items = list_test_images(test_dir)
+    start = time.perf_counter()
+    for batch, labels in stream_batches(items, batch_size, workers, skipped):
+        predicted = np.argmax(predict_fn(batch), axis=1)
+        for label, pred in zip(labels, predicted):
+            if label not in class_index:
+                unknown[label] += 1
+                continue
+            confusion[class_index[label], pred] += 1
+    elapsed = time.perf_counter() - start
+
+    for label, count in unknown.items():
+        print(f"Skipping {count} images of '{label}': not in the model's label map")
+
+    total = int(confusion.sum())
+    per_class = {}
+    for i, name in enumerate(class_names):
+        support = int(confusion[i].sum())
+        if support:
+            per_class[name] = {"accuracy": confusion[i, i] / support * 100, "images": support}
+
+    return {
+        "accuracy": np.trace(confusion) / total * 100 if total else 0.0,
+        "total": total,
+        "skipped": skipped,
+        "per_class": per_class,
+        "class_names": class_names,
+        "confusion": confusion,
+        "seconds": elapsed,
+        "images_per_sec": total / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def print_report(result, show_confusion=True):
+    print("\n--- Per-class accuracy ---")
+    for name, stats in result["per_class"].items():
+        print(f"{name:>8}: {stats['accuracy']:6.2f}% ({stats['images']} images)")
+
+    if show_confusion:
+        names = result["class_names"]
+        width = max(4, max(len(n) for n in names) + 1)
+        print("\n--- Confusion matrix (rows = true, columns = predicted) ---")
+        print(" " * width + "".join(f"{n:>{width}}" for n in names))
+        for name, row in zip(names, result["confusion"]):
+            print(f"{name:>{width}}" + "".join(f"{v:>{width}}" for v in row))
+
+    print(f"\nProcessed {result['total']} images in {result['seconds']:.2f}s "
+          f"({result['images_per_sec']:.1f} images/sec), skipped {len(result['skipped'])}")
+    print(f"Test Accuracy: {result['accuracy']:.2f}% on {result['total']} images.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched, streaming evaluation on dataset_test")
+    parser.add_argument("--model", default=MODEL_PATH)
+    parser.add_argument("--test-dir", default=TEST_DIR)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--json", help="Also write the results to this JSON file (for regression checks)")
+    parser.add_argument("--no-confusion", action="store_true", help="Don't print the confusion matrix")
+    args = parser.parse_args()
+
+    from tensorflow.keras.models import load_model
+
+    # Load model and label map
+    model = load_model(args.model)
+    label_map = np.load(LABEL_MAP_PATH, allow_pickle=True).item()
+    idx_to_label = {v: k for k, v in label_map.items()}
+
+    result = evaluate(model.predict_on_batch, idx_to_label, args.test_dir, args.batch_size, args.workers)
+    print_report(result, not args.no_confusion)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({**result, "model": args.model, "confusion": result["confusion"].tolist()}, f, indent=2)
+        print(f"✅ Results saved to: {args.json}")
+
 
-# Load model and label map
-model = load_model(MODEL_PATH)
-label_map = np.load(LABEL_MAP_PATH, allow_pickle=True).item()
-idx_to_label = {v: k for k, v in label_map.items()}
-
-correct = 0
-total = 0
-
-for label in os.listdir(TEST_DIR):
-    label_folder = os.path.join(TEST_DIR, label)
-    if not os.path.isdir(label_folder): continue
-    for file in os.listdir(label_folder):
-        img_path = os.path.join(label_folder, file)
-        try:
-            img = cv2.imread(img_path, cv2.IMREAD_GRAYSCALE)
-            img = cv2.resize(img, (IMG_SIZE, IMG_SIZE))
-            img = img / 255.0
-            img = img.reshape(1, IMG_SIZE, IMG_SIZE, 1)
-
-            prediction = model.predict(img)
-            predicted_label = idx_to_label[np.argmax(prediction)]
-
-            if predicted_label == label:
-                correct += 1
-            total += 1
-        except:
-            print(f"Skipping: {img_path}")
-
-accuracy = (correct / total) * 100 if total > 0 else 0
-print(f"Test Accuracy: {accuracy:.2f}% on {total} images.")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Train the landmark gesture classifier used by "recognition_mode": "landmarks".
+
+MediaPipe is run once over every image in dataset/<label>/ (in a process pool)
+to extract 21 hand landmarks, which are normalized into 63 floats (with the
+app's normalize_landmarks(), imported from landmark_classifier.py) and cached in
+cache/. A small MLP is trained on those vectors and exported as plain NumPy
+weights (model/landmark_model.npz), so the app can run it without TensorFlow.
+Images where MediaPipe finds no hand are skipped and counted per class.
+
+    python train_landmark_model.py [--epochs 60] [--workers 8] [--refresh]
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import numpy as np
+
+from dataset_cache import CACHE_DIR, DATASET_DIR, cache_key, list_dataset
+
+# The feature code is shared with the app, so training and inference can't drift apart
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "2.exe logic formation"))
+from landmark_classifier import FEATURE_VERSION, NUM_FEATURES, normalize_landmarks  # noqa: E402
+
+MODEL_PATH = 'model/landmark_model.npz'
+WORKERS = os.cpu_count() or 1
+
+_hands = None
+
+
+def _init_worker():
+    global _hands
+    import mediapipe as mp
+    _hands = mp.solutions.hands.Hands(static_image_mode=True, max_num_hands=1,
+                                      min_detection_confidence=0.5)
+
+
+def extract_features(path):
+    """Worker: 63 normalized landmark features for one image, or None if no hand is found"""
+    img = cv2.imread(path)
+    if img is None:
+        return None
+    result = _hands.process(cv2.cvtColor(img, cv2.COLOR_BGR2RGB))
+    if not result.multi_hand_landmarks:
+        return None
+    hand = result.multi_hand_landmarks[0]
+    h, w = img.shape[:2]
+    return normalize_landmarks([(lm.x, lm.y, lm.z) for lm in hand.landmark], (w, h))
+
+
+def load_features(dataset_dir, workers, refresh=False):
+    """Return (class names, features, labels), reusing the cache when the dataset is unchanged"""
+    class_names, files = list_dataset(dataset_dir)
+    key = cache_key(files, img_size=f"landmarks-v{FEATURE_VERSION}")    # New features -> new cache
+    cache_path = os.path.join(CACHE_DIR, f"landmarks_{key}.npz")
+    if os.path.exists(cache_path) and not refresh:
+        print(f"♻️ Reusing landmark cache: {cache_path}")
+        data = np.load(cache_path)
+        return class_names, data["features"], data["labels"]
+
+    print(f"🖐️ Extracting landmarks from {len(files)} images with {workers} workers...")
+    start = time.perf_counter()
+    features, labels = [], []
+    missed = np.zeros(len(class_names), dtype=int)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        results = pool.map(extract_features, [path for path, _ in files], chunksize=64)
+        for (path, label), vector in zip(files, results):
+            if vector is None:
+                missed[label] += 1
+            else:
+                features.append(vector)
+                labels.append(label)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {len(features)} hands found in {elapsed:.1f}s ({len(files) / elapsed:.0f} images/sec)")
+    for name, count in zip(class_names, missed):
+        if count:
+            print(f"   ⚠️ {name}: no hand in {count} images")
+
+    features = np.array(features, dtype=np.float32).reshape(-1, NUM_FEATURES)
+    labels = np.array(labels, dtype=np.int64)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    np.savez(cache_path, features=features, labels=labels)
+    return class_names, features, labels
+
+
+def build_model(num_classes):
+    from tensorflow.keras.layers import Dense, Dropout
+    from tensorflow.keras.models import Sequential
+
+    model = Sequential([
+        Dense(128, activation='relu', input_shape=(NUM_FEATURES,)),
+        Dropout(0.2),
+        Dense(64, activation='relu'),
+        Dense(num_classes, activation='softmax')
+    ])
+    model.compile(optimizer='adam', loss='sparse_categorical_crossentropy', metrics=['accuracy'])
+    return model
+
+
+def export_weights(model, labels, path):
+    """Save the Dense layers' kernels and biases for the app's NumPy forward pass"""
+    dense = [layer for layer in model.layers if layer.get_weights()]
+    arrays = {}
+    for i, layer in enumerate(dense):
+        arrays[f"w{i}"], arrays[f"b{i}"] = layer.get_weights()
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.savez(path, layer_count=len(dense), labels=np.array(labels), feature_version=FEATURE_VERSION, **arrays)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the landmark-based gesture classifier")
+    parser.add_argument("--dataset", default=DATASET_DIR)
+    parser.add_argument("--epochs", type=int, default=60)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--val-split", type=float, default=0.2)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--refresh", action="store_true", help="Re-extract landmarks even if cached")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    class_names, features, labels = load_features(args.dataset, args.workers, args.refresh)
+    used = sorted(set(labels.tolist()))
+    missing = [name for i, name in enumerate(class_names) if i not in used]
+    if missing:
+        print(f"⚠️ No hands at all for: {', '.join(missing)} (left out of the model)")
+    # Re-index so the exported model only has classes that produced landmarks
+    remap = {old: new for new, old in enumerate(used)}
+    labels = np.array([remap[label] for label in labels], dtype=np.int64)
+    names = [class_names[i] for i in used]
+
+    order = np.random.default_rng(args.seed).permutation(len(labels))
+    val_count = int(len(labels) * args.val_split)
+    val_idx, train_idx = order[:val_count], order[val_count:]
+
+    model = build_model(len(names))
+    model.fit(features[train_idx], labels[train_idx], epochs=args.epochs, batch_size=args.batch_size,
+              validation_data=(features[val_idx], labels[val_idx]), verbose=2)
+
+    export_weights(model, names, MODEL_PATH)
+    print(f"✅ Landmark model saved to: {MODEL_PATH} ({len(names)} classes)")
+    print("   Copy it into '2.exe logic formation/model/' and set \"recognition_mode\": \"landmarks\"")
+
+
+if __name__ == "__main__":
+    main()
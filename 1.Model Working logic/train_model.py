@@ -0,0 +1,165 @@
+"""Script version of train_model.ipynb built on a tf.data input pipeline.
+
+Files are listed in parallel over dataset/<label>/, then decoded and resized
+with num_parallel_calls, cached (in memory or to a file for datasets larger
+than RAM), shuffled and prefetched, so the CPU prepares the next batches while
+the model trains. Epoch time and images/sec are printed after every epoch.
+
+    python train_model.py [--epochs 10] [--batch-size 32] [--cache-file cache/train.tfcache]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cv2
+import numpy as np
+import tensorflow as tf
+from tensorflow.keras.layers import Conv2D, Dense, Flatten, MaxPooling2D
+from tensorflow.keras.models import Sequential
+from tensorflow.keras.optimizers import Adam
+
+DATASET_DIR = 'dataset'
+MODEL_PATH = 'model/sign_model.h5'
+LABEL_MAP_PATH = 'model/label_map.npy'
+IMG_SIZE = 64
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+AUTOTUNE = tf.data.AUTOTUNE
+
+
+def list_files(dataset_dir=DATASET_DIR):
+    """List every image under dataset/<label>/, one thread per label folder"""
+    class_names = sorted(name for name in os.listdir(dataset_dir)
+                         if os.path.isdir(os.path.join(dataset_dir, name)))
+
+    def scan(label):
+        folder = os.path.join(dataset_dir, label)
+        return sorted(os.path.join(folder, f) for f in os.listdir(folder)
+                      if f.lower().endswith(IMAGE_EXTENSIONS))
+
+    with ThreadPoolExecutor(max_workers=min(32, len(class_names) or 1)) as pool:
+        per_class = list(pool.map(scan, class_names))
+
+    paths, labels = [], []
+    for idx, files in enumerate(per_class):
+        paths += files
+        labels += [idx] * len(files)
+    return class_names, np.array(paths), np.array(labels, dtype=np.int32)
+
+
+def load_image(path):
+    """Decode + resize with OpenCV, exactly like the notebook, test_model.py and the app.
+
+    TF's own decode/grayscale/resize gives slightly different pixels, so a
+    model trained on them would not see what it is served. Returns (uint8
+    image, readable flag); cv2 releases the GIL, so the parallel map still
+    runs the decodes concurrently.
+    """
+    img = cv2.imread(path.decode(), cv2.IMREAD_GRAYSCALE)
+    if img is None:
+        return np.zeros((IMG_SIZE, IMG_SIZE), dtype=np.uint8), False
+    return cv2.resize(img, (IMG_SIZE, IMG_SIZE)), True
+
+
+def decode_image(path, label, num_classes):
+    """Read, decode, grayscale and resize one image; scale to [0, 1] float32"""
+    img, ok = tf.numpy_function(load_image, [path], (tf.uint8, tf.bool))
+    img = tf.cast(tf.expand_dims(img, -1), tf.float32) / 255.0
+    img.set_shape((IMG_SIZE, IMG_SIZE, 1))
+    ok.set_shape(())
+    return img, tf.one_hot(label, num_classes), ok
+
+
+def make_dataset(paths, labels, num_classes, batch_size, training, cache_file=None, seed=None):
+    ds = tf.data.Dataset.from_tensor_slices((paths, labels))
+    if training:
+        # Shuffle file names up front so the decode cache isn't class-ordered
+        ds = ds.shuffle(len(paths), seed=seed, reshuffle_each_iteration=False)
+    ds = ds.map(lambda p, l: decode_image(p, l, num_classes), num_parallel_calls=AUTOTUNE,
+                deterministic=not training)
+    # Unreadable files are skipped, as in the notebook
+    ds = ds.filter(lambda img, label, ok: ok).map(lambda img, label, ok: (img, label))
+    ds = ds.cache(cache_file) if cache_file else ds.cache()
+    if training:
+        ds = ds.shuffle(min(len(paths), 10000), seed=seed, reshuffle_each_iteration=True)
+    return ds.batch(batch_size).prefetch(AUTOTUNE)
+
+
+def build_model(num_classes):
+    """Same architecture as train_model.ipynb"""
+    model = Sequential([
+        Conv2D(32, (3, 3), activation='relu', input_shape=(IMG_SIZE, IMG_SIZE, 1)),
+        MaxPooling2D(2, 2),
+        Conv2D(64, (3, 3), activation='relu'),
+        MaxPooling2D(2, 2),
+        Flatten(),
+        Dense(128, activation='relu'),
+        Dense(num_classes, activation='softmax')
+    ])
+    model.compile(optimizer=Adam(), loss='categorical_crossentropy', metrics=['accuracy'])
+    return model
+
+
+class EpochTimer(tf.keras.callbacks.Callback):
+    """Print wall-clock time and training throughput for every epoch"""
+
+    def __init__(self, train_images):
+        super().__init__()
+        self.train_images = train_images
+        self.times = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self.start = time.perf_counter()
+
+    def on_epoch_end(self, epoch, logs=None):
+        elapsed = time.perf_counter() - self.start
+        self.times.append(elapsed)
+        print(f"⏱️ Epoch {epoch + 1}: {elapsed:.1f}s ({self.train_images / elapsed:.0f} images/sec)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the sign model with a tf.data pipeline")
+    parser.add_argument("--dataset", default=DATASET_DIR)
+    parser.add_argument("--epochs", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--val-split", type=float, default=0.2)
+    parser.add_argument("--cache-file", default=None,
+                        help="Cache decoded images to this file instead of RAM (for large datasets)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    class_names, paths, labels = list_files(args.dataset)
+    label_map = {name: idx for idx, name in enumerate(class_names)}
+    print(f"📂 Found {len(paths)} images in {len(class_names)} classes ({time.perf_counter() - start:.2f}s)")
+
+    order = np.random.default_rng(args.seed).permutation(len(paths))
+    val_count = int(len(paths) * args.val_split)
+    val_idx, train_idx = order[:val_count], order[val_count:]
+
+    train_cache = f"{args.cache_file}.train" if args.cache_file else None
+    val_cache = f"{args.cache_file}.val" if args.cache_file else None
+    if args.cache_file:
+        os.makedirs(os.path.dirname(args.cache_file) or ".", exist_ok=True)
+    train_ds = make_dataset(paths[train_idx], labels[train_idx], len(class_names), args.batch_size,
+                            training=True, cache_file=train_cache, seed=args.seed)
+    val_ds = make_dataset(paths[val_idx], labels[val_idx], len(class_names), args.batch_size,
+                          training=False, cache_file=val_cache)
+
+    model = build_model(len(class_names))
+    timer = EpochTimer(len(train_idx))
+    model.fit(train_ds, validation_data=val_ds, epochs=args.epochs, callbacks=[timer])
+
+    print(f"\n⏱️ Mean epoch time: {np.mean(timer.times):.1f}s "
+          f"(first epoch {timer.times[0]:.1f}s includes decoding; later epochs read the cache)")
+
+    # Save model & label map
+    os.makedirs(os.path.dirname(MODEL_PATH), exist_ok=True)
+    model.save(MODEL_PATH)
+    np.save(LABEL_MAP_PATH, label_map)
+    print(f"✅ Model saved to: {MODEL_PATH}")
+    print(f"✅ Label map saved to: {LABEL_MAP_PATH}")
+
+
+if __name__ == "__main__":
+    main()
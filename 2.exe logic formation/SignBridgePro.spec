@@ -10,6 +10,7 @@ a = Analysis(
     datas=[
         ('model', 'model'),
         ('assets', 'assets'),
+        (r'..\3.Website Code\styles.css', 'assets'),  # ✅ Caption overlay stylesheet
         ('settings.json', '.'),
         ('caption_output.txt', '.'),
         ('README.txt', '.'),
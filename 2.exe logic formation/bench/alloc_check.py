@@ -0,0 +1,96 @@
+"""Allocation check for ROI preprocessing: preprocess_roi() vs. Preprocessor.
+
+Feeds hand crops of varying size (cut from 720p frames, like the app) through
+both, with tracemalloc tracing every call after a warm-up. It reports the
+bytes allocated per frame, counted as the traced peak above the level before
+the call, which also catches memory that is freed again. It also reports the
+net growth over the run and the time per frame. NumPy and OpenCV's Python
+bindings report array buffers to tracemalloc, so a new gray image, resize
+output or float32 batch shows up here.
+
+Exits with status 1 if Preprocessor allocates more than MAX_BYTES_PER_FRAME
+in steady state. The only allowance is the small view objects NumPy creates,
+not array data. The run also checks that both produce identical tensors.
+
+Usage:
+    python bench/alloc_check.py [--frames 2000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from detection import IMG_SIZE, Preprocessor, preprocess_roi  # noqa: E402
+
+MAX_BYTES_PER_FRAME = 1024  # A few array headers/views, far below one 64x64 float32 buffer (16 KB)
+WARMUP = 50
+
+
+def crops(count, seed):
+    """Hand-sized views into 720p frames, like frame[y_min:y_max, x_min:x_max]"""
+    rng = np.random.default_rng(seed)
+    frames = [rng.integers(0, 256, (720, 1280, 3), dtype=np.uint8) for _ in range(4)]
+    boxes = []
+    for _ in range(count):
+        side = int(rng.integers(120, 420))
+        x, y = int(rng.integers(0, 1280 - side)), int(rng.integers(0, 720 - side))
+        boxes.append((x, y, side))
+    return [frames[i % len(frames)][y:y + side, x:x + side] for i, (x, y, side) in enumerate(boxes)]
+
+
+def trace(preprocess, rois):
+    """Return (bytes allocated per frame, net growth in bytes, us per frame)"""
+    for roi in rois[:WARMUP]:
+        preprocess(roi)
+    per_frame = np.zeros(len(rois), dtype=np.int64)  # Preallocated so the bookkeeping isn't counted
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    for i, roi in enumerate(rois):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        preprocess(roi)
+        per_frame[i] = tracemalloc.get_traced_memory()[1] - before
+    growth = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for roi in rois:
+        preprocess(roi)
+    us = (time.perf_counter() - start) / len(rois) * 1e6
+    return per_frame, growth, us
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that ROI preprocessing doesn't allocate per frame")
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rois = crops(args.frames, args.seed)
+
+    preprocessor = Preprocessor()
+    # The gray buffer grows to the largest crop once; in the app that happens in the first seconds
+    preprocessor(max(rois, key=lambda roi: roi.size))
+
+    mismatches = sum(not np.array_equal(preprocess_roi(roi), preprocessor(roi)) for roi in rois[:200])
+
+    results = {"preprocess_roi": trace(preprocess_roi, rois), "Preprocessor": trace(preprocessor, rois)}
+    print(f"🧮 {args.frames} crops, {IMG_SIZE}x{IMG_SIZE} float32 input\n")
+    print(f"{'':<16}{'median B/frame':>16}{'max B/frame':>13}{'net growth B':>14}{'us/frame':>10}")
+    for name, (per_frame, growth, us) in results.items():
+        print(f"{name:<16}{np.median(per_frame):>16.0f}{per_frame.max():>13}{growth:>14}{us:>10.1f}")
+
+    per_frame, growth, _ = results["Preprocessor"]
+    ok = per_frame.max() <= MAX_BYTES_PER_FRAME and growth <= MAX_BYTES_PER_FRAME and not mismatches
+    print(f"\nidentical output: {not mismatches}")
+    print("✅ No per-frame array allocations" if ok else
+          f"❌ Preprocessor allocated up to {per_frame.max()} B in a frame (limit {MAX_BYTES_PER_FRAME})")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+"""Loopback latency test for the caption server.
+
+Starts a CaptionServer on a free localhost port and connects --ws WebSocket and
+--sse Server-Sent Events clients (plain sockets, one thread each). It then
+publishes --events captions at --rate per second from a "detection" thread and
+measures, for each delivered message, the time from publish() to the client
+parsing it. It also reports how long publish() blocked the caller.
+
+Two robustness checks follow: a WebSocket frame that declares a huge payload
+must be answered with close code 1009 (nothing is buffered), and clients that
+hang up must leave the fan-out within a second, not at the next keepalive.
+
+For comparison: an OBS text source polling caption_output.txt adds up to its
+poll interval (about 1 s) on top of the caption writer's 250 ms debounce.
+
+Usage:
+    python bench/caption_server.py [--ws 8] [--sse 8] [--events 500] [--rate 50]
+"""
+import argparse
+import base64
+import json
+import os
+import socket
+import statistics
+import struct
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from caption_server import CaptionServer  # noqa: E402
+
+
+def recv_exact(sock, n):
+    data = b""
+    while len(data) < n:
+        chunk = sock.recv(n - len(data))
+        if not chunk:
+            raise ConnectionError("closed")
+        data += chunk
+    return data
+
+
+def read_head(sock):
+    head = b""
+    while not head.endswith(b"\r\n\r\n"):
+        head += recv_exact(sock, 1)
+    return head.decode("latin-1")
+
+
+def ws_connect(port):
+    sock = socket.create_connection(("127.0.0.1", port))
+    key = base64.b64encode(os.urandom(16)).decode("ascii")
+    sock.sendall((f"GET /ws HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\nUpgrade: websocket\r\n"
+                  f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+    assert read_head(sock).startswith("HTTP/1.1 101"), "WebSocket handshake failed"
+    return sock
+
+
+def ws_client(port, latencies, expected):
+    sock = ws_connect(port)
+    while len(latencies) < expected:
+        first, second = recv_exact(sock, 2)
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", recv_exact(sock, 2))[0]
+        payload = recv_exact(sock, length)
+        if first & 0x0F == 0x1:
+            message = json.loads(payload)
+            latencies.append(time.time() - message["ts"])
+    sock.close()
+
+
+def sse_client(port, latencies, expected):
+    sock = socket.create_connection(("127.0.0.1", port))
+    sock.sendall(f"GET /events HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\n\r\n".encode())
+    assert read_head(sock).startswith("HTTP/1.1 200"), "SSE request failed"
+    buffer = b""
+    while len(latencies) < expected:
+        buffer += sock.recv(65536)
+        while b"\n\n" in buffer:
+            event, buffer = buffer.split(b"\n\n", 1)
+            if event.startswith(b"data: "):
+                message = json.loads(event[6:])
+                latencies.append(time.time() - message["ts"])
+    sock.close()
+
+
+def oversized_frame_closed(port):
+    """Declare a 1 TB masked text frame; the server must close with 1009 without reading it"""
+    sock = ws_connect(port)
+    sock.settimeout(2)
+    sock.sendall(struct.pack("!BBQ", 0x81, 0x80 | 127, 1 << 40) + os.urandom(4))
+    try:
+        while True:
+            first, second = recv_exact(sock, 2)
+            payload = recv_exact(sock, second & 0x7F)
+            if first & 0x0F == 0x8:
+                return struct.unpack("!H", payload[:2])[0] == 1009
+    except (ConnectionError, socket.timeout):
+        return False
+    finally:
+        sock.close()
+
+
+def disconnect_seconds(server, port, count=8):
+    """Seconds until `count` clients that hung up are gone from the server's fan-out"""
+    base = server.client_count()
+    socks = [ws_connect(port) for _ in range(count // 2)]
+    for _ in range(count - len(socks)):
+        sock = socket.create_connection(("127.0.0.1", port))
+        sock.sendall(f"GET /events HTTP/1.1\r\nHost: 127.0.0.1:{port}\r\n\r\n".encode())
+        read_head(sock)
+        socks.append(sock)
+    deadline = time.time() + 5
+    while server.client_count() < base + count and time.time() < deadline:
+        time.sleep(0.01)
+    for sock in socks:
+        sock.close()
+    start = time.perf_counter()
+    while server.client_count() > base and time.perf_counter() - start < 20:
+        time.sleep(0.01)
+    return time.perf_counter() - start
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure caption push latency over loopback")
+    parser.add_argument("--ws", type=int, default=8)
+    parser.add_argument("--sse", type=int, default=8)
+    parser.add_argument("--events", type=int, default=500)
+    parser.add_argument("--rate", type=float, default=50.0, help="Captions per second")
+    args = parser.parse_args()
+
+    server = CaptionServer(port=0)
+    if not server.start():
+        return 1
+
+    results = {"ws": [[] for _ in range(args.ws)], "sse": [[] for _ in range(args.sse)]}
+    clients = [threading.Thread(target=ws_client, args=(server.port, lat, args.events), daemon=True)
+               for lat in results["ws"]]
+    clients += [threading.Thread(target=sse_client, args=(server.port, lat, args.events), daemon=True)
+                for lat in results["sse"]]
+    for client in clients:
+        client.start()
+    deadline = time.time() + 5
+    while server.client_count() < len(clients) and time.time() < deadline:
+        time.sleep(0.01)
+
+    publish_costs = []
+    for i in range(args.events):
+        start = time.perf_counter()
+        server.publish("segment", f"HELLO WORLD {i}")
+        publish_costs.append(time.perf_counter() - start)
+        time.sleep(1 / args.rate)
+    for client in clients:
+        client.join(timeout=5)
+    print(f"🌐 {args.events} captions at {args.rate:.0f}/s to {args.ws} WebSocket + {args.sse} SSE clients\n")
+    oversized_ok = oversized_frame_closed(server.port)
+    gone_after = disconnect_seconds(server, server.port)
+    server.stop()
+
+    print(f"{'':<6}{'received':>10}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}")
+    ok = True
+    for name, per_client in results.items():
+        if not per_client:
+            continue
+        latencies = [x for lat in per_client for x in lat]
+        ok &= all(len(lat) >= args.events for lat in per_client)
+        print(f"{name:<6}{len(latencies):>10}{percentile(latencies, 0.5) * 1e3:>9.2f}"
+              f"{percentile(latencies, 0.99) * 1e3:>9.2f}{max(latencies) * 1e3:>9.2f}")
+    print(f"\npublish() cost: median {statistics.median(publish_costs) * 1e6:.1f} us, "
+          f"max {max(publish_costs) * 1e6:.1f} us; dropped {server.dropped}")
+    print("✅ every client got every caption" if ok else "❌ some captions were not delivered")
+    print(f"{'✅' if oversized_ok else '❌'} oversized WebSocket frame closed with 1009: {oversized_ok}")
+    print(f"{'✅' if gone_after < 1 else '❌'} disconnected clients dropped after {gone_after * 1000:.0f} ms")
+    ok &= oversized_ok and gone_after < 1
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
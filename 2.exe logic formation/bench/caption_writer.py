@@ -0,0 +1,84 @@
+"""Caption file write cost over a long session: old full rewrite vs. CaptionWriter.
+
+Simulates --captions caption updates (a multi-hour session at a caption every
+couple of seconds) and reports the cost of a caption update early and late in
+the session for:
+
+    legacy   rewrite the whole session text into caption_output.txt each time
+    writer   CaptionWriter: bounded tail file + append-only transcript
+
+It also checks that the output file always holds the expected tail and the
+transcript holds every caption.
+
+Usage:
+    python bench/caption_writer.py [--captions 5000]
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from caption_writer import CaptionWriter  # noqa: E402
+
+WORDS = ["HELLO", "HOW", "ARE", "YOU", "THANK", "YOU.", "GOOD", "MORNING", "TEAM,", "SEE", "YOU", "SOON."]
+
+
+def legacy_write(path, session_text):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(session_text)
+
+
+def summarize(name, costs):
+    window = max(1, len(costs) // 10)
+    first, last = statistics.mean(costs[:window]), statistics.mean(costs[-window:])
+    print(f"{name:<8}{first * 1e6:>12.1f}{last * 1e6:>12.1f}{last / first:>9.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark caption file writes over a long session")
+    parser.add_argument("--captions", type=int, default=5000)
+    parser.add_argument("--tail-chars", type=int, default=300)
+    args = parser.parse_args()
+    captions = [" ".join(WORDS[(i + j) % len(WORDS)] for j in range(3)) for i in range(args.captions)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, "caption_output.txt")
+        transcript = os.path.join(tmp, "caption_transcript.txt")
+
+        legacy_costs, session = [], ""
+        for caption in captions:
+            start = time.perf_counter()
+            session = f"{session} {caption}" if session else caption
+            legacy_write(output, session)
+            legacy_costs.append(time.perf_counter() - start)
+
+        # debounce=0 so every caption is written, i.e. the worst case
+        writer = CaptionWriter(output, transcript, args.tail_chars, debounce=0).start()
+        writer_costs = []
+        for caption in captions:
+            start = time.perf_counter()
+            writer.append(caption)
+            writer.flush()
+            writer_costs.append(time.perf_counter() - start)
+        writer.close()
+
+        with open(output, encoding="utf-8") as f:
+            tail = f.read()
+        with open(transcript, encoding="utf-8") as f:
+            full = f.read()
+
+    print(f"📝 {args.captions} captions, session text {len(session) / 1024:.0f} KB\n")
+    print(f"{'':<8}{'first us':>12}{'last us':>12}{'growth':>10}")
+    summarize("legacy", legacy_costs)
+    summarize("writer", writer_costs)
+    print(f"\n✅ transcript complete: {full == session}; "
+          f"tail is the session's end ({len(tail)} chars): {session.endswith(tail) and len(tail) <= args.tail_chars}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""Compare two bench/run_bench.py result files and flag regressions.
+
+For every stage in both files, prints fps and p50/p99 latency of the baseline
+and the candidate with the relative change. A stage regresses when its p50 or
+p99 latency grows, or its fps drops, by more than --threshold (default 10%).
+Peak RSS is compared the same way. Changes smaller than --min-ms are treated
+as noise, so sub-millisecond stages don't flap; for fps that is the change in
+time per frame (1000 / fps ms). p99 rests on the slowest ~1% of frames (3 of
+300), so it gets the looser --tail-threshold (default 25%).
+
+Either side may also be a folder of result files from several runs; each
+statistic then takes its best value over the runs. On a shared or
+single-core machine one process can run 15-20% slower than the next, so
+compare folders of 3+ runs there.
+
+Exits with status 1 if anything regressed, so it can gate a release build:
+
+    python bench/run_bench.py -o candidate.json
+    python bench/compare.py baseline.json candidate.json
+
+    for i in 1 2 3; do python bench/run_bench.py -o candidate/$i.json; done
+    python bench/compare.py baseline/ candidate/
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+
+LATENCY_KEYS = ("p50_ms", "p99_ms")
+TAIL_KEYS = ("p99_ms",)     # A handful of samples per run, so held to --tail-threshold
+
+
+def load(path):
+    """One result file, or the best of every result file in a folder"""
+    if not os.path.isdir(path):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    runs = [load(file) for file in sorted(glob.glob(os.path.join(path, "*.json")))]
+    if not runs:
+        sys.exit(f"❌ No result files in {path}")
+    merged = dict(runs[0], stages={})
+    merged["created"] = f"{runs[0].get('created', '?')} (best of {len(runs)})"
+    for stage in {name for run in runs for name in run["stages"]}:
+        measured = [run["stages"][stage] for run in runs if "fps" in run["stages"].get(stage, {})]
+        if not measured:
+            merged["stages"][stage] = next(run["stages"][stage] for run in runs if stage in run["stages"])
+            continue
+        best = dict(measured[0])
+        best["fps"] = max(m["fps"] for m in measured)
+        for key in LATENCY_KEYS:
+            best[key] = min(m[key] for m in measured)
+        merged["stages"][stage] = best
+    peaks = [run.get("rss_mb", {}).get("peak") for run in runs]
+    if all(peaks):
+        merged["rss_mb"] = dict(runs[0].get("rss_mb", {}), peak=min(peaks))
+    return merged
+
+
+def change(old, new):
+    return (new - old) / old if old else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed relative slowdown (0.10 = 10%%)")
+    parser.add_argument("--tail-threshold", type=float, default=0.25, help="Allowed relative p99 slowdown")
+    parser.add_argument("--min-ms", type=float, default=0.05, help="Ignore latency changes smaller than this")
+    args = parser.parse_args()
+
+    baseline, candidate = load(args.baseline), load(args.candidate)
+    for name, data in (("baseline", baseline), ("candidate", candidate)):
+        config = data.get("config", {})
+        print(f"{name:<10} {data.get('created', '?')}  {config.get('source', '?')} x{config.get('frames', '?')}  "
+              f"{config.get('recognition_mode', '?')}/{config.get('inference_backend')}  "
+              f"{data.get('machine', {}).get('platform', '?')}")
+    if baseline.get("config", {}).get("frames") != candidate.get("config", {}).get("frames"):
+        print("⚠️ Different frame counts - percentiles may not be comparable")
+    print()
+
+    regressions = []
+    print(f"{'stage':<16}{'fps':>28}{'p50 ms':>26}{'p99 ms':>26}")
+    for stage in sorted(set(baseline["stages"]) | set(candidate["stages"])):
+        old, new = baseline["stages"].get(stage, {}), candidate["stages"].get(stage, {})
+        if "fps" not in old or "fps" not in new:
+            reason = new.get("skipped") or old.get("skipped") or "missing in one file"
+            print(f"{stage:<16}  not compared ({reason})")
+            continue
+
+        cells = []
+        fps_change = change(old["fps"], new["fps"])
+        cells.append(f"{old['fps']:>10.1f} ->{new['fps']:>10.1f} {fps_change:+5.0%}")
+        frame_ms_delta = 1000 / new["fps"] - 1000 / old["fps"] if old["fps"] and new["fps"] else 0.0
+        if fps_change < -args.threshold and frame_ms_delta > args.min_ms:
+            regressions.append(f"{stage} fps {fps_change:+.0%}")
+        for key in LATENCY_KEYS:
+            delta = change(old[key], new[key])
+            cells.append(f"{old[key]:>9.4f} ->{new[key]:>9.4f} {delta:+5.0%}")
+            threshold = args.tail_threshold if key in TAIL_KEYS else args.threshold
+            if delta > threshold and new[key] - old[key] > args.min_ms:
+                regressions.append(f"{stage} {key} {delta:+.0%}")
+        print(f"{stage:<16}" + "".join(f"{cell:>{width}}" for cell, width in zip(cells, (28, 26, 26))))
+
+    old_rss = baseline.get("rss_mb", {}).get("peak")
+    new_rss = candidate.get("rss_mb", {}).get("peak")
+    if old_rss and new_rss:
+        delta = change(old_rss, new_rss)
+        print(f"\npeak RSS {old_rss:.1f} -> {new_rss:.1f} MB ({delta:+.0%})")
+        if delta > args.threshold:
+            regressions.append(f"peak RSS {delta:+.0%}")
+
+    if regressions:
+        print("\n❌ Regressions (> {:.0%}):\n  ".format(args.threshold) + "\n  ".join(regressions))
+        return 1
+    print("\n✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
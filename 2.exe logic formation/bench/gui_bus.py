@@ -0,0 +1,112 @@
+"""GUI update load: the old per-frame queue vs. GuiUpdateBus.
+
+Simulates a detection thread at --fps frames per second sending one prediction
+update per frame, a stats update per caption and a transcript append per
+caption, while the "main thread" drains at the UI rate. It reports how many
+callbacks the main loop had to run, and checks that every transcript event
+arrived in order and the labels ended on the newest value. A second check
+stalls the main thread through a burst that overflows the event bound, and
+verifies no transcript text is lost.
+
+No Tk needed: the callbacks only record what they were given.
+
+Usage:
+    python bench/gui_bus.py [--seconds 5] [--fps 60]
+"""
+import argparse
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gui_bus import GuiUpdateBus  # noqa: E402
+
+UI_INTERVAL = 0.033
+CAPTION_EVERY = 20          # Frames between captions
+
+
+def produce(send_state, send_event, frames, fps):
+    for i in range(frames):
+        send_state("prediction", i)
+        if i % CAPTION_EVERY == 0:
+            send_event(i)
+            send_state("stats", i)
+        time.sleep(1 / fps)
+
+
+def run(name, frames, fps):
+    calls = {"prediction": 0, "stats": 0, "event": 0}
+    last = {}
+    events = []
+
+    def record(key, value):
+        calls[key] += 1
+        last[key] = value
+
+    def on_event(value):
+        calls["event"] += 1
+        events.append(value)
+
+    if name == "legacy":
+        gui_queue = queue.Queue()
+        send_state = lambda key, value: gui_queue.put((record, (key, value)))  # noqa: E731
+        send_event = lambda value: gui_queue.put((on_event, (value,)))  # noqa: E731
+
+        def drain():
+            while True:
+                try:
+                    func, args = gui_queue.get_nowait()
+                except queue.Empty:
+                    return
+                func(*args)
+    else:
+        bus = GuiUpdateBus()
+        send_state = lambda key, value: bus.set(key, record, key, value)  # noqa: E731
+        send_event = lambda value: bus.post(on_event, value, droppable=False)  # noqa: E731
+        drain = bus.drain
+
+    producer = threading.Thread(target=produce, args=(send_state, send_event, frames, fps))
+    producer.start()
+    while producer.is_alive():
+        drain()
+        time.sleep(UI_INTERVAL)
+    drain()
+
+    expected_events = list(range(0, frames, CAPTION_EVERY))
+    ok = events == expected_events and last.get("prediction") == frames - 1
+    print(f"{name:<8}{calls['prediction']:>12}{calls['stats']:>8}{calls['event']:>8}   in order: {ok}")
+    return ok
+
+
+def stalled_burst(count):
+    """No drain while `count` transcript appends and as many droppable events arrive"""
+    bus = GuiUpdateBus(max_events=count // 4)
+    events = []
+    for i in range(count):
+        bus.post(events.append, i, droppable=False)
+        bus.post(lambda: None)
+    bus.drain()
+    ok = events == list(range(count))
+    print(f"\nstalled burst: {count} appends, {bus.dropped} droppable events shed, "
+          f"transcript complete: {ok}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark GUI update coalescing")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--fps", type=float, default=60.0)
+    args = parser.parse_args()
+    frames = int(args.seconds * args.fps)
+
+    print(f"🖥️  {frames} frames at {args.fps:.0f} fps, UI drained every {UI_INTERVAL * 1000:.0f} ms\n")
+    print(f"{'':<8}{'prediction':>12}{'stats':>8}{'events':>8}")
+    ok = run("legacy", frames, args.fps) and run("bus", frames, args.fps) and stalled_burst(2000)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
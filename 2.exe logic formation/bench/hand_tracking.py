@@ -0,0 +1,92 @@
+"""Landmark-stage benchmark: full-frame MediaPipe vs. HandTracker.
+
+Runs every frame of a video (or N camera frames) through both the old
+full-resolution path and hand_tracking.HandTracker, and reports per-frame wall
+time, process CPU time and how far the tracker's landmarks are from the
+full-frame ones (mean pixel distance), plus how often full detection ran.
+
+Usage:
+    python bench/hand_tracking.py --video clip.mp4
+    python bench/hand_tracking.py --camera 0 --frames 300
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from detection import create_hands, find_hand_landmarks  # noqa: E402
+from hand_tracking import HandTracker, create_hand_models  # noqa: E402
+
+
+def read_frames(args):
+    cap = cv2.VideoCapture(args.video if args.video else args.camera)
+    if not args.video:
+        cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
+        cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+    frames = []
+    while len(frames) < args.frames:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def run(locate, frames):
+    """Return (wall ms per frame list, CPU ms per frame, landmarks per frame)"""
+    wall, results = [], []
+    cpu_start = time.process_time()
+    for frame in frames:
+        start = time.perf_counter()
+        results.append(locate(frame))
+        wall.append((time.perf_counter() - start) * 1000)
+    cpu_ms = (time.process_time() - cpu_start) * 1000 / max(1, len(frames))
+    return wall, cpu_ms, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare full-frame MediaPipe with HandTracker")
+    parser.add_argument("--video", help="Video file to replay (default: camera)")
+    parser.add_argument("--camera", type=int, default=0)
+    parser.add_argument("--frames", type=int, default=600)
+    args = parser.parse_args()
+
+    frames = read_frames(args)
+    if not frames:
+        print("❌ No frames to benchmark")
+        return 1
+    h, w = frames[0].shape[:2]
+    print(f"🎬 {len(frames)} frames at {w}x{h}")
+
+    hands = create_hands()
+    base_wall, base_cpu, base_landmarks = run(lambda f: find_hand_landmarks(hands, f), frames)
+    hands.close()
+
+    tracker = HandTracker(create_hand_models())
+    track_wall, track_cpu, track_landmarks = run(tracker.locate, frames)
+    tracker.close()
+
+    errors = [float(np.mean(np.linalg.norm((a[:, :2] - b[:, :2]) * (w, h), axis=1)))
+              for a, b in zip(base_landmarks, track_landmarks) if a is not None and b is not None]
+    missed = sum(1 for a, b in zip(base_landmarks, track_landmarks) if a is not None and b is None)
+
+    print(f"\n{'':<12}{'median ms':>10}{'mean ms':>10}{'CPU ms':>10}")
+    for name, wall, cpu in (("full frame", base_wall, base_cpu), ("tracker", track_wall, track_cpu)):
+        print(f"{name:<12}{statistics.median(wall):>10.2f}{statistics.mean(wall):>10.2f}{cpu:>10.2f}")
+    print(f"\n⚡ CPU per frame: {track_cpu / base_cpu:.0%} of full-frame")
+    print(f"🖐️ {tracker.report()}")
+    if errors:
+        print(f"📏 Landmark offset vs. full frame: {statistics.mean(errors):.1f}px mean, "
+              f"{max(errors):.1f}px max; hand missed on {missed} frames")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
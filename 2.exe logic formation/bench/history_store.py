@@ -0,0 +1,146 @@
+"""Translation history at scale: batched inserts, paging and streaming export.
+
+Fills a throwaway HistoryStore with --rows captions spread over several
+sessions (a few days of heavy use), then reports:
+
+    add           time the caller spends in add() (the GUI thread's cost)
+    insert        rows per second written by the writer thread
+    page          time per History window page, at the newest rows, deep in
+                  the history (keyset cursor) and filtered by session / search
+    export        time and peak Python memory (tracemalloc) of the streaming
+                  JSON and TXT exports, next to the old approach (every row
+                  in a list of dicts, then json.dump)
+
+Exits with status 1 if an export's peak memory exceeds MAX_EXPORT_PEAK_MB, if
+a deep page is much slower than the first, or if the exported files don't
+hold every row.
+
+Usage:
+    python bench/history_store.py [--rows 200000]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from history_store import HistoryStore  # noqa: E402
+
+MAX_EXPORT_PEAK_MB = 2.0
+MAX_DEEP_PAGE_RATIO = 5.0   # Deep page vs first page
+WORDS = ("hello", "my", "name", "is", "sign", "bridge", "thank", "you", "good", "morning", "how", "are")
+
+
+def captions(count):
+    for i in range(count):
+        yield " ".join(WORDS[(i * 7 + k) % len(WORDS)] for k in range(3 + i % 6)) + f" {i}"
+
+
+def page_ms(store, repeats=20, **kwargs):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        store.page(**kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def traced(func, *args):
+    """(result, seconds, peak MB) of one call under tracemalloc"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def legacy_export(store, path):
+    """What export_history() used to do: the whole history as a list, then json.dump"""
+    history = [{"text": text, "timestamp": time.strftime("%H:%M:%S", time.localtime(ts)), "word_count": words}
+               for _, _, ts, text, words in store.iter_rows()]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"export_info": {"total_translations": len(history)}, "translations": history},
+                  f, indent=2, ensure_ascii=False)
+    return len(history)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite translation history")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--sessions", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        store = HistoryStore(os.path.join(folder, "history.db")).start()
+        print(f"📜 {args.rows:,} captions over {args.sessions} sessions (FTS5 search: {store.fts})\n")
+
+        # Captions arrive a few seconds apart, as in the app; add() is timed on the caller
+        per_session = max(1, args.rows // args.sessions)
+        base_ts = time.time() - args.rows * 3
+        add_seconds = 0.0
+        start = time.perf_counter()
+        for i, text in enumerate(captions(args.rows)):
+            if i % per_session == 0:
+                store.new_session()
+                session = store.session
+            t0 = time.perf_counter()
+            store.add(text, base_ts + i * 3)
+            add_seconds += time.perf_counter() - t0
+            if i % per_session == per_session - 1:
+                time.sleep(0.01)    # Session ids are milliseconds
+        store.flush(timeout=300)
+        elapsed = time.perf_counter() - start
+        print(f"add      {add_seconds / args.rows * 1e6:8.2f} us per caption on the caller")
+        print(f"insert   {store.inserted / elapsed:8.0f} rows/s in {store.batches} batches")
+
+        first = store.page()
+        cursor = None
+        for _ in range(args.rows // 2 // len(first)):     # Walk to the middle like the Older button does
+            rows = store.page(before=cursor)
+            cursor = (rows[-1][2], rows[-1][0])
+        pages = {
+            "newest": page_ms(store),
+            "middle": page_ms(store, before=cursor),
+            "session": page_ms(store, session=session),
+            "search": page_ms(store, query="thank you"),
+        }
+        print("page     " + "  ".join(f"{name} {ms:.2f} ms" for name, ms in pages.items()))
+        start = time.perf_counter()
+        total = store.count()
+        print(f"count    {(time.perf_counter() - start) * 1000:8.2f} ms ({total:,} rows)")
+
+        results = {}
+        for name, func, filename in (("json (streaming)", store.export_json, "export.json"),
+                                     ("txt (streaming)", store.export_text, "export.txt"),
+                                     ("json (list + dump)", lambda path: legacy_export(store, path), "legacy.json")):
+            path = os.path.join(folder, filename)
+            count, seconds, peak = traced(func, path)
+            results[name] = (count, seconds, peak, os.path.getsize(path) / 1e6)
+        print(f"\n{'export':<20}{'rows':>10}{'seconds':>10}{'peak MB':>10}{'file MB':>10}")
+        for name, (count, seconds, peak, size) in results.items():
+            print(f"{name:<20}{count:>10,}{seconds:>10.2f}{peak:>10.2f}{size:>10.1f}")
+
+        with open(os.path.join(folder, "export.json"), encoding="utf-8") as f:
+            exported = json.load(f)
+        store.close()
+
+    complete = (len(exported["translations"]) == args.rows == exported["export_info"]["total_translations"]
+                and results["txt (streaming)"][0] == args.rows)
+    peak = max(results["json (streaming)"][2], results["txt (streaming)"][2])
+    deep_ratio = pages["middle"] / pages["newest"] if pages["newest"] else 0
+    print(f"\nexport complete: {complete}, deep/first page: {deep_ratio:.1f}x")
+    ok = complete and peak <= MAX_EXPORT_PEAK_MB and deep_ratio <= MAX_DEEP_PAGE_RATIO
+    print("✅ Flat export memory and constant-time paging" if ok else
+          f"❌ Export peak {peak:.2f} MB (limit {MAX_EXPORT_PEAK_MB}), deep page {deep_ratio:.1f}x, complete={complete}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""Landmark stage cost and accuracy across detection resolutions.
+
+Runs hand detection on a fixture set at each --widths value (0 = native) and
+compares the result with native-resolution detection. For each width it reports:
+
+    ms          median time of full (palm) detection per frame
+    track ms    median HandTracker.locate() time (video fixtures only)
+    found       hands found, as a share of those found at native resolution
+    err px      mean landmark offset from the native landmarks, in native pixels
+    roi IoU     mean overlap of the hand ROI box with the native one
+    agree       classifier top-1 agreement with native (if the model loads)
+    acc         classifier accuracy against the fixture labels (labelled images only)
+
+The ROI is always cut from the native frame, as in the app, so only the
+landmarks come from the downscaled copy.
+
+The fixture should look like the camera the app will run on: a 1280x720 clip
+of someone signing at the usual distance. Record one from the webcam with
+--record (20 s at 1280x720 by default), then run the bench on it. A frame no
+wider than a width runs at native scale, so widths >= the fixture width are
+skipped; the ~200 px training images are too small to compare anything.
+A folder of labelled images (<label>/<image>, like the training set) also
+works, if the images are camera-sized.
+
+Usage:
+    python bench/landmark_resolution.py --record clip720.mp4 [--camera 0 --seconds 20]
+    python bench/landmark_resolution.py --video clip720.mp4 [--widths 320,480,640,0]
+    python bench/landmark_resolution.py --images photos/ --limit 20
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import cv2
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from detection import hand_roi_box, predict_roi  # noqa: E402
+from hand_tracking import DETECT_WIDTHS, HandTracker, create_hand_models  # noqa: E402
+from transcribe_video import load_engine, load_settings  # noqa: E402
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp")
+
+
+def load_images(root, limit):
+    """Return [(frame, label)] with up to `limit` images per label folder"""
+    fixtures = []
+    for folder, _, files in sorted(os.walk(root)):
+        images = sorted(f for f in files if f.lower().endswith(IMAGE_EXTENSIONS))[:limit]
+        for name in images:
+            frame = cv2.imread(os.path.join(folder, name))
+            if frame is not None:
+                fixtures.append((frame, os.path.basename(folder)))
+    return fixtures
+
+
+def load_video(path, count):
+    cap = cv2.VideoCapture(path)
+    fixtures = []
+    while len(fixtures) < count:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        fixtures.append((frame, None))
+    cap.release()
+    return fixtures
+
+
+def record(path, camera, seconds, size=(1280, 720), fps=30):
+    """Write `seconds` of webcam video at `size` to `path` as a fixture"""
+    cap = cv2.VideoCapture(camera)
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, size[0])
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, size[1])
+    ret, frame = cap.read()
+    if not ret:
+        cap.release()
+        print(f"❌ Camera {camera} gave no frames")
+        return 1
+    h, w = frame.shape[:2]
+    if (w, h) != size:
+        print(f"⚠️ Camera gives {w}x{h}, not {size[0]}x{size[1]}; recording that instead")
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"mp4v"), fps, (w, h))
+    print(f"🎥 Recording {seconds} s to {path}; sign as you would in the app")
+    frames = 0
+    deadline = time.monotonic() + seconds
+    while ret and time.monotonic() < deadline:
+        writer.write(frame)
+        frames += 1
+        ret, frame = cap.read()
+    writer.release()
+    cap.release()
+    print(f"✅ {frames} frames of {w}x{h}")
+    return 0
+
+
+def iou(a, b):
+    ix = max(0, min(a[2], b[2]) - max(a[0], b[0]))
+    iy = max(0, min(a[3], b[3]) - max(a[1], b[1]))
+    inter = ix * iy
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union else 0.0
+
+
+def detect_all(tracker, fixtures, track):
+    """Landmarks per fixture and ms per frame; without `track` every frame is a full detection"""
+    landmarks, timings = [], []
+    for frame, _ in fixtures:
+        if not track:
+            tracker.reset()
+        start = time.perf_counter()
+        landmarks.append(tracker.locate(frame))
+        timings.append((time.perf_counter() - start) * 1000)
+    return landmarks, timings
+
+
+def classify(engine, idx_to_label, frame, landmarks):
+    h, w = frame.shape[:2]
+    if hasattr(engine, "probabilities"):
+        probs = engine.probabilities(landmarks, (w, h))
+    else:
+        x_min, y_min, x_max, y_max = hand_roi_box(landmarks, w, h)
+        probs = predict_roi(engine, frame[y_min:y_max, x_min:x_max])
+    return idx_to_label[int(np.argmax(probs))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare hand detection across input resolutions")
+    parser.add_argument("--images", help="Folder of labelled images (<label>/<image>)")
+    parser.add_argument("--video", help="Video file")
+    parser.add_argument("--limit", type=int, default=20, help="Images per label folder")
+    parser.add_argument("--frames", type=int, default=300, help="Frames read from --video")
+    parser.add_argument("--widths", default=",".join(str(w) for w in DETECT_WIDTHS))
+    parser.add_argument("--record", help="Record a 1280x720 webcam fixture to this file and exit")
+    parser.add_argument("--camera", type=int, default=0)
+    parser.add_argument("--seconds", type=float, default=20)
+    args = parser.parse_args()
+
+    if args.record:
+        return record(args.record, args.camera, args.seconds)
+    if args.images:
+        fixtures = load_images(args.images, args.limit)
+    elif args.video:
+        fixtures = load_video(args.video, args.frames)
+    else:
+        parser.error("pass --images or --video")
+    if not fixtures:
+        print("❌ No fixtures found")
+        return 1
+    h, w = fixtures[0][0].shape[:2]
+    widths = [int(width) for width in args.widths.split(",")]
+    skipped = [width for width in widths if width >= w]
+    widths = [width for width in widths if width and width < w] + [0]     # Native is the reference
+    if skipped:
+        print(f"⚠️ Fixtures are {w} px wide; skipping widths {skipped} (they run at native scale)")
+    if len(widths) == 1:
+        print("❌ Nothing to compare; use a camera-sized fixture (see --record)")
+        return 1
+
+    engine = None
+    try:
+        engine, idx_to_label = load_engine(load_settings())
+    except Exception as e:
+        print(f"⚠️ Classifier not available ({e}); reporting landmarks only")
+
+    print(f"🖐️ {len(fixtures)} fixtures (first is {w}x{h})\n")
+    tracker = HandTracker(create_hand_models())
+    results = {}
+    for width in widths:
+        tracker.detect_width = width
+        landmarks, timings = detect_all(tracker, fixtures, track=False)
+        track_ms = None
+        if args.video:
+            tracker.reset()
+            _, track_timings = detect_all(tracker, fixtures, track=True)
+            track_ms = statistics.median(track_timings)
+        labels = [classify(engine, idx_to_label, frame, lm) if engine and lm is not None else None
+                  for (frame, _), lm in zip(fixtures, landmarks)]
+        results[width] = (landmarks, statistics.median(timings), track_ms, labels)
+    tracker.close()
+
+    reference, native_ms, _, reference_labels = results[0]
+    native_found = sum(lm is not None for lm in reference)
+    print(f"{'width':<8}{'ms':>8}{'track ms':>10}{'found':>8}{'err px':>8}{'roi IoU':>9}{'agree':>8}{'acc':>8}")
+    for width in widths:
+        landmarks, ms, track_ms, labels = results[width]
+        pairs = [(i, a, b) for i, (a, b) in enumerate(zip(reference, landmarks)) if a is not None and b is not None]
+        found = sum(lm is not None for lm in landmarks) / native_found if native_found else 0.0
+        sizes = [fixtures[i][0].shape[1::-1] for i, _, _ in pairs]   # (w, h) of each image
+        errors = [float(np.mean(np.linalg.norm((a[:, :2] - b[:, :2]) * size, axis=1)))
+                  for (_, a, b), size in zip(pairs, sizes)]
+        ious = [iou(hand_roi_box(a, *size), hand_roi_box(b, *size)) for (_, a, b), size in zip(pairs, sizes)]
+        agree = acc = "-"
+        if engine and pairs:
+            agree = f"{statistics.mean(labels[i] == reference_labels[i] for i, _, _ in pairs):.0%}"
+            labelled = [(labels[i], fixtures[i][1]) for i in range(len(fixtures)) if fixtures[i][1] is not None]
+            if labelled:
+                acc = f"{statistics.mean(p == truth for p, truth in labelled):.0%}"
+        name = str(width) if width else "native"
+        track = f"{track_ms:.2f}" if track_ms is not None else "-"
+        print(f"{name:<8}{ms:>8.2f}{track:>10}"
+              f"{found:>8.0%}{statistics.mean(errors) if errors else 0:>8.1f}"
+              f"{statistics.mean(ious) if ious else 0:>9.2f}{agree:>8}{acc:>8}")
+    print(f"\n⚡ Native full detection: {native_ms:.2f} ms per frame; "
+          f"set the fastest width that keeps 'found' and 'agree' near 100% as detection_width")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,372 @@
+"""Headless benchmark suite for the recognition pipeline.
+
+Replays a frame sequence through each stage on its own and then end to end,
+and writes the results to a JSON file that bench/compare.py can diff:
+
+    landmarks        HandTracker.locate() (MediaPipe)
+    roi_preprocess   crop + grayscale/resize/normalize of the hand ROI
+    inference        the classifier on one preprocessed ROI
+    stabilizer       PredictionStabilizer.update()
+    overlay          CaptionOverlay.draw() on a full frame
+    caption_output   CaptionWriter append + flush (debounce off, worst case)
+    end_to_end       locate -> classify -> overlay -> caption output per frame
+
+Each stage reports count, fps and p50/p95/p99 in milliseconds, exact (from
+every frame's timing, not histogram buckets, so microsecond stages such as the
+stabilizer still resolve). The stages run --repeats interleaved rounds and
+each number is the best over those rounds, so load from elsewhere on the
+machine doesn't show up as a regression. The file also
+records the process RSS, the machine and the configuration. A stage whose
+dependency is missing (no mediapipe, no model file) is recorded as skipped
+with the reason. Without mediapipe, end_to_end uses the synthetic hand boxes
+and landmarks instead of locate().
+
+Frames are synthetic by default: a seeded skin-coloured "hand" moving over a
+noisy background, at camera resolution. Use --video to replay a recording.
+No window is opened and no camera or GPU is needed.
+
+Usage:
+    python bench/run_bench.py [--frames 300] [--video clip.mp4] [-o results.json]
+    python bench/compare.py baseline.json results.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import cv2
+import numpy as np
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from caption_writer import CaptionWriter  # noqa: E402
+from detection import Preprocessor, hand_roi_box, preprocess_roi  # noqa: E402
+from metrics import METRICS  # noqa: E402
+from overlay import CaptionOverlay  # noqa: E402
+from recognizer import Hand, SignRecognizer  # noqa: E402
+from stabilizer import DEFAULT_MODE, PredictionStabilizer  # noqa: E402
+from transcribe_video import load_engine, load_settings  # noqa: E402
+
+SCHEMA = 1
+FRAME_POOL = 30             # Distinct synthetic frames, cycled (a 720p frame is 2.7 MB)
+CAPTIONS = ["HELLO", "HOW ARE YOU", "THANK YOU.", "SEE YOU SOON."]
+
+
+# === INPUT ===
+def synthetic_sequence(count, width, height, seed):
+    """Return (frames, hands): a moving skin-coloured blob and its box/landmarks per frame"""
+    rng = np.random.default_rng(seed)
+    background = rng.integers(40, 90, (height, width, 3), dtype=np.uint8)
+    frames, hands = [], []
+    radius = height // 6
+    for i in range(count):
+        phase = 2 * np.pi * i / max(count, 1)
+        cx = int(width / 2 + width / 4 * np.sin(phase))
+        cy = int(height / 2 + height / 6 * np.cos(2 * phase))
+        frame = background.copy()
+        cv2.ellipse(frame, (cx, cy), (radius, int(radius * 1.3)), 0, 0, 360, (120, 160, 210), -1)
+        frame += rng.integers(0, 16, frame.shape, dtype=np.uint8)  # Sensor noise
+        points = rng.normal(0, 0.4, (21, 3)).clip(-1, 1).astype(np.float32)
+        landmarks = np.empty_like(points)
+        landmarks[:, 0] = (cx + points[:, 0] * radius) / width
+        landmarks[:, 1] = (cy + points[:, 1] * radius * 1.3) / height
+        landmarks[:, 2] = points[:, 2] * 0.05
+        frames.append(frame)
+        hands.append(Hand(hand_roi_box(landmarks, width, height), landmarks, (width, height)))
+    return frames, hands
+
+
+def recorded_sequence(path, count):
+    cap = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < count:
+        ret, frame = cap.read()
+        if not ret:
+            break
+        frames.append(frame)
+    cap.release()
+    return frames
+
+
+def synthetic_probabilities(count, classes, seed, hold=20):
+    """Probability vectors for signs held `hold` frames with some flicker"""
+    rng = np.random.default_rng(seed)
+    probs = rng.dirichlet(np.ones(classes), count).astype(np.float32) * 0.2
+    signs = rng.integers(classes, size=count // hold + 1)
+    probs[np.arange(count), signs[np.arange(count) // hold]] += 0.8
+    return probs / probs.sum(axis=1, keepdims=True)
+
+
+# === MEASUREMENT ===
+def rss_mb():
+    """Current resident set size in MB, or None if it can't be read here"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / 2 ** 20
+    except ImportError:
+        return None
+
+
+def rounded(value):
+    return None if value is None else round(value, 1)
+
+
+def peak_rss_mb():
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+    except ImportError:
+        try:
+            import psutil
+            return psutil.Process().memory_info().peak_wset / 2 ** 20
+        except (ImportError, AttributeError):
+            return None
+
+
+class Stage:
+    """One benchmarked step: step(item) is timed for every item"""
+
+    def __init__(self, name, items, step, warmup=5, before=None, after=None):
+        self.name = name
+        self.items = items
+        self.step = step
+        self.warmup = warmup
+        self.before = before        # Called before each round (e.g. reset counters)
+        self.after = after          # Called after each round
+        self.runs = []
+
+    def run(self):
+        if self.before:
+            self.before()
+        timings = np.empty(len(self.items))
+        start = time.perf_counter()
+        for k, item in enumerate(self.items):
+            t0 = time.perf_counter()
+            self.step(item)
+            timings[k] = time.perf_counter() - t0
+        elapsed = time.perf_counter() - start
+        if self.after:
+            self.after()
+        ms = timings * 1e3
+        run = {"mean_ms": float(ms.mean()), "max_ms": float(ms.max()),
+               "fps": len(self.items) / elapsed if elapsed else 0.0}
+        for q in (50, 95, 99):
+            run[f"p{q}_ms"] = float(np.percentile(ms, q))
+        self.runs.append(run)
+
+    def summary(self):
+        """Each statistic at its best over the rounds"""
+        summary = {"count": len(self.items), "repeats": len(self.runs)}
+        for key in ("mean_ms", "max_ms", "p50_ms", "p95_ms", "p99_ms"):
+            summary[key] = round(min(run[key] for run in self.runs), 4)
+        summary["fps"] = round(max(run["fps"] for run in self.runs), 2)
+        return summary
+
+
+def measure(results, stages, rounds):
+    """Run every stage once per round, interleaved, and store the summaries in `results`.
+
+    Interleaving spreads each stage's rounds over the whole benchmark, so a
+    few seconds of load from elsewhere on the machine hit one round of several
+    stages instead of every round of one stage; keeping each statistic's best
+    round then filters it out.
+    """
+    for stage in stages:
+        for item in stage.items[:stage.warmup]:
+            stage.step(item)
+    for _ in range(rounds):
+        for stage in stages:
+            stage.run()
+    for stage in stages:
+        summary = results[stage.name] = stage.summary()
+        print(f"  {stage.name:<16}{summary['fps']:>10.1f} fps   "
+              f"p50 {summary['p50_ms']:8.4f} ms   p99 {summary['p99_ms']:8.4f} ms")
+
+
+def skip(results, name, reason):
+    results[name] = {"skipped": reason}
+    print(f"  {name:<16} skipped: {reason}")
+
+
+# === SUITE ===
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmark of every recognition stage")
+    parser.add_argument("--frames", type=int, default=300)
+    parser.add_argument("--video", help="Replay a recorded video instead of synthetic frames")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--backend", help="Inference backend (defaults to settings.json)")
+    parser.add_argument("--mode", choices=("image", "landmarks"), help="Recognition mode (defaults to settings.json)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=5, help="Rounds over all stages; each statistic keeps its best round")
+    parser.add_argument("-o", "--output", default=f"bench_{datetime.now():%Y%m%d_%H%M%S}.json")
+    args = parser.parse_args()
+
+    settings = load_settings()
+    if args.backend:
+        settings["inference_backend"] = args.backend
+    if args.mode:
+        settings["recognition_mode"] = args.mode
+    rss_start = rss_mb()
+
+    if args.video:
+        pool = recorded_sequence(args.video, args.frames)
+        if not pool:
+            print(f"❌ Could not read frames from {args.video}")
+            return 1
+        args.height, args.width = pool[0].shape[:2]
+    # Synthetic boxes/landmarks also stand in for MediaPipe when it isn't installed
+    synthetic, hands = synthetic_sequence(min(args.frames, FRAME_POOL), args.width, args.height, args.seed)
+    if not args.video:
+        pool = synthetic
+    indices = list(range(args.frames))
+    frame_at = lambda i: pool[i % len(pool)]  # noqa: E731
+    hand_at = lambda i: hands[i % len(hands)]  # noqa: E731
+    print(f"🏁 {args.frames} frames ({'video ' + args.video if args.video else 'synthetic'}, "
+          f"{pool[0].shape[1]}x{pool[0].shape[0]}), mode {settings['recognition_mode']}\n")
+
+    stages = {}
+    notes = []
+    plan = []
+    skipped = []
+
+    # Landmarks
+    tracker = None
+    try:
+        from hand_tracking import HandTracker, create_hand_models
+        tracker = HandTracker(create_hand_models())
+    except ImportError as e:
+        skipped.append(("landmarks", f"mediapipe not available ({e})"))
+    if tracker:
+        plan.append(Stage("landmarks", indices, lambda i: tracker.locate(frame_at(i)), before=tracker.reset))
+
+    def crop(i):
+        x_min, y_min, x_max, y_max = hand_at(i).box
+        return frame_at(i)[y_min:y_max, x_min:x_max]
+
+    preprocess = Preprocessor()
+    plan.append(Stage("roi_preprocess", indices, lambda i: preprocess(crop(i))))
+
+    # Classifier
+    engine = None
+    try:
+        engine, idx_to_label = load_engine(settings)
+    except Exception as e:
+        skipped.append(("inference", f"model not available ({e})"))
+    if engine:
+        if settings["recognition_mode"] == "landmarks" and hasattr(engine, "probabilities"):
+            plan.append(Stage("inference", indices,
+                              lambda i: engine.probabilities(hand_at(i).landmarks, hand_at(i).frame_size)))
+        else:
+            batches = [preprocess_roi(crop(i)) for i in range(len(pool))]
+            plan.append(Stage("inference", indices, lambda i: engine.predict(batches[i % len(batches)])))
+        classes = len(idx_to_label)
+    else:
+        classes = 29
+
+    probs = synthetic_probabilities(args.frames, classes, args.seed)
+    stabilizer = PredictionStabilizer(classes, mode=settings.get("stabilizer_mode", DEFAULT_MODE),
+                                      threshold=settings["confidence_threshold"])
+    plan.append(Stage("stabilizer", indices, lambda i: stabilizer.update(probs[i])))
+
+    overlay = CaptionOverlay()
+    work = pool[0].copy()
+
+    def draw(i):
+        np.copyto(work, frame_at(i))
+        overlay.draw(work, CAPTIONS[(i // 30) % len(CAPTIONS)], "A", 0.93, True, settings["confidence_threshold"])
+
+    plan.append(Stage("overlay", indices, draw))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = CaptionWriter(os.path.join(tmp, "caption_output.txt"),
+                               os.path.join(tmp, "caption_transcript.txt"), debounce=0).start()
+
+        def write_caption(i):
+            writer.append(CAPTIONS[i % len(CAPTIONS)])
+            writer.flush()
+
+        plan.append(Stage("caption_output", indices[:max(1, args.frames // 3)], write_caption, warmup=1))
+
+        # End to end, like the app's locate -> classify -> display stages in one thread
+        recognizer = None
+        breakdown = {}
+        if engine:
+            recognizer = SignRecognizer(engine, idx_to_label, settings, tracker=tracker)
+            if tracker is None:
+                notes.append("end_to_end: synthetic hand boxes (no mediapipe)")
+
+            def frame_to_screen(i):
+                frame = work
+                np.copyto(frame, frame_at(i))
+                hand = recognizer.locate(frame) if tracker else hand_at(i)
+                for event in recognizer.classify(frame, hand, now=i / 30.0):
+                    if event.kind == "caption":
+                        writer.append(event.value)
+                overlay.draw(frame, recognizer.display_caption, recognizer.last_prediction,
+                             recognizer.last_confidence, True, settings["confidence_threshold"])
+
+            # The per-step breakdown only covers end_to_end rounds, not the stages measured alone
+            plan.append(Stage("end_to_end", indices, frame_to_screen, before=METRICS.reset,
+                              after=lambda: breakdown.update(METRICS.snapshot()["stages"])))
+        else:
+            skipped.append(("end_to_end", "needs the classifier"))
+
+        for name, reason in skipped:
+            skip(stages, name, reason)
+        measure(stages, plan, args.repeats)
+        if "end_to_end" in stages:
+            stages["end_to_end"]["breakdown"] = breakdown
+        if tracker:
+            notes.append(f"landmarks: {tracker.report()}")
+        if recognizer:
+            recognizer.close()
+        writer.close()
+
+    if tracker:
+        tracker.close()
+
+    results = {
+        "schema": SCHEMA,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+            "numpy": np.__version__,
+            "opencv": cv2.__version__,
+        },
+        "config": {
+            "frames": args.frames,
+            "source": args.video or "synthetic",
+            "resolution": [int(pool[0].shape[1]), int(pool[0].shape[0])],
+            "recognition_mode": settings["recognition_mode"],
+            "inference_backend": getattr(engine, "name", None),
+            "stabilizer_mode": settings.get("stabilizer_mode", DEFAULT_MODE),
+            "seed": args.seed,
+            "repeats": args.repeats,
+        },
+        "fps": stages.get("end_to_end", {}).get("fps"),
+        "rss_mb": {"start": rounded(rss_start), "end": rounded(rss_mb()), "peak": rounded(peak_rss_mb())},
+        "stages": stages,
+        "notes": notes,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\n💾 RSS {results['rss_mb']['end']} MB (peak {results['rss_mb']['peak']} MB); results: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""Replay benchmark for the prediction stabilizer.
+
+Replays a stream of per-frame probability vectors through every stabilizer
+mode and the original list-based 13-of-15 rule, and reports for each:
+
+    latency     frames from the start of a sign until its letter is committed
+    missed      signs that were never committed
+    wrong       commits of a letter that wasn't being signed
+    us/frame    cost of one update
+
+By default the stream is synthetic: a seeded sequence of signs held for
+--hold frames, with a short noisy transition between signs and random
+flicker to other classes while a sign is held. Pass --replay with a saved
+(frames, classes) .npy of probabilities to replay a real recording instead
+(no ground truth, so only the committed sequence is printed).
+
+Usage:
+    python bench/stabilizer.py [--signs 200] [--hold 30] [--flicker 0.15]
+    python bench/stabilizer.py --replay probs.npy
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from stabilizer import MODES, PredictionStabilizer  # noqa: E402
+
+NUM_CLASSES = 29            # A-Z + space, del, nothing
+TRANSITION = 5              # Noisy frames between two signs
+
+
+class LegacyStabilizer:
+    """The original rule: list buffer with pop(0) and count() on every frame"""
+
+    def __init__(self, threshold, window=15):
+        self.threshold = threshold
+        self.window = window
+        self.buffer = []
+
+    def update(self, probs):
+        top = int(np.argmax(probs))
+        if probs[top] < self.threshold:
+            return None
+        self.buffer.append(top)
+        if len(self.buffer) > self.window:
+            self.buffer.pop(0)
+        return top if self.buffer.count(top) > self.window * 0.8 else None
+
+
+def synthetic_stream(signs, hold, flicker, seed):
+    """Return (probabilities, true class per frame or -1 during transitions, sign start frames)"""
+    rng = np.random.default_rng(seed)
+    frames, truth, starts = [], [], []
+    previous = -1
+    for _ in range(signs):
+        for _ in range(TRANSITION):
+            frames.append(rng.dirichlet(np.ones(NUM_CLASSES)))
+            truth.append(-1)
+        sign = int(rng.integers(NUM_CLASSES))
+        while sign == previous:  # Repeats are committed by the repeat delay, not stability
+            sign = int(rng.integers(NUM_CLASSES))
+        previous = sign
+        starts.append(len(frames))
+        for _ in range(hold):
+            top = sign if rng.random() >= flicker else int(rng.integers(NUM_CLASSES))
+            probs = rng.dirichlet(np.ones(NUM_CLASSES)) * 0.1
+            probs[top] += rng.uniform(0.5, 0.9)
+            frames.append(probs / probs.sum())
+            truth.append(sign)
+    return np.array(frames, dtype=np.float32), np.array(truth), starts
+
+
+def replay(stabilizer, frames):
+    """Return the (frame, class) commits and microseconds per update"""
+    commits, previous = [], None
+    start = time.perf_counter()
+    for i, probs in enumerate(frames):
+        stable = stabilizer.update(probs)
+        if stable is not None and stable != previous:
+            commits.append((i, stable))
+        previous = stable
+    return commits, (time.perf_counter() - start) * 1e6 / len(frames)
+
+
+def score(commits, truth, starts):
+    latencies, wrong, committed = [], 0, set()
+    sign_index = np.searchsorted(starts, np.arange(len(truth)), side="right") - 1
+    for frame, cls in commits:
+        if truth[frame] != cls:
+            wrong += 1
+            continue
+        sign = sign_index[frame]
+        if sign not in committed:
+            committed.add(sign)
+            latencies.append(frame - starts[sign] + 1)
+    return latencies, len(starts) - len(committed), wrong
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay predictions through each stabilizer mode")
+    parser.add_argument("--signs", type=int, default=200)
+    parser.add_argument("--hold", type=int, default=30, help="Frames each sign is held")
+    parser.add_argument("--flicker", type=float, default=0.15, help="Chance a held frame predicts another class")
+    parser.add_argument("--threshold", type=float, default=0.8, help="confidence_threshold from settings.json")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--replay", help="Saved (frames, classes) probability array to replay")
+    args = parser.parse_args()
+
+    if args.replay:
+        frames = np.load(args.replay).astype(np.float32)
+        truth = starts = None
+    else:
+        frames, truth, starts = synthetic_stream(args.signs, args.hold, args.flicker, args.seed)
+    num_classes = frames.shape[1]
+
+    candidates = [("legacy", LegacyStabilizer(args.threshold))]
+    candidates += [(mode, PredictionStabilizer(num_classes, mode=mode, threshold=args.threshold))
+                   for mode in MODES]
+
+    print(f"🎬 {len(frames)} frames, {num_classes} classes\n")
+    if truth is None:
+        for name, stabilizer in candidates:
+            commits, us = replay(stabilizer, frames)
+            print(f"{name:<11} {len(commits):>4} commits  {us:6.1f} us/frame  {[c for _, c in commits][:20]}")
+        return 0
+
+    print(f"{'mode':<11}{'median lat':>11}{'p95 lat':>9}{'missed':>8}{'wrong':>7}{'us/frame':>10}")
+    for name, stabilizer in candidates:
+        commits, us = replay(stabilizer, frames)
+        latencies, missed, wrong = score(commits, truth, starts)
+        median = statistics.median(latencies) if latencies else float("nan")
+        p95 = float(np.percentile(latencies, 95)) if latencies else float("nan")
+        print(f"{name:<11}{median:>11.1f}{p95:>9.1f}{missed:>8}{wrong:>7}{us:>10.1f}")
+    print("\nLatency is in frames from the start of a sign (30 frames = 1 s at 30 fps).")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""Startup-time benchmark for SignBridge Pro.
+
+Launches the app (main.py or the frozen SignBridgePro.exe) with
+SIGNBRIDGE_STARTUP_BENCH=1, which makes it print wall-clock milestones and exit
+as soon as the model is warm. Reports, per run and as a median:
+
+    time-to-window           process launch -> main window shown
+    time-to-first-prediction process launch -> warm-up inference finished
+
+Usage:
+    python bench/startup.py [--runs 5] [--exe dist/SignBridgePro.exe]
+
+The milestones go to stdout, so --exe needs a build made with console=True in
+SignBridgePro.spec (windowed builds have no stdout to read).
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_once(command, timeout):
+    env = dict(os.environ, SIGNBRIDGE_STARTUP_BENCH="1")
+    launched = time.time()
+    proc = subprocess.run(command, cwd=APP_DIR, env=env, capture_output=True,
+                          text=True, encoding="utf-8", errors="replace", timeout=timeout)
+    events = {}
+    for line in proc.stdout.splitlines():
+        if line.startswith("[startup] "):
+            _, name, stamp = line.split()
+            events[name] = float(stamp) - launched
+    return events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure SignBridge Pro startup time")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--exe", help="Frozen executable to launch instead of main.py")
+    parser.add_argument("--timeout", type=float, default=180)
+    args = parser.parse_args()
+
+    command = [args.exe] if args.exe else [sys.executable, os.path.join(APP_DIR, "main.py")]
+    results = {"window": [], "first_prediction": []}
+
+    for i in range(1, args.runs + 1):
+        events = run_once(command, args.timeout)
+        for name in results:
+            if name in events:
+                results[name].append(events[name])
+        window = events.get("window")
+        first = events.get("first_prediction")
+        print(f"run {i}: time-to-window {window if window is not None else float('nan'):.2f}s | "
+              f"time-to-first-prediction {first if first is not None else float('nan'):.2f}s")
+
+    for name, label in (("window", "time-to-window"), ("first_prediction", "time-to-first-prediction")):
+        if results[name]:
+            print(f"median {label}: {statistics.median(results[name]):.2f}s "
+                  f"({len(results[name])}/{args.runs} runs)")
+        else:
+            print(f"median {label}: no successful runs (is the model in model/?)")
+
+
+if __name__ == "__main__":
+    main()
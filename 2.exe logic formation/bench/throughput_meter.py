@@ -0,0 +1,57 @@
+"""ThroughputMeter under a stall: does the reported fps fall when ticks stop?
+
+Ticks a meter at --fps for a few windows, then stops ticking, as a hung stage
+would, and samples meter.fps while it waits. The periodic report, the GUI
+stats bar and /metrics all read this value, so a stalled stage must not keep
+showing its last healthy rate.
+
+Exits with status 1 if the rate is not near --fps while ticking, or has not
+dropped below 10% of it after --stall seconds without a tick.
+
+Usage:
+    python bench/throughput_meter.py [--fps 30] [--window 0.5] [--stall 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pipeline import ThroughputMeter  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that ThroughputMeter.fps decays when a stage stalls")
+    parser.add_argument("--fps", type=float, default=30)
+    parser.add_argument("--window", type=float, default=0.5)
+    parser.add_argument("--stall", type=float, default=5.0, help="Seconds without a tick")
+    args = parser.parse_args()
+
+    meter = ThroughputMeter("bench", window=args.window)
+    deadline = time.perf_counter() + args.window * 3
+    while time.perf_counter() < deadline:
+        meter.tick()
+        time.sleep(1 / args.fps)
+    healthy = meter.fps
+    print(f"⏱️ ticking    {healthy:6.1f} fps (target {args.fps:.0f})")
+
+    samples = []
+    start = time.perf_counter()
+    while time.perf_counter() - start < args.stall:
+        time.sleep(args.stall / 5)
+        samples.append((time.perf_counter() - start, meter.fps))
+    for waited, fps in samples:
+        print(f"   stalled {waited:4.1f} s  {fps:6.1f} fps")
+
+    ticking_ok = healthy >= args.fps * 0.5     # sleep() overshoots on a busy machine
+    decayed = samples[-1][1] < args.fps * 0.1
+    falling = all(later <= earlier for (_, earlier), (_, later) in zip(samples, samples[1:]))
+    ok = ticking_ok and decayed and falling
+    print("✅ fps decays toward 0 when ticks stop" if ok else
+          f"❌ ticking ok={ticking_ok}, decayed={decayed}, falling={falling}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Soak test for the transcript widget: update time must stay flat.
+
+Feeds --captions synthetic captions into a real tk.Text through TranscriptView
+(and, for comparison, a smaller run through the old get/delete/insert update)
+and times every update, including Tk's idle redraw. Exits with status 1 if the
+last 10% of TranscriptView updates average more than MAX_GROWTH times the first
+10%, so it can gate changes to transcript_view.py.
+
+Needs a display (it opens a hidden Tk window).
+
+Usage:
+    python bench/transcript_soak.py [--captions 5000] [--legacy 1500]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from transcript_view import TranscriptView  # noqa: E402
+
+WORDS = ["HELLO", "HOW", "ARE", "YOU", "THANK", "YOU.", "GOOD", "MORNING", "TEAM,", "SEE", "YOU", "SOON."]
+MAX_GROWTH = 2.0
+NOISE_FLOOR = 50e-6         # Ignore growth below 50 us; it's timer noise
+
+
+def legacy_append(widget, segment):
+    """update_translation_text() as it was before transcript_view.py"""
+    existing_content = widget.get(1.0, tk.END).strip()
+    updated_content = existing_content + " " + segment if existing_content else segment
+    widget.delete(1.0, tk.END)
+    widget.insert(1.0, updated_content)
+
+
+def soak(root, append, count):
+    costs = []
+    for i in range(count):
+        caption = " ".join(WORDS[(i + j) % len(WORDS)] for j in range(3))
+        start = time.perf_counter()
+        append(caption)
+        root.update_idletasks()
+        costs.append(time.perf_counter() - start)
+    return costs
+
+
+def first_last(costs):
+    window = max(1, len(costs) // 10)
+    return statistics.mean(costs[:window]), statistics.mean(costs[-window:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Soak test the transcript widget")
+    parser.add_argument("--captions", type=int, default=5000)
+    parser.add_argument("--legacy", type=int, default=1500, help="Captions for the old update (0 to skip)")
+    parser.add_argument("--max-chars", type=int, default=20000)
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    root.withdraw()
+
+    results = {}
+    if args.legacy:
+        widget = tk.Text(root, wrap="word")
+        widget.pack()
+        results["legacy"] = soak(root, lambda c: legacy_append(widget, c), args.legacy)
+        widget.destroy()
+
+    widget = tk.Text(root, wrap="word")
+    widget.pack()
+    view = TranscriptView(widget, max_chars=args.max_chars)
+    results["view"] = soak(root, view.append, args.captions)
+    visible = len(view.text())
+    root.destroy()
+
+    print(f"{'':<8}{'updates':>8}{'first us':>11}{'last us':>11}{'growth':>9}")
+    for name, costs in results.items():
+        first, last = first_last(costs)
+        print(f"{name:<8}{len(costs):>8}{first * 1e6:>11.1f}{last * 1e6:>11.1f}{last / first:>8.1f}x")
+    print(f"\n📜 visible {visible} chars, paged out {view.paged_out} chars, {view.word_count} words")
+
+    first, last = first_last(results["view"])
+    if last > first * MAX_GROWTH and last - first > NOISE_FLOOR:
+        print(f"❌ Update time grew {last / first:.1f}x over the session (limit {MAX_GROWTH}x)")
+        return 1
+    print("✅ Update time stayed flat")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Virtual camera sink benchmark against a stub device (no OBS needed).
+
+Feeds synthetic 1280x720 frames into VirtualCameraSink at --source-fps while
+a StubCamera stands in for pyvirtualcam.Camera, then reports the rate frames
+reached the "device", how many BGR->RGB conversions (buffer copies) the sink
+made, how many sends reused the previous buffer and whether the sink kept
+handing the device the same pre-allocated array.
+
+Usage:
+    python bench/virtual_camera.py [--seconds 5] [--fps 30] [--source-fps 24]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from virtual_camera import VirtualCameraSink  # noqa: E402
+
+
+class StubCamera:
+    """Minimal stand-in for pyvirtualcam.Camera with the same pacing behaviour"""
+    device = "stub"
+
+    def __init__(self, width, height, fps):
+        self.width, self.height, self.fps = width, height, fps
+        self.frames_sent = 0
+        self.buffers = set()
+        self._next = time.perf_counter()
+
+    def send(self, frame):
+        assert frame.shape == (self.height, self.width, 3) and frame.dtype == np.uint8
+        self.buffers.add(id(frame))
+        self.frames_sent += 1
+
+    def sleep_until_next_frame(self):
+        self._next += 1.0 / self.fps
+        delay = self._next - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            self._next = time.perf_counter()
+
+    def close(self):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure VirtualCameraSink with a stub camera")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--fps", type=int, default=30, help="Virtual camera frame rate")
+    parser.add_argument("--source-fps", type=float, default=24.0, help="Rate the pipeline submits frames")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    args = parser.parse_args()
+
+    stub = {}
+
+    def factory(width, height, fps):
+        stub["camera"] = StubCamera(width, height, fps)
+        return stub["camera"]
+
+    sink = VirtualCameraSink(args.width, args.height, args.fps, camera_factory=factory)
+    frames = [np.random.default_rng(i).integers(0, 255, (args.height, args.width, 3), dtype=np.uint8)
+              for i in range(4)]
+
+    sink.start()
+    start = time.perf_counter()
+    submit_cost = []
+    i = 0
+    while time.perf_counter() - start < args.seconds:
+        t = time.perf_counter()
+        sink.submit(frames[i % len(frames)])
+        submit_cost.append(time.perf_counter() - t)
+        i += 1
+        time.sleep(max(0.0, start + i / args.source_fps - time.perf_counter()))
+    sink.stop()
+    elapsed = time.perf_counter() - start
+
+    camera = stub["camera"]
+    print(f"📤 submitted {sink.submitted} frames ({sink.submitted / elapsed:.1f} fps), "
+          f"submit() {np.mean(submit_cost) * 1e6:.1f} us")
+    print(f"🎥 device received {camera.frames_sent} frames ({camera.frames_sent / elapsed:.1f} fps, target {args.fps})")
+    print(f"📋 conversions {sink.conversions} ({sink.conversions / max(1, camera.frames_sent):.2f} per sent frame), "
+          f"repeats {sink.repeated}, skipped {sink.overwritten}")
+    print(f"🧱 distinct buffers handed to the device: {len(camera.buffers)} (1 = pre-allocated buffer reused)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,366 @@
+"""Local push server for browser-source caption overlays.
+
+OBS can show captions by polling caption_output.txt, but that adds the poll
+interval to every caption and rewrites a file all session. CaptionServer runs
+a small asyncio HTTP server on localhost in its own thread. It serves:
+
+    /             the overlay page (add it in OBS as a Browser Source)
+    /styles.css   the website stylesheet the overlay reuses
+    /ws           caption events over WebSocket
+    /events       the same events as Server-Sent Events (fallback)
+
+Events are JSON: {"type", "text", "confidence", "ts"}. The types are
+"partial" (the word being spelled), "word" (a finished word), "segment" (a
+caption) and "clear". publish() can be called from any thread and never
+blocks. It hands the message to the event loop, which copies it into a bounded
+queue per client. A slow client loses its oldest messages (counted in
+`dropped`) instead of holding up the others or the detection thread.
+
+Browsers apply no CORS to WebSockets, so any page open in the user's browser
+could otherwise read the live captions. /ws and /events refuse requests whose
+Origin header is present and isn't this server's own page
+(http://127.0.0.1:<port> or http://localhost:<port>), which is where the OBS
+browser source loads the overlay from. Clients without an Origin (scripts,
+curl) are not browsers and are let through.
+"""
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+
+DEFAULT_PORT = 8765
+CLIENT_QUEUE_SIZE = 64      # Messages buffered per client before the oldest are dropped
+KEEPALIVE = 15              # Seconds between SSE comments / WebSocket pings when idle
+MAX_REQUEST_BYTES = 8192
+MAX_WS_FRAME_BYTES = 125    # Clients only send control frames (ping/close), which RFC 6455 caps at 125
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+# Replayed to new clients so a reloaded browser source shows the current caption
+REPLAYED_TYPES = ("segment", "partial")
+
+OVERLAY_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>SignBridge Captions</title>
+<link rel="stylesheet" href="/styles.css">
+<style>
+  html, body { background: transparent; overflow: hidden; }
+  #captions { position: fixed; left: 0; right: 0; bottom: 4vh; text-align: center; }
+  #caption { display: inline-block; max-width: 90vw; padding: 0.4em 0.9em; border-radius: 0.75rem;
+             background: rgba(10, 25, 47, 0.75); font-size: 5vh; font-weight: 700;
+             transition: opacity 0.3s; }
+  #partial { display: block; font-size: 3vh; min-height: 1.6em; }
+  .idle { opacity: 0; }
+</style>
+</head>
+<body>
+<div id="captions" class="container">
+  <span id="partial" class="gradient-text"></span>
+  <span id="caption" class="idle"></span>
+</div>
+<script>
+const caption = document.getElementById("caption");
+const partial = document.getElementById("partial");
+let retry = 500;
+
+function show(msg) {
+  if (msg.type === "segment") {
+    caption.textContent = msg.text;
+    caption.classList.toggle("idle", !msg.text);
+  } else if (msg.type === "partial") {
+    partial.textContent = msg.text;
+  } else if (msg.type === "clear") {
+    caption.textContent = partial.textContent = "";
+    caption.classList.add("idle");
+  }
+}
+
+function connectEvents() {
+  const source = new EventSource("/events");
+  source.onmessage = (e) => show(JSON.parse(e.data));
+}
+
+function connect() {
+  const ws = new WebSocket(`ws://${location.host}/ws`);
+  let opened = false;
+  ws.onopen = () => { opened = true; retry = 500; };
+  ws.onmessage = (e) => show(JSON.parse(e.data));
+  ws.onclose = () => {
+    if (!opened && retry > 8000) { connectEvents(); return; }  // WebSocket blocked: use SSE
+    setTimeout(connect, retry);
+    retry *= 2;
+  };
+}
+
+connect();
+</script>
+</body>
+</html>
+"""
+
+
+class CaptionServer:
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, stylesheet_path=None, queue_size=CLIENT_QUEUE_SIZE):
+        self.host = host
+        self.port = port            # 0 picks a free port; the real one is set by start()
+        self.stylesheet_path = stylesheet_path
+        self.queue_size = queue_size
+        self.published = 0
+        self.dropped = 0            # Messages a slow client never received
+        self.connections = 0
+        self.rejected = 0           # Requests refused for a foreign Origin
+        self.error = None
+        self._clients = set()       # One asyncio.Queue per connected client
+        self._tasks = set()
+        self._latest = {}
+        self._loop = None
+        self._server = None
+        self._ready = threading.Event()
+        self._thread = None
+
+    # === PUBLIC API (any thread) ===
+    def start(self):
+        """Start the server thread; returns False if the port can't be opened"""
+        self._thread = threading.Thread(target=self._run, name="SignBridge-caption-server", daemon=True)
+        self._thread.start()
+        self._ready.wait(timeout=5)
+        if self._server is None:
+            print(f"⚠️ Caption server unavailable: {self.error or 'startup timed out'}")
+            return False
+        print(f"🌐 Caption overlay: http://{self.host}:{self.port}/")
+        return True
+
+    def publish(self, kind, text, confidence=1.0):
+        """Send a caption event to every client without blocking the caller"""
+        loop = self._loop
+        if loop is None:
+            return
+        message = json.dumps({"type": kind, "text": text, "confidence": round(confidence, 3), "ts": time.time()})
+        try:
+            loop.call_soon_threadsafe(self._fan_out, kind, message)
+            self.published += 1
+        except RuntimeError:
+            pass  # Loop already closed
+
+    def client_count(self):
+        return len(self._clients)
+
+    def report(self):
+        report = f"captions pushed {self.published} to {len(self._clients)} client(s), dropped {self.dropped}"
+        return report + (f", rejected {self.rejected} foreign origin(s)" if self.rejected else "")
+
+    def stop(self):
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._close(), loop).result(timeout=2)
+        except Exception as e:
+            print(f"Caption server shutdown error: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=2)
+
+    # === EVENT LOOP THREAD ===
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            self._server = loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port, limit=MAX_REQUEST_BYTES))
+            self.port = self._server.sockets[0].getsockname()[1]
+            self._loop = loop
+        except OSError as e:
+            self.error = e
+        finally:
+            self._ready.set()
+        if self._server is None:
+            loop.close()
+            return
+        try:
+            loop.run_forever()
+        finally:
+            self._loop = None
+            loop.close()
+
+    async def _close(self):
+        self._server.close()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _fan_out(self, kind, message):
+        if kind == "clear":
+            self._latest.clear()
+        elif kind in REPLAYED_TYPES:
+            self._latest[kind] = message
+        for client in self._clients:
+            if client.full():
+                client.get_nowait()
+                self.dropped += 1
+            client.put_nowait(message)
+
+    def _subscribe(self):
+        client = asyncio.Queue(maxsize=self.queue_size)
+        for message in self._latest.values():
+            client.put_nowait(message)
+        self._clients.add(client)
+        self.connections += 1
+        return client
+
+    async def _handle(self, reader, writer):
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            try:
+                head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout=5)
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError):
+                return
+            lines = head.decode("latin-1").split("\r\n")
+            parts = lines[0].split()
+            if len(parts) < 2 or parts[0] != "GET":
+                await self._respond(writer, "405 Method Not Allowed", "text/plain", b"GET only")
+                return
+            path = parts[1].split("?")[0]
+            headers = {}
+            for line in lines[1:]:
+                name, _, value = line.partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            if path in ("/ws", "/events") and not self._origin_allowed(headers):
+                self.rejected += 1
+                await self._respond(writer, "403 Forbidden", "text/plain", b"Origin not allowed")
+            elif path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self._serve_websocket(reader, writer, headers)
+            elif path == "/events":
+                await self._serve_events(reader, writer)
+            elif path in ("/", "/overlay"):
+                await self._respond(writer, "200 OK", "text/html; charset=utf-8", OVERLAY_HTML.encode("utf-8"))
+            elif path == "/styles.css":
+                await self._respond(writer, "200 OK", "text/css; charset=utf-8", self._stylesheet())
+            else:
+                await self._respond(writer, "404 Not Found", "text/plain", b"Not found")
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._tasks.discard(task)
+            writer.close()
+
+    def _origin_allowed(self, headers):
+        origin = headers.get("origin")
+        if origin is None:
+            return True
+        return origin.rstrip("/").lower() in {f"http://{host}:{self.port}" for host in ("127.0.0.1", "localhost")}
+
+    def _stylesheet(self):
+        if self.stylesheet_path and os.path.exists(self.stylesheet_path):
+            with open(self.stylesheet_path, "rb") as f:
+                return f.read()
+        return b""
+
+    async def _respond(self, writer, status, content_type, body):
+        writer.write((f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                      f"Content-Length: {len(body)}\r\nCache-Control: no-cache\r\n"
+                      "Connection: close\r\n\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def _stream(self, reader_task, writer, encode, keepalive):
+        """Send queued messages to one client until it disconnects"""
+        client = self._subscribe()
+        try:
+            while not reader_task.done():
+                # Wait on the reader too, so a client that disconnects is dropped at once
+                getter = asyncio.ensure_future(client.get())
+                done, _ = await asyncio.wait({getter, reader_task}, timeout=KEEPALIVE,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if getter in done:
+                    writer.write(encode(getter.result()))
+                else:
+                    getter.cancel()     # The message stays queued if one arrives meanwhile
+                    if reader_task in done:
+                        break
+                    writer.write(keepalive)
+                await writer.drain()
+        finally:
+            self._clients.discard(client)
+            reader_task.cancel()
+
+    async def _serve_events(self, reader, writer):
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+                     b"Cache-Control: no-cache\r\nConnection: keep-alive\r\n\r\n")
+        # The browser never sends anything; EOF means it went away
+        reader_task = asyncio.ensure_future(reader.read())
+        await self._stream(reader_task, writer, lambda m: f"data: {m}\n\n".encode("utf-8"), b": keepalive\n\n")
+
+    async def _serve_websocket(self, reader, writer, headers):
+        key = headers.get("sec-websocket-key")
+        if not key:
+            await self._respond(writer, "400 Bad Request", "text/plain", b"Missing Sec-WebSocket-Key")
+            return
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode("ascii")).digest()).decode("ascii")
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode("latin-1"))
+        reader_task = asyncio.ensure_future(self._read_websocket(reader, writer))
+        await self._stream(reader_task, writer, lambda m: ws_frame(m.encode("utf-8")), ws_frame(b"", opcode=0x9))
+
+    async def _read_websocket(self, reader, writer):
+        """Answer pings and close frames; captions only flow server -> client"""
+        try:
+            while True:
+                try:
+                    opcode, payload = await read_ws_frame(reader, MAX_WS_FRAME_BYTES)
+                except FrameTooLarge:
+                    writer.write(ws_frame(struct.pack("!H", 1009), opcode=0x8))  # 1009: message too big
+                    return
+                if opcode == 0x8:
+                    writer.write(ws_frame(payload[:2], opcode=0x8))
+                    return
+                if opcode == 0x9:
+                    writer.write(ws_frame(payload, opcode=0xA))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return
+
+
+# === WEBSOCKET FRAMING (RFC 6455, unfragmented frames) ===
+class FrameTooLarge(Exception):
+    """A frame's declared length is over the reader's limit"""
+
+
+def ws_frame(payload, opcode=0x1, mask=None):
+    """Encode one final frame; clients must pass a 4-byte `mask`"""
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, mask_bit | length)
+    elif length < 65536:
+        header = struct.pack("!BBH", 0x80 | opcode, mask_bit | 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, mask_bit | 127, length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        header += mask
+    return header + payload
+
+
+async def read_ws_frame(reader, max_length=None):
+    """Read one frame and return (opcode, unmasked payload).
+
+    Raises FrameTooLarge, before reading the payload, if it is longer than
+    `max_length`.
+    """
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", await reader.readexactly(8))[0]
+    if max_length is not None and length > max_length:
+        raise FrameTooLarge(length)
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+    return first & 0x0F, payload
@@ -0,0 +1,152 @@
+"""Background writer for the caption files OBS reads.
+
+Rewriting the whole session text into caption_output.txt on every caption gets
+slower the longer a session runs, and OBS can read the file half-written.
+CaptionWriter does all file I/O on its own thread:
+
+- captions are coalesced for `debounce` seconds, so a burst of updates costs a
+  single write;
+- caption_output.txt only holds the last `tail_chars` characters (cut at a word
+  boundary), which is all an OBS text source shows, so each write costs the
+  same at minute 1 and hour 3. It is replaced atomically (temp file +
+  os.replace), so OBS always sees either the old or the new text;
+- every caption is also appended to caption_transcript.txt, the full
+  append-only record of all sessions.
+
+All public methods only touch memory and return immediately.
+"""
+import os
+import threading
+import time
+
+DEFAULT_TAIL_CHARS = 300
+DEFAULT_DEBOUNCE = 0.25     # Seconds to wait for more updates before writing
+REPLACE_RETRIES = 5         # Windows refuses os.replace while a reader has the file open
+
+
+class CaptionWriter:
+    def __init__(self, output_path, transcript_path, tail_chars=DEFAULT_TAIL_CHARS, debounce=DEFAULT_DEBOUNCE):
+        self.output_path = output_path
+        self.transcript_path = transcript_path
+        self.tail_chars = tail_chars
+        self.debounce = debounce
+        self.writes = 0             # Atomic replaces of the output file
+        self._tail = ""
+        self._tail_dirty = False
+        self._pending = []          # Transcript text not yet appended
+        # Text put before the next transcript entry: a new line starts each session
+        self._separator = "\n" if os.path.exists(transcript_path) and os.path.getsize(transcript_path) else ""
+        self._writing = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="SignBridge-captions", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    # === PUBLIC API (any thread) ===
+    def append(self, text):
+        """Add a caption segment to the OBS tail and the transcript"""
+        if not text:
+            return
+        with self._cond:
+            self._tail = self._trim(f"{self._tail} {text}" if self._tail else text)
+            self._pending.append(self._separator + text)
+            self._separator = " "
+            self._tail_dirty = True
+            self._cond.notify()
+
+    def replace(self, text):
+        """Show `text` (e.g. a manually saved translation) in OBS without touching the transcript"""
+        with self._cond:
+            self._tail = self._trim(text)
+            self._tail_dirty = True
+            self._cond.notify()
+
+    def clear(self):
+        """Blank the OBS file; the transcript continues on a new line"""
+        with self._cond:
+            self._tail = ""
+            if self._separator:
+                self._separator = "\n"
+            self._tail_dirty = True
+            self._cond.notify()
+
+    def flush(self, timeout=2.0):
+        """Wait until everything submitted so far is on disk"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify()
+            while (self._tail_dirty or self._pending or self._writing) and self._thread.is_alive():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2.0)
+
+    # === WRITER THREAD ===
+    def _trim(self, text):
+        if len(text) <= self.tail_chars:
+            return text
+        cut_on_boundary = text[-self.tail_chars - 1] == " "
+        text = text[-self.tail_chars:]
+        if cut_on_boundary:
+            return text
+        # Drop the partial word the cut landed in
+        space = text.find(" ")
+        return text[space + 1:] if 0 <= space < len(text) - 1 else text
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not (self._tail_dirty or self._pending or self._closed):
+                    self._cond.wait()
+                closing = self._closed
+            if not closing:
+                time.sleep(self.debounce)  # Let a burst of updates pile up
+            with self._cond:
+                tail, tail_dirty = self._tail, self._tail_dirty
+                pending, self._pending = self._pending, []
+                self._tail_dirty = False
+                self._writing = True
+            if pending:
+                self._append_transcript("".join(pending))
+            if tail_dirty:
+                self._replace_output(tail)
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()  # Wake flush()
+                if self._closed and not (self._tail_dirty or self._pending):
+                    return
+
+    def _append_transcript(self, text):
+        try:
+            with open(self.transcript_path, "a", encoding="utf-8") as f:
+                f.write(text)
+        except OSError as e:
+            print(f"[ERROR] Could not append to {os.path.basename(self.transcript_path)}: {e}")
+
+    def _replace_output(self, text):
+        tmp_path = self.output_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            for attempt in range(REPLACE_RETRIES):
+                try:
+                    os.replace(tmp_path, self.output_path)
+                    self.writes += 1
+                    return
+                except PermissionError:
+                    if attempt == REPLACE_RETRIES - 1:
+                        raise
+                    time.sleep(0.02 * (attempt + 1))
+        except OSError as e:
+            print(f"[ERROR] Could not write to caption_output.txt: {e}")
@@ -0,0 +1,107 @@
+"""Per-frame detection steps shared by the live app and the offline tools.
+
+MediaPipe landmarks -> padded hand ROI -> 64x64 grayscale tensor -> classifier.
+Keeping these in one place guarantees that transcribe_video.py and the GUI
+produce the same predictions for the same frame.
+"""
+import cv2
+import numpy as np
+
+from metrics import METRICS
+
+IMG_SIZE = 64
+ROI_PADDING = 30                 # Pixels added around the landmark bounding box
+SPECIAL_GESTURES = {"space": " ", "nothing": ".", "del": ","}
+
+
+def create_hands(static_image_mode=False):
+    """Create the MediaPipe hand tracker with the app's detection settings"""
+    import mediapipe as mp
+    return mp.solutions.hands.Hands(
+        static_image_mode=static_image_mode,
+        max_num_hands=1,
+        min_detection_confidence=0.7,
+        min_tracking_confidence=0.7
+    )
+
+
+def find_hand_landmarks(hands, frame):
+    """Run MediaPipe on a BGR frame; returns a (21, 3) array of normalized x, y, z or None"""
+    with METRICS.time("color"):
+        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    with METRICS.time("hands"):
+        result = hands.process(rgb)
+    if not result.multi_hand_landmarks:
+        return None
+    hand = result.multi_hand_landmarks[0]
+    return np.array([(lm.x, lm.y, lm.z) for lm in hand.landmark], dtype=np.float32)
+
+
+def hand_roi_box(landmarks, width, height, padding=ROI_PADDING):
+    """Padded pixel bounding box (x_min, y_min, x_max, y_max) of the landmarks, clipped to the frame"""
+    x_min = int(landmarks[:, 0].min() * width) - padding
+    x_max = int(landmarks[:, 0].max() * width) + padding
+    y_min = int(landmarks[:, 1].min() * height) - padding
+    y_max = int(landmarks[:, 1].max() * height) + padding
+    return max(x_min, 0), max(y_min, 0), min(x_max, width), min(y_max, height)
+
+
+def preprocess_roi(roi):
+    """BGR hand crop -> (1, IMG_SIZE, IMG_SIZE, 1) float32 in [0, 1], as in training"""
+    gray = cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY)
+    gray = cv2.resize(gray, (IMG_SIZE, IMG_SIZE))
+    return (gray.astype(np.float32) / 255.0).reshape(1, IMG_SIZE, IMG_SIZE, 1)
+
+
+class Preprocessor:
+    """preprocess_roi() into reusable buffers, for the per-frame hot loop.
+
+    The grayscale ROI, the 64x64 resize and the float32 (batch_size, 64, 64, 1)
+    input all live in buffers allocated once (the grayscale one grows to the
+    largest ROI seen), and OpenCV/NumPy write into them via dst=/out=. In
+    steady state a frame allocates no array memory. The output is identical
+    to preprocess_roi(). The returned batch is overwritten by the next call,
+    so hand it to the model before preprocessing the next crop.
+    """
+
+    def __init__(self, batch_size=1):
+        self.batch = np.zeros((batch_size, IMG_SIZE, IMG_SIZE, 1), dtype=np.float32)
+        self._small = np.empty((IMG_SIZE, IMG_SIZE), dtype=np.uint8)
+        self._gray = np.empty(0, dtype=np.uint8)
+        self._scale = np.float32(255.0)
+
+    def __call__(self, roi, index=0):
+        """Preprocess a BGR crop into slot `index`; returns that slot as a (1, 64, 64, 1) view"""
+        h, w = roi.shape[:2]
+        if self._gray.size < h * w:
+            # Grow geometrically so a hand moving closer costs only a few reallocations
+            self._gray = np.empty(max(h * w, 2 * self._gray.size), dtype=np.uint8)
+        gray = self._gray[:h * w].reshape(h, w)
+        cv2.cvtColor(roi, cv2.COLOR_BGR2GRAY, dst=gray)
+        cv2.resize(gray, (IMG_SIZE, IMG_SIZE), dst=self._small)
+        # Cast, then scale in place: a ufunc casting uint8 -> float32 itself would allocate a buffer
+        pixels = self.batch[index, :, :, 0]
+        np.copyto(pixels, self._small)
+        np.divide(pixels, self._scale, out=pixels)
+        return self.batch[index:index + 1]
+
+
+def predict_roi(engine, roi, preprocess=preprocess_roi):
+    """Class probability vector for a hand crop (pass a Preprocessor to reuse buffers)"""
+    with METRICS.time("preprocess"):
+        batch = preprocess(roi)
+    with METRICS.time("inference"):
+        return engine.predict(batch)[0]
+
+
+def classify_roi(engine, roi, idx_to_label):
+    """Classify a hand crop; returns (label, confidence)"""
+    prediction = predict_roi(engine, roi)
+    index = int(np.argmax(prediction))
+    return idx_to_label[index], float(prediction[index])
+
+
+def draw_hand_box(frame, box):
+    x_min, y_min, x_max, y_max = box
+    cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (64, 224, 255), 3)
+    cv2.circle(frame, (int((x_min + x_max) / 2), y_min - 10), 5, (64, 224, 255), -1)
@@ -0,0 +1,84 @@
+"""Thread-safe hand-off of GUI updates from worker threads to the Tk main loop.
+
+Worker threads used to put one callback per frame into a queue.Queue that the
+GUI drained every 100 ms. That meant 30+ stale "Current: A" label updates per
+tick, and Tk redrew every one of them. GuiUpdateBus has two channels:
+
+- set(key, func, *args): a latest-value slot per key (prediction, status,
+  stats...). Only the newest call per key survives until the next drain, and
+  the replaced ones are counted as `coalesced`;
+- post(func, *args): an ordered event channel for things that must all happen
+  (dialogs, transcript appends). It is bounded, and overflow drops the oldest
+  droppable event and counts it as `dropped`. Content such as transcript text
+  is posted with droppable=False and is never dropped: if the Tk thread
+  stalls during a burst, the channel grows past the bound instead of losing
+  captions.
+
+The main thread calls drain() at a fixed UI rate. Slot updates and events run
+in the order they were submitted, so a status set before a dialog is still
+shown before it.
+"""
+import collections
+import itertools
+import threading
+
+MAX_EVENTS = 500
+
+
+class GuiUpdateBus:
+    def __init__(self, max_events=MAX_EVENTS):
+        self.max_events = max_events
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._slots = {}                        # key -> (seq, func, args)
+        self._events = collections.deque()      # (seq, func, args), bounded
+        self._content = collections.deque()     # (seq, func, args), never dropped
+        self.submitted = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.executed = 0
+
+    def set(self, key, func, *args):
+        """Latest-value update: replaces any pending update with the same key"""
+        with self._lock:
+            if key in self._slots:
+                self.coalesced += 1
+            self._slots[key] = (next(self._seq), func, args)
+            self.submitted += 1
+
+    def post(self, func, *args, droppable=True):
+        """Ordered one-off event: runs in order; only droppable events may be shed on overflow"""
+        with self._lock:
+            if not droppable:
+                self._content.append((next(self._seq), func, args))
+            else:
+                if len(self._events) >= self.max_events:
+                    self._events.popleft()
+                    self.dropped += 1
+                self._events.append((next(self._seq), func, args))
+            self.submitted += 1
+
+    def drain(self):
+        """Run everything pending, in submission order (main thread only)"""
+        with self._lock:
+            if not self._slots and not self._events and not self._content:
+                return 0
+            updates = sorted(list(self._slots.values()) + list(self._events) + list(self._content),
+                             key=lambda item: item[0])
+            self._slots.clear()
+            self._events.clear()
+            self._content.clear()
+        for _, func, args in updates:
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"GUI update error in {getattr(func, '__name__', func)}: {e}")
+        self.executed += len(updates)
+        return len(updates)
+
+    def stats(self):
+        return {"submitted": self.submitted, "executed": self.executed,
+                "coalesced": self.coalesced, "dropped": self.dropped}
+
+    def report(self):
+        return f"gui coalesced {self.coalesced}/{self.submitted}, dropped {self.dropped}"
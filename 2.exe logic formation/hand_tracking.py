@@ -0,0 +1,152 @@
+"""Hand tracking stage that keeps MediaPipe's input small.
+
+Feeding MediaPipe the full 1280x720 camera frame costs a full-size colour
+conversion and copy every frame, and the palm detector runs whenever MediaPipe
+loses the hand. HandTracker instead:
+
+- while a hand is tracked, predicts where it will be in the next frame with a
+  constant-velocity model on the box centre and only passes a square crop
+  around that prediction (resized to TRACK_SIZE) to MediaPipe. The crop follows
+  the hand, so MediaPipe's own landmark tracking stays locked on it and the
+  palm detector isn't needed;
+- when tracking is lost (no hand in the crop), runs full detection once on the
+  whole frame downscaled to `detect_width` (the "detection_width" setting,
+  DETECT_WIDTH by default; 0 means native resolution).
+
+Detection and tracking use two MediaPipe instances: a static-image one for the
+full frame and a tracking one that only ever sees the moving crop. Sharing one
+instance would hand MediaPipe's internal tracker coordinates from a different
+image every time the tracker switches between the two.
+
+Landmarks are always returned in normalized full-frame coordinates, exactly
+like running MediaPipe on the original frame, so the hand ROI is still cut
+from the native-resolution frame however small the detection input is.
+
+The MediaPipe graphs are expensive to build, so the app shares one warm pair
+across Start/Stop sessions (shared_hands()) and closes them on exit.
+"""
+import threading
+
+import cv2
+import numpy as np
+
+from detection import create_hands, find_hand_landmarks
+
+DETECT_WIDTH = 640          # Width of the frame used for full (palm) detection
+DETECT_WIDTHS = (320, 480, 640, 0)  # Choices offered in Settings (0 = native)
+TRACK_SIZE = 256            # Side of the square crop fed to MediaPipe while tracking
+CROP_MARGIN = 1.8           # Crop side relative to the larger side of the hand
+VELOCITY_SMOOTHING = 0.5    # Weight of the newest motion in the velocity estimate
+
+_shared_hands = None
+_shared_lock = threading.Lock()
+
+
+def create_hand_models():
+    """Return a new (detector, tracker) pair of MediaPipe Hands instances"""
+    return create_hands(static_image_mode=True), create_hands(static_image_mode=False)
+
+
+def shared_hands():
+    """Return the process-wide (detector, tracker) pair, creating it on first use"""
+    global _shared_hands
+    with _shared_lock:
+        if _shared_hands is None:
+            _shared_hands = create_hand_models()
+        return _shared_hands
+
+
+def warm_up_hands():
+    """Build the shared MediaPipe graphs and run them once so the first Start is instant"""
+    blank = np.zeros((TRACK_SIZE, TRACK_SIZE, 3), dtype=np.uint8)
+    for hands in shared_hands():
+        hands.process(blank)
+
+
+def close_shared_hands():
+    global _shared_hands
+    with _shared_lock:
+        if _shared_hands is not None:
+            for hands in _shared_hands:
+                hands.close()
+            _shared_hands = None
+
+
+class HandTracker:
+    """Locates one hand per frame, running full detection only when tracking is lost"""
+
+    def __init__(self, hand_models, detect_width=DETECT_WIDTH, track_size=TRACK_SIZE):
+        self.detector, self.tracker = hand_models
+        self.detect_width = detect_width
+        self.track_size = track_size
+        self.full_detections = 0
+        self.tracked_frames = 0
+        self.reset()
+
+    def reset(self):
+        """Forget the tracked hand (e.g. at the start of a new session)"""
+        self.center = None      # Box centre in pixels
+        self.velocity = None    # Pixels per frame
+        self.size = 0.0         # Larger side of the landmark box in pixels
+
+    def locate(self, frame):
+        """Return (21, 3) normalized full-frame landmarks, or None if there is no hand"""
+        h, w = frame.shape[:2]
+        landmarks = None
+        if self.center is not None:
+            landmarks = self._track(frame, w, h)
+            if landmarks is not None:
+                self.tracked_frames += 1
+        if landmarks is None:
+            # Lost (or no) track: this frame counts as a full detection only
+            landmarks = self._detect(frame, w, h)
+            self.full_detections += 1
+        self._update(landmarks, w, h)
+        return landmarks
+
+    def report(self):
+        total = self.full_detections + self.tracked_frames
+        return f"tracked {self.tracked_frames}/{total}, full detections {self.full_detections}"
+
+    def close(self):
+        self.detector.close()
+        self.tracker.close()
+
+    # === STAGES ===
+    def _detect(self, frame, w, h):
+        scale = min(1.0, self.detect_width / w) if self.detect_width else 1.0
+        small = cv2.resize(frame, (int(w * scale), int(h * scale)), interpolation=cv2.INTER_AREA) \
+            if scale < 1.0 else frame
+        # Uniform scaling keeps normalized coordinates valid for the full frame
+        return find_hand_landmarks(self.detector, small)
+
+    def _track(self, frame, w, h):
+        cx, cy = self.center + self.velocity
+        side = int(min(max(self.size * CROP_MARGIN, 64), w, h))
+        x0 = int(np.clip(cx - side / 2, 0, w - side))
+        y0 = int(np.clip(cy - side / 2, 0, h - side))
+        crop = cv2.resize(frame[y0:y0 + side, x0:x0 + side], (self.track_size, self.track_size),
+                          interpolation=cv2.INTER_AREA)
+        landmarks = find_hand_landmarks(self.tracker, crop)
+        if landmarks is None:
+            return None
+        # Crop coordinates -> full-frame normalized coordinates
+        landmarks[:, 0] = (x0 + landmarks[:, 0] * side) / w
+        landmarks[:, 1] = (y0 + landmarks[:, 1] * side) / h
+        landmarks[:, 2] *= side / w
+        return landmarks
+
+    def _update(self, landmarks, w, h):
+        """Constant-velocity update of the box centre from the new landmarks"""
+        if landmarks is None:
+            self.reset()
+            return
+        xs, ys = landmarks[:, 0] * w, landmarks[:, 1] * h
+        center = np.array([(xs.min() + xs.max()) / 2, (ys.min() + ys.max()) / 2], dtype=np.float32)
+        self.size = float(max(xs.max() - xs.min(), ys.max() - ys.min()))
+        if self.center is None:
+            self.velocity = np.zeros(2, dtype=np.float32)
+        else:
+            motion = center - self.center
+            self.velocity = VELOCITY_SMOOTHING * motion + (1 - VELOCITY_SMOOTHING) * self.velocity
+        self.center = center
@@ -0,0 +1,329 @@
+"""Persistent translation history in a local SQLite database.
+
+Every caption segment used to be kept in a Python list for the lifetime of the
+app, the History window inserted all of them into its table at once, and the
+export built the whole file in memory. HistoryStore keeps them on disk
+instead (dist/translation_history.db, next to the caption files), across
+sessions:
+
+- add() only queues the row; a writer thread inserts what piled up in one
+  transaction every `flush_interval` seconds, so the GUI never waits on disk;
+- rows are indexed on (session, ts) and ts, and read in pages with keyset
+  pagination (WHERE (ts, id) < last row seen), so a page costs the same on
+  day 1 and day 30 and the History window holds one page at a time;
+- text search uses an FTS5 index when the SQLite build has it (a LIKE scan
+  otherwise);
+- export_json()/export_text() stream rows from a cursor straight into the
+  file, so memory stays flat however large the history is.
+
+Reads use a short-lived connection each, so any thread can call them while
+the writer thread is inserting (the database runs in WAL mode).
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+DEFAULT_FLUSH_INTERVAL = 0.5    # Seconds to collect rows before a batch insert
+PAGE_SIZE = 200                 # Rows per page in the History window
+EXPORT_CHUNK = 500              # Rows fetched per cursor round trip while exporting
+BUSY_TIMEOUT_MS = 5000
+
+_CLEAR = object()               # Queued by clear() so it lands between the right inserts
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS captions (
+    id INTEGER PRIMARY KEY,
+    session INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    text TEXT NOT NULL,
+    word_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS captions_session_ts ON captions (session, ts);
+CREATE INDEX IF NOT EXISTS captions_ts ON captions (ts);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS captions_fts USING fts5 (text, content='captions', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS captions_fts_insert AFTER INSERT ON captions BEGIN
+    INSERT INTO captions_fts (rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+
+def _fts_query(text):
+    """Every word must match, as a prefix, so "hel wor" finds "hello world" """
+    words = text.split()
+    return " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+
+
+class HistoryStore:
+    def __init__(self, path, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.session = self.new_session()
+        self.fts = False            # Set by start() if the SQLite build has FTS5
+        self.inserted = 0
+        self.batches = 0
+        self._pending = []          # Rows (and _CLEAR markers) not yet written
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="SignBridge-history", daemon=True)
+
+    def start(self):
+        """Create the database if needed and start the writer thread"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            try:
+                existed = conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'captions_fts'").fetchone()
+                conn.executescript(FTS_SCHEMA)
+                self.fts = True
+                if not existed:
+                    # Index rows written before the index existed (older version, or SQLite without FTS5)
+                    with conn:
+                        conn.execute("INSERT INTO captions_fts (captions_fts) VALUES ('rebuild')")
+            except sqlite3.OperationalError:
+                print("⚠️ SQLite has no FTS5; history search will scan the table")
+        finally:
+            conn.close()
+        self._thread.start()
+        return self
+
+    def new_session(self):
+        """Start a new session id (milliseconds since the epoch) for the rows added from now on"""
+        self.session = int(time.time() * 1000)
+        return self.session
+
+    # === WRITES (any thread, never block) ===
+    def add(self, text, timestamp=None):
+        if not text:
+            return
+        row = (self.session, timestamp or time.time(), text, len(text.split()))
+        with self._cond:
+            self._pending.append(row)
+            self._cond.notify()
+
+    def clear(self):
+        """Delete every row added before this call"""
+        with self._cond:
+            self._pending.append(_CLEAR)
+            self._cond.notify()
+
+    def flush(self, timeout=5.0):
+        """Wait until everything submitted so far is in the database"""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested = True
+            self._cond.notify_all()
+            while (self._pending or self._writing) and self._thread.is_alive():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        if self._thread.is_alive():
+            self._thread.join(timeout=5.0)
+
+    # === READS (any thread) ===
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        return conn
+
+    def _where(self, session, query):
+        clauses, params = [], []
+        if session is not None:
+            clauses.append("session = ?")
+            params.append(session)
+        if query and query.strip():
+            if self.fts:
+                clauses.append("id IN (SELECT rowid FROM captions_fts WHERE captions_fts MATCH ?)")
+                params.append(_fts_query(query))
+            else:
+                clauses.append("text LIKE ? ESCAPE '\\'")
+                escaped = query.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.append(f"%{escaped}%")
+        return clauses, params
+
+    def count(self, session=None, query=None):
+        clauses, params = self._where(session, query)
+        sql = "SELECT COUNT(*) FROM captions" + (" WHERE " + " AND ".join(clauses) if clauses else "")
+        conn = self._connect()
+        try:
+            return conn.execute(sql, params).fetchone()[0]
+        finally:
+            conn.close()
+
+    def page(self, before=None, after=None, limit=PAGE_SIZE, session=None, query=None):
+        """Up to `limit` rows, newest first, older than the `before` cursor or newer than `after`.
+
+        A cursor is the (ts, id) of a row from a previous page; rows are
+        (id, session, ts, text, word_count).
+        """
+        clauses, params = self._where(session, query)
+        if before is not None:
+            clauses.append("(ts, id) < (?, ?)")
+            params += list(before)
+        if after is not None:
+            clauses.append("(ts, id) > (?, ?)")
+            params += list(after)
+        order = "ASC" if after is not None and before is None else "DESC"
+        sql = ("SELECT id, session, ts, text, word_count FROM captions"
+               + (" WHERE " + " AND ".join(clauses) if clauses else "")
+               + f" ORDER BY ts {order}, id {order} LIMIT ?")
+        conn = self._connect()
+        try:
+            rows = conn.execute(sql, params + [limit]).fetchall()
+        finally:
+            conn.close()
+        return rows[::-1] if order == "ASC" else rows
+
+    def iter_rows(self, session=None, query=None, chunk=EXPORT_CHUNK):
+        """Yield every row, oldest first, `chunk` rows at a time from one read snapshot"""
+        conn = self._connect()
+        try:
+            yield from self._stream(conn, session, query, chunk)
+        finally:
+            conn.close()
+
+    def _stream(self, conn, session, query, chunk):
+        clauses, params = self._where(session, query)
+        sql = ("SELECT id, session, ts, text, word_count FROM captions"
+               + (" WHERE " + " AND ".join(clauses) if clauses else "") + " ORDER BY ts, id")
+        cursor = conn.execute(sql, params)
+        while True:
+            rows = cursor.fetchmany(chunk)
+            if not rows:
+                return
+            yield from rows
+
+    def _snapshot(self, session, query):
+        """(row count, row iterator) read in one transaction, so the count matches the rows"""
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN")
+            clauses, params = self._where(session, query)
+            sql = "SELECT COUNT(*) FROM captions" + (" WHERE " + " AND ".join(clauses) if clauses else "")
+            total = conn.execute(sql, params).fetchone()[0]
+        except BaseException:
+            conn.close()    # rows() never runs, so its finally can't close it
+            raise
+
+        def rows():
+            try:
+                yield from self._stream(conn, session, query, EXPORT_CHUNK)
+            finally:
+                conn.close()
+        return total, rows()
+
+    def recent_text(self, max_chars, session=None):
+        """The newest captions joined with spaces, about `max_chars` long at most"""
+        parts, length, before = [], 0, None
+        while length < max_chars:
+            rows = self.page(before=before, limit=PAGE_SIZE, session=session)
+            for _, _, _, text, _ in rows:
+                parts.append(text)
+                length += len(text) + 1
+                if length >= max_chars:
+                    break
+            if len(rows) < PAGE_SIZE:
+                break
+            before = (rows[-1][2], rows[-1][0])
+        return " ".join(reversed(parts))
+
+    # === EXPORT ===
+    def export_json(self, path, session=None, query=None):
+        """Write the rows as {"export_info": ..., "translations": [...]}; returns the row count"""
+        written = 0
+        with open(path, "w", encoding="utf-8") as f:
+            total, rows = self._snapshot(session, query)
+            info = {"app": "SignBridge Pro", "version": "2.0",
+                    "export_date": datetime.now().isoformat(), "total_translations": total}
+            f.write('{\n  "export_info": ' + json.dumps(info, ensure_ascii=False) + ',\n  "translations": [')
+            for _, row_session, ts, text, word_count in rows:
+                item = {"text": text, "timestamp": datetime.fromtimestamp(ts).isoformat(timespec="seconds"),
+                        "word_count": word_count, "session": row_session}
+                f.write(("\n    " if not written else ",\n    ") + json.dumps(item, ensure_ascii=False))
+                written += 1
+            f.write("\n  ]\n}\n")
+        return written
+
+    def export_text(self, path, session=None, query=None):
+        """Write the rows in the readable "Translation #n" format; returns the row count"""
+        written = 0
+        with open(path, "w", encoding="utf-8") as f:
+            total, rows = self._snapshot(session, query)
+            f.write("SignBridge Pro - Translation History\n")
+            f.write("=" * 50 + "\n")
+            f.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Total Translations: {total}\n")
+            f.write("=" * 50 + "\n\n")
+            for _, _, ts, text, word_count in rows:
+                written += 1
+                f.write(f"Translation #{written}\n"
+                        f"Time: {datetime.fromtimestamp(ts).strftime('%Y-%m-%d %H:%M:%S')}\n"
+                        f"Text: {text}\n"
+                        f"Word Count: {word_count}\n"
+                        + "-" * 30 + "\n")
+        return written
+
+    # === WRITER THREAD ===
+    def _run(self):
+        try:
+            conn = self._connect()
+        except sqlite3.Error as e:
+            print(f"[ERROR] Could not open {os.path.basename(self.path)}: {e}")
+            with self._cond:
+                self._pending = []
+                self._cond.notify_all()
+            return
+        try:
+            while True:
+                with self._cond:
+                    while not (self._pending or self._closed):
+                        self._cond.wait()
+                    # Let a burst of captions pile up into one batch, unless someone is waiting on flush()
+                    self._cond.wait_for(lambda: self._closed or self._flush_requested, self.flush_interval)
+                    pending, self._pending = self._pending, []
+                    self._flush_requested = False
+                    self._writing = True
+                if pending:
+                    self._write(conn, pending)
+                with self._cond:
+                    self._writing = False
+                    self._cond.notify_all()  # Wake flush()
+                    if self._closed and not self._pending:
+                        return
+        finally:
+            conn.close()
+
+    def _write(self, conn, pending):
+        """Insert the rows and apply clear() markers in order, in one transaction"""
+        try:
+            with conn:
+                rows = []
+                for item in pending:
+                    if item is not _CLEAR:
+                        rows.append(item)
+                        continue
+                    rows = []           # Rows queued before the clear are dropped with the rest
+                    conn.execute("DELETE FROM captions")
+                    if self.fts:
+                        conn.execute("INSERT INTO captions_fts (captions_fts) VALUES ('delete-all')")
+                conn.executemany("INSERT INTO captions (session, ts, text, word_count) VALUES (?, ?, ?, ?)", rows)
+            self.inserted += len(rows)
+            self.batches += 1
+        except sqlite3.Error as e:
+            print(f"[ERROR] Could not save translation history: {e}")
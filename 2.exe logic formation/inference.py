@@ -0,0 +1,283 @@
+"""Lightweight inference backends for the sign classifier.
+
+Keras `model.predict` builds a data adapter and callback list on every call,
+which dominates the cost of classifying a single 1x64x64x1 frame. The engines
+here expose one `predict(batch) -> probabilities` method with much less
+per-call overhead:
+
+    keras        - plain model.predict (reference, slowest)
+    tf_function  - the Keras model traced once into a compiled tf.function
+    tflite       - a TFLite interpreter on a converted copy of the model
+    onnx         - ONNX Runtime on a converted copy of the model
+
+Converted models are cached next to sign_model.h5 and rebuilt when the .h5 is
+newer. Quantized variants produced by export_quantized_models.py (in the model
+working folder) are loaded through resolve_model_variant(). Run this file
+directly for a parity and latency report:
+
+    python inference.py --backend all
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+BACKENDS = ("keras", "tf_function", "tflite", "onnx")
+DEFAULT_BACKEND = "tf_function"
+MODEL_VARIANTS = ("float32", "dynamic", "float16", "int8")
+QUANTIZATION_REPORT = "quantization_report.json"
+IMG_SIZE = 64
+
+
+def _as_float32(batch):
+    return np.ascontiguousarray(batch, dtype=np.float32)
+
+
+class KerasEngine:
+    """Reference engine: calls model.predict exactly like the original loop"""
+    name = "keras"
+
+    def __init__(self, model):
+        self.model = model
+
+    def predict(self, batch):
+        return self.model.predict(_as_float32(batch), verbose=0)
+
+
+class TFFunctionEngine:
+    """Calls the Keras model through a tf.function traced once per input shape"""
+    name = "tf_function"
+
+    def __init__(self, model):
+        import tensorflow as tf
+        self._tf = tf
+        signature = [tf.TensorSpec([None, *model.input_shape[1:]], tf.float32)]
+        self._fn = tf.function(lambda x: model(x, training=False), input_signature=signature)
+
+    def predict(self, batch):
+        return self._fn(self._tf.constant(_as_float32(batch))).numpy()
+
+
+def _load_tflite_interpreter(path, num_threads):
+    try:
+        from tflite_runtime.interpreter import Interpreter
+    except ImportError:
+        from tensorflow.lite import Interpreter
+    return Interpreter(model_path=path, num_threads=num_threads)
+
+
+class TFLiteEngine:
+    """Runs a .tflite model; handles float and fully quantized (int8/uint8) I/O"""
+    name = "tflite"
+
+    def __init__(self, model_path, num_threads=None):
+        self.model_path = model_path
+        self._interpreter = _load_tflite_interpreter(model_path, num_threads)
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._batch_size = int(self._input["shape"][0])
+
+    def _resize(self, batch_size):
+        self._interpreter.resize_tensor_input(
+            self._input["index"], [batch_size, *self._input["shape"][1:]])
+        self._interpreter.allocate_tensors()
+        self._input = self._interpreter.get_input_details()[0]
+        self._output = self._interpreter.get_output_details()[0]
+        self._batch_size = batch_size
+
+    def predict(self, batch):
+        batch = _as_float32(batch)
+        if batch.shape[0] != self._batch_size:
+            self._resize(batch.shape[0])
+
+        dtype = self._input["dtype"]
+        if dtype != np.float32:
+            scale, zero_point = self._input["quantization"]
+            info = np.iinfo(dtype)
+            batch = np.clip(np.round(batch / scale + zero_point), info.min, info.max).astype(dtype)
+        self._interpreter.set_tensor(self._input["index"], batch)
+        self._interpreter.invoke()
+
+        output = self._interpreter.get_tensor(self._output["index"])
+        if output.dtype != np.float32:
+            scale, zero_point = self._output["quantization"]
+            output = (output.astype(np.float32) - zero_point) * scale
+        return output.copy()
+
+
+class ONNXEngine:
+    """Runs an .onnx model on the ONNX Runtime CPU provider"""
+    name = "onnx"
+
+    def __init__(self, model_path, num_threads=None):
+        import onnxruntime as ort
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.model_path = model_path
+        self._session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self._input_name = self._session.get_inputs()[0].name
+
+    def predict(self, batch):
+        return self._session.run(None, {self._input_name: _as_float32(batch)})[0]
+
+
+# === MODEL CONVERSION ===
+def _is_stale(converted_path, source_path):
+    return (not os.path.exists(converted_path)
+            or os.path.getmtime(converted_path) < os.path.getmtime(source_path))
+
+
+def convert_to_tflite(keras_model, output_path):
+    import tensorflow as tf
+    converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+    with open(output_path, "wb") as f:
+        f.write(converter.convert())
+    return output_path
+
+
+def convert_to_onnx(keras_model, output_path):
+    import tensorflow as tf
+    import tf2onnx
+    signature = [tf.TensorSpec([None, *keras_model.input_shape[1:]], tf.float32, name="input")]
+    tf2onnx.convert.from_keras(keras_model, input_signature=signature, output_path=output_path)
+    return output_path
+
+
+def resolve_model_variant(model_dir, variant):
+    """Return the .tflite path for a quantized model variant, or None for the .h5.
+
+    `variant` is "" (use sign_model.h5), one of MODEL_VARIANTS, or "auto" to
+    take the variant recommended in quantization_report.json.
+    """
+    if not variant:
+        return None
+    if variant == "auto":
+        report_path = os.path.join(model_dir, QUANTIZATION_REPORT)
+        try:
+            with open(report_path, "r") as f:
+                variant = json.load(f)["recommended"]
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ No usable {QUANTIZATION_REPORT} ({e}), using sign_model.h5")
+            return None
+        print(f"📋 Quantization report recommends: {variant}")
+    if variant not in MODEL_VARIANTS:
+        print(f"⚠️ Unknown model variant '{variant}', using sign_model.h5")
+        return None
+    return os.path.join(model_dir, f"sign_model_{variant}.tflite")
+
+
+def load_keras_model(model_path):
+    from tensorflow.keras.models import load_model
+    return load_model(model_path)
+
+
+def create_engine(backend, model_path, num_threads=None, keras_model=None):
+    """Build the requested engine for the .h5 at model_path.
+
+    Converted .tflite/.onnx files are (re)generated next to the .h5 when
+    missing or stale. If a backend cannot be built (missing package, failed
+    conversion) this falls back to tf_function and prints why.
+    """
+    if backend not in BACKENDS:
+        print(f"⚠️ Unknown inference backend '{backend}', using {DEFAULT_BACKEND}")
+        backend = DEFAULT_BACKEND
+
+    stem = os.path.splitext(model_path)[0]
+    converted = {"tflite": stem + ".tflite", "onnx": stem + ".onnx"}
+
+    try:
+        if backend in converted:
+            path = converted[backend]
+            if _is_stale(path, model_path):
+                keras_model = keras_model or load_keras_model(model_path)
+                print(f"🔧 Converting model for {backend}: {path}")
+                (convert_to_tflite if backend == "tflite" else convert_to_onnx)(keras_model, path)
+                engine = (TFLiteEngine if backend == "tflite" else ONNXEngine)(path, num_threads)
+                report = check_parity(engine, KerasEngine(keras_model))
+                print(f"🔍 Parity vs Keras: max |diff| {report['max_abs_diff']:.2e}, "
+                      f"top-1 agreement {report['top1_agreement']:.1%}")
+                return engine
+            return (TFLiteEngine if backend == "tflite" else ONNXEngine)(path, num_threads)
+
+        keras_model = keras_model or load_keras_model(model_path)
+        if backend == "keras":
+            return KerasEngine(keras_model)
+        return TFFunctionEngine(keras_model)
+
+    except Exception as e:
+        if backend == DEFAULT_BACKEND:
+            raise
+        print(f"⚠️ Could not start '{backend}' backend ({e}), falling back to {DEFAULT_BACKEND}")
+        return create_engine(DEFAULT_BACKEND, model_path, num_threads, keras_model)
+
+
+# === PARITY AND LATENCY ===
+def sample_inputs(count=32, seed=0):
+    """Random frames shaped like the preprocessed hand ROI"""
+    rng = np.random.default_rng(seed)
+    return rng.random((count, IMG_SIZE, IMG_SIZE, 1), dtype=np.float32)
+
+
+def check_parity(engine, reference, inputs=None):
+    """Compare an engine against a reference engine frame by frame"""
+    inputs = sample_inputs() if inputs is None else inputs
+    diffs, agree = [], 0
+    for frame in inputs:
+        frame = frame[np.newaxis]
+        expected = reference.predict(frame)
+        actual = engine.predict(frame)
+        diffs.append(float(np.max(np.abs(expected - actual))))
+        agree += int(np.argmax(expected) == np.argmax(actual))
+    return {
+        "max_abs_diff": max(diffs),
+        "mean_abs_diff": float(np.mean(diffs)),
+        "top1_agreement": agree / len(inputs),
+    }
+
+
+def measure_latency(engine, runs=200, warmup=20):
+    """Per-frame latency of single-frame predict calls, in milliseconds"""
+    frame = sample_inputs(1)
+    for _ in range(warmup):
+        engine.predict(frame)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        engine.predict(frame)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings = np.asarray(timings)
+    return {
+        "mean_ms": float(timings.mean()),
+        "p50_ms": float(np.percentile(timings, 50)),
+        "p95_ms": float(np.percentile(timings, 95)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inference backend parity and latency report")
+    parser.add_argument("--model", default=os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                        "model", "sign_model.h5"))
+    parser.add_argument("--backend", default="all", choices=("all",) + BACKENDS)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=None)
+    args = parser.parse_args()
+
+    keras_model = load_keras_model(args.model)
+    reference = KerasEngine(keras_model)
+    backends = BACKENDS if args.backend == "all" else (args.backend,)
+
+    print(f"{'backend':<12} {'engine':<12} {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'max diff':>10} {'top-1':>7}")
+    for backend in backends:
+        engine = create_engine(backend, args.model, args.threads, keras_model)
+        latency = measure_latency(engine, args.runs)
+        parity = check_parity(engine, reference)
+        print(f"{backend:<12} {engine.name:<12} {latency['mean_ms']:>8.2f} {latency['p50_ms']:>8.2f} "
+              f"{latency['p95_ms']:>8.2f} {parity['max_abs_diff']:>10.2e} {parity['top1_agreement']:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Gesture classifier that works on MediaPipe hand landmarks instead of pixels.
+
+The 21 landmarks MediaPipe already returns are normalized (in pixel units,
+wrist at the origin, scaled to unit size) into a 63-float vector and fed to a small MLP
+trained by `1.Model Working logic/train_landmark_model.py`. The MLP weights are
+exported to a plain .npz, so inference is a few NumPy matrix products - tens of
+microseconds, no TensorFlow - and it does not care about lighting or background.
+
+Select it with "recognition_mode": "landmarks" in settings.json. Note that the
+"nothing" gesture has no hand to track, so it can't be predicted in this mode.
+
+normalize_landmarks() is also what train_landmark_model.py trains on, so
+training and inference can't drift apart.
+"""
+import os
+
+import numpy as np
+
+LANDMARK_MODEL_FILE = "landmark_model.npz"
+NUM_FEATURES = 21 * 3
+FEATURE_VERSION = 2         # 2: x/y scaled to pixels before normalizing (aspect-correct)
+
+
+def normalize_landmarks(landmarks, frame_size=(1, 1)):
+    """(21, 3) landmarks -> 63 float32 features, invariant to hand position and size.
+
+    MediaPipe divides x by the frame width and y by its height, so the same
+    hand gives different coordinates in a square training image and a 16:9
+    camera frame. `frame_size` is the (width, height) the landmarks came
+    from; x (and z, which MediaPipe scales like x) is multiplied by the
+    width and y by the height first.
+    """
+    width, height = frame_size
+    points = np.asarray(landmarks, dtype=np.float32).reshape(21, 3) * np.float32((width, height, width))
+    points = points - points[0]                       # Wrist at the origin
+    scale = float(np.max(np.linalg.norm(points[:, :2], axis=1)))
+    if scale > 0:
+        points = points / scale
+    return points.reshape(NUM_FEATURES)
+
+
+class LandmarkClassifier:
+    """NumPy forward pass of the exported landmark MLP (Dense + ReLU layers, softmax output)"""
+    name = "landmarks"
+
+    def __init__(self, path):
+        data = np.load(path, allow_pickle=False)
+        layer_count = int(data["layer_count"])
+        self.weights = [(data[f"w{i}"].astype(np.float32), data[f"b{i}"].astype(np.float32))
+                        for i in range(layer_count)]
+        self.labels = [str(label) for label in data["labels"]]
+        self.feature_version = int(data["feature_version"]) if "feature_version" in data else 1
+        if self.feature_version < FEATURE_VERSION:
+            print(f"⚠️ {os.path.basename(path)} was trained on older landmark features - "
+                  f"re-run train_landmark_model.py for accurate predictions")
+        self.idx_to_label = dict(enumerate(self.labels))
+
+    def predict(self, batch):
+        """(N, 63) normalized features -> (N, classes) probabilities, like the image engines"""
+        x = np.asarray(batch, dtype=np.float32)
+        for i, (w, b) in enumerate(self.weights):
+            x = x @ w + b
+            if i < len(self.weights) - 1:
+                np.maximum(x, 0, out=x)
+        x = np.exp(x - x.max(axis=1, keepdims=True))
+        return x / x.sum(axis=1, keepdims=True)
+
+    def probabilities(self, landmarks, frame_size=(1, 1)):
+        """Class probability vector for one hand's (21, 3) landmarks in a (width, height) frame"""
+        return self.predict(normalize_landmarks(landmarks, frame_size)[np.newaxis])[0]
+
+    def classify(self, landmarks, frame_size=(1, 1)):
+        """Classify one hand; returns (label, confidence)"""
+        probs = self.probabilities(landmarks, frame_size)
+        index = int(np.argmax(probs))
+        return self.labels[index], float(probs[index])
+
+
+def load_landmark_classifier(model_dir):
+    """Return a LandmarkClassifier from model_dir, or None if it hasn't been trained"""
+    path = os.path.join(model_dir, LANDMARK_MODEL_FILE)
+    if not os.path.exists(path):
+        print(f"⚠️ Landmark model not found at {path} - run train_landmark_model.py first")
+        return None
+    return LandmarkClassifier(path)
@@ -4,14 +4,27 @@ import threading
 import cv2
 import numpy as np
 import time
-from tensorflow.keras.models import load_model
-import mediapipe as mp
 import os
 import sys
 from datetime import datetime
 import json
 import queue
-import pyvirtualcam
+import concurrent.futures
+from pipeline import FrameQueue, Pipeline, PipelineStage, ThroughputMeter
+from inference import TFLiteEngine, create_engine, resolve_model_variant
+from detection import draw_hand_box
+from hand_tracking import DETECT_WIDTHS, HandTracker, close_shared_hands, shared_hands, warm_up_hands
+from virtual_camera import PreviewThrottle, VirtualCameraSink
+from overlay import CaptionOverlay
+from caption_writer import CaptionWriter
+from history_store import HistoryStore
+from transcript_view import TranscriptView
+from gui_bus import GuiUpdateBus
+from caption_server import DEFAULT_PORT as CAPTION_SERVER_PORT, CaptionServer
+from metrics import DEFAULT_PORT as METRICS_PORT, METRICS, MetricsServer
+from profiler import DEFAULT_DURATION as PROFILE_SECONDS, Profiler, requested_duration
+from recognizer import DEFAULT_SETTINGS as RECOGNITION_DEFAULTS, SignRecognizer
+from landmark_classifier import LandmarkClassifier, load_landmark_classifier
 
 # === PATH MANAGEMENT FOR PROJECT STRUCTURE ===
 # Get the directory where the main.py script is located
@@ -26,16 +39,59 @@ else:
 model_path = os.path.join(base_path, "model", "sign_model.h5")
 label_map_path = os.path.join(base_path, "model", "label_map.npy")
 caption_output_path = os.path.join(base_path, "dist", "caption_output.txt")
+caption_transcript_path = os.path.join(base_path, "dist", "caption_transcript.txt")
+history_db_path = os.path.join(base_path, "dist", "translation_history.db")
 settings_path = os.path.join(base_path, "settings.json")
 assets_path = os.path.join(base_path, "assets")
+# Stylesheet for the browser-source caption overlay: bundled in assets/, else the website's
+website_styles_path = os.path.join(assets_path, "styles.css")
+if not os.path.exists(website_styles_path):
+    website_styles_path = os.path.join(os.path.dirname(base_path), "3.Website Code", "styles.css")
 icon_path = os.path.join(assets_path, "signbridge_icon.ico")
 
 # Ensure required directories exist
 os.makedirs(os.path.dirname(caption_output_path), exist_ok=True)
 os.makedirs(assets_path, exist_ok=True)
 
+# === SETTINGS ===
+default_settings = {
+    **RECOGNITION_DEFAULTS,  # Thresholds, backend, stabilizer, detection width (shared with transcribe_video.py)
+    "auto_save": True,
+    "dark_mode": True,
+    "show_confidence": True,
+    "camera_index": 0,
+    "virtual_camera": False,  # Send frames straight to OBS Virtual Camera (pyvirtualcam)
+    "preview_fps": 10,  # Preview window rate while the virtual camera is on (0 = no window)
+    "caption_tail_chars": 300,  # Characters kept in caption_output.txt for OBS
+    "caption_server": False,  # Push captions to a localhost browser-source overlay
+    "caption_server_port": CAPTION_SERVER_PORT,
+    "metrics_server": False,  # Serve latency metrics (JSON / Prometheus) on localhost
+    "metrics_port": METRICS_PORT,
+    "profiling": False,  # Record a performance profile at the start of each session
+    "profile_seconds": PROFILE_SECONDS
+}
+
+def load_settings():
+    try:
+        with open(settings_path, 'r') as f:
+            return {**default_settings, **json.load(f)}
+    except:
+        return default_settings.copy()
+
+def save_settings(settings):
+    try:
+        with open(settings_path, 'w') as f:
+            json.dump(settings, f, indent=2)
+    except Exception as e:
+        print(f"Error saving settings: {e}")
+
+settings = load_settings()
+
 # === LOAD MODEL WITH BETTER ERROR HANDLING ===
+# TensorFlow, MediaPipe and the model are loaded on a background thread once the
+# window is up (see start_model_loading); `model_ready` resolves to True/False.
 model_loaded = False
+model_ready = concurrent.futures.Future()
 model = None
 label_map = None
 idx_to_label = None
@@ -44,22 +100,41 @@ IMG_SIZE = 64
 def load_ai_model():
     global model, label_map, idx_to_label, model_loaded
     try:
+        if settings["recognition_mode"] == "landmarks":
+            model = load_landmark_classifier(os.path.dirname(model_path))
+            if model:
+                idx_to_label = model.idx_to_label
+                model_loaded = True
+                print(f"✅ Landmark model loaded successfully! ({len(model.labels)} classes)")
+                return True
+            print("⚠️ Falling back to the image model")
+
         print(f"Loading model from: {model_path}")
         print(f"Loading label map from: {label_map_path}")
         
-        if not os.path.exists(model_path):
-            print(f"Error: Model file not found at {model_path}")
+        # A quantized .tflite variant replaces the .h5 + backend choice entirely
+        variant_path = resolve_model_variant(os.path.dirname(model_path), settings["model_variant"])
+        if variant_path:
+            print(f"Loading model variant from: {variant_path}")
+        weights_path = variant_path or model_path
+
+        if not os.path.exists(weights_path):
+            print(f"Error: Model file not found at {weights_path}")
             return False
             
         if not os.path.exists(label_map_path):
             print(f"Error: Label map file not found at {label_map_path}")
             return False
         
-        model = load_model(model_path)
+        # `model` is an inference engine (see inference.py), not a raw Keras model
+        if variant_path:
+            model = TFLiteEngine(variant_path)
+        else:
+            model = create_engine(settings["inference_backend"], model_path)
         label_map = np.load(label_map_path, allow_pickle=True).item()
         idx_to_label = {v: k for k, v in label_map.items()}
         model_loaded = True
-        print("✅ AI Model loaded successfully!")
+        print(f"✅ AI Model loaded successfully! (backend: {model.name})")
         return True
         
     except Exception as e:
@@ -67,64 +142,73 @@ def load_ai_model():
         model_loaded = False
         return False
 
-# Try to load the model
-load_ai_model()
-
-# === SETTINGS ===
-default_settings = {
-    "confidence_threshold": 0.8,
-    "display_interval": 2.5,
-    "max_caption_length": 35,
-    "auto_save": True,
-    "dark_mode": True,
-    "show_confidence": True,
-    "camera_index": 0
-}
+def warm_up_model():
+    """Run one dummy inference so the first real frame doesn't pay for graph setup"""
+    if isinstance(model, LandmarkClassifier):
+        return  # Plain NumPy, nothing to warm up
+    model.predict(np.zeros((1, IMG_SIZE, IMG_SIZE, 1), dtype=np.float32))
+
+def init_recognizer():
+    """Create the recognition engine that owns all letter/word/caption state"""
+    global recognizer
+    # The MediaPipe graphs are shared and stay warm between Start/Stop sessions
+    recognizer = SignRecognizer(model, idx_to_label, settings, tracker=HandTracker(shared_hands()))
+
+def start_model_loading():
+    """Import TF/MediaPipe and load + warm up the model without blocking the GUI"""
+    def worker():
+        ok = False
+        try:
+            set_gui_state("status", update_status, "⏳ Loading AI model...", COLORS["accent_warning"])
+            ok = load_ai_model()
+            if ok:
+                set_gui_state("status", update_status, "⏳ Loading hand tracker...", COLORS["accent_warning"])
+                warm_up_hands()  # Built here so the first Start doesn't pay for it
+                set_gui_state("status", update_status, "⏳ Warming up...", COLORS["accent_warning"])
+                warm_up_model()
+                init_recognizer()
+                startup_event("first_prediction")
+        except Exception as e:
+            print(f"❌ Model warm-up error: {e}")
+            ok = False
+        model_ready.set_result(ok)
+        queue_gui_update(on_model_ready, ok)
 
-def load_settings():
-    try:
-        with open(settings_path, 'r') as f:
-            return {**default_settings, **json.load(f)}
-    except:
-        return default_settings.copy()
+    threading.Thread(target=worker, daemon=True).start()
 
-def save_settings(settings):
-    try:
-        with open(settings_path, 'w') as f:
-            json.dump(settings, f, indent=2)
-    except Exception as e:
-        print(f"Error saving settings: {e}")
+# Set by bench/startup.py: print startup milestones and exit once the model is warm
+STARTUP_BENCH = bool(os.environ.get("SIGNBRIDGE_STARTUP_BENCH"))
 
-settings = load_settings()
+def startup_event(name):
+    """Print a wall-clock startup milestone for bench/startup.py"""
+    if STARTUP_BENCH:
+        print(f"[startup] {name} {time.time():.6f}", flush=True)
 
 # === STATE VARIABLES ===
 is_running = False
 cap = None
-hands = None
-current_word = ""
-caption_words = []
-next_caption_words = []
-display_caption = ""
-last_display_time = 0
-prediction_buffer = []
-prev_prediction = ""
-frame_threshold = 15
-repeat_delay = 2
-last_update_time = time.time()
-session_stats = {"translations": 0, "words": 0, "session_start": None}
-translation_history = []
+detection_thread = None
+recognizer = None          # SignRecognizer, created once the model is loaded
+caption_overlay = CaptionOverlay()
+caption_writer = None      # CaptionWriter, started in __main__
+caption_server = None      # CaptionServer when the "caption_server" setting is on
+metrics_server = None      # MetricsServer when the "metrics_server" setting is on
+history_store = None       # HistoryStore (SQLite), opened in __main__
 
 # === UI ELEMENTS ===
 root = None
 status_label = None
 prediction_label = None
 translation_text = None
+transcript_view = None     # TranscriptView wrapping translation_text
 confidence_label = None
 stats_frame = None
+metrics_label = None
 progress_var = None
 
-# === THREAD-SAFE GUI UPDATE QUEUE ===
-gui_queue = queue.Queue()
+# === THREAD-SAFE GUI UPDATE BUS ===
+gui_bus = GuiUpdateBus()
+GUI_UPDATE_INTERVAL_MS = 33   # Fixed UI refresh rate (~30 Hz)
 
 # === THEME COLORS ===
 COLORS = {
@@ -143,43 +227,43 @@ COLORS = {
 
 # === THREAD-SAFE GUI UPDATE FUNCTIONS ===
 def process_gui_queue():
-    """Process GUI update queue to handle thread-safe updates"""
-    try:
-        while True:
-            try:
-                func, args = gui_queue.get_nowait()
-                func(*args)
-            except queue.Empty:
-                break
-    except Exception as e:
-        print(f"GUI queue processing error: {e}")
+    """Apply pending GUI updates on the main thread at a fixed rate"""
+    gui_bus.drain()
     
     # Schedule next check
     if root:
-        root.after(100, process_gui_queue)
+        root.after(GUI_UPDATE_INTERVAL_MS, process_gui_queue)
 
 def queue_gui_update(func, *args):
-    """Queue a GUI update to be processed on the main thread"""
-    gui_queue.put((func, args))
+    """Queue a one-off GUI update (dialog, refresh...) to run on the main thread, in order"""
+    gui_bus.post(func, *args)
+
+def queue_gui_content(func, *args):
+    """Like queue_gui_update, but never dropped when the bus overflows (transcript text)"""
+    gui_bus.post(func, *args, droppable=False)
+
+def set_gui_state(key, func, *args):
+    """Queue a GUI update where only the latest value per key matters (labels, status)"""
+    gui_bus.set(key, func, *args)
 
 # === ENHANCED DETECTION LOGIC ===
+PIPELINE_QUEUE_SIZE = 2       # Frames buffered between stages before the oldest is dropped
+THROUGHPUT_REPORT_INTERVAL = 5.0
+METRICS_GUI_INTERVAL = 1.0    # Seconds between latency updates in the stats bar
+
 def run_detection():
-    global cap, hands, is_running
-    global current_word, caption_words, next_caption_words, display_caption
-    global last_display_time, prediction_buffer, prev_prediction, last_update_time
-    global session_stats
+    global cap, is_running
 
-    if not model_loaded:
+    # Start may be pressed while the model is still loading - wait for it here
+    if not model_ready.done():
+        set_gui_state("status", update_status, "⏳ Waiting for AI model...", COLORS["accent_warning"])
+    if not model_ready.result():
+        is_running = False
         queue_gui_update(messagebox.showerror, "Error", "AI Model not loaded. Please check model files.")
         return
 
-    mp_hands = mp.solutions.hands
-    hands = mp_hands.Hands(
-        static_image_mode=False, 
-        max_num_hands=1,
-        min_detection_confidence=0.7, 
-        min_tracking_confidence=0.7
-    )
+    recognizer.tracker.reset()
+    METRICS.reset()
 
     cap = cv2.VideoCapture(settings["camera_index"])
     if not cap.isOpened():
@@ -190,173 +274,152 @@ def run_detection():
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
     cap.set(cv2.CAP_PROP_FPS, 30)
-
-    session_stats["session_start"] = datetime.now()
-    queue_gui_update(update_status, "🟢 Camera Active", COLORS["accent_secondary"])
-    queue_gui_update(update_stats)
+    # Keep the driver buffer short - the pipeline always wants the newest frame
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
+    recognizer.session_stats["session_start"] = datetime.now()
+    history_store.new_session()
+    set_gui_state("status", update_status, "🟢 Camera Active", COLORS["accent_secondary"])
+    set_gui_state("stats", update_stats)
+
+    # With the virtual camera on, the window is only a low-rate local preview;
+    # without it, OBS captures the window, so it shows every frame
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)) or 1280
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) or 720
+    sink = None
+    if settings["virtual_camera"]:
+        sink = VirtualCameraSink(width, height, fps=30)
+        if not sink.start():
+            sink = None
+            set_gui_state("status", update_status, "⚠️ Virtual camera unavailable - using window", COLORS["accent_warning"])
+    preview = PreviewThrottle(settings["preview_fps"]) if sink else None
 
     # Create named OpenCV window for OBS
-    cv2.namedWindow("SignBridge Live", cv2.WINDOW_NORMAL)
-    cv2.resizeWindow("SignBridge Live", 1280, 720)
-
-    while is_running:
-        ret, frame = cap.read()
+    if preview is None or preview.interval:
+        cv2.namedWindow("SignBridge Live", cv2.WINDOW_NORMAL)
+        cv2.resizeWindow("SignBridge Live", 1280, 720)
+
+    # Capture -> landmarks -> inference run in their own threads; this thread
+    # only displays. Queues drop the oldest frame so capture never waits on TF.
+    stop_event = threading.Event()
+    frames = FrameQueue(PIPELINE_QUEUE_SIZE)
+    located = FrameQueue(PIPELINE_QUEUE_SIZE)
+    annotated = FrameQueue(PIPELINE_QUEUE_SIZE)
+
+    def capture_frame():
+        with METRICS.time("capture"):
+            ret, frame = cap.read()
         if not ret:
             print("❌ Failed to capture frame from camera.")
-            break
-
-        h, w, _ = frame.shape
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        result = hands.process(rgb)
-        hand_roi = None
-        current_prediction = "None"
-        confidence = 0.0
-
-        if result.multi_hand_landmarks:
-            for hand_landmarks in result.multi_hand_landmarks:
-                # Extract hand region with better padding
-                x_coords = [lm.x for lm in hand_landmarks.landmark]
-                y_coords = [lm.y for lm in hand_landmarks.landmark]
-                x_min = int(min(x_coords) * w) - 30
-                x_max = int(max(x_coords) * w) + 30
-                y_min = int(min(y_coords) * h) - 30
-                y_max = int(max(y_coords) * h) + 30
-                x_min, y_min = max(x_min, 0), max(y_min, 0)
-                x_max, y_max = min(x_max, w), min(y_max, h)
-                hand_roi = frame[y_min:y_max, x_min:x_max]
-                
-                # Enhanced visual feedback
-                cv2.rectangle(frame, (x_min, y_min), (x_max, y_max), (64, 224, 255), 3)
-                cv2.circle(frame, (int((x_min + x_max) / 2), y_min - 10), 5, (64, 224, 255), -1)
-                break
-        else:
-            current_prediction = "No hand detected"
-            display_enhanced_overlay(frame, current_prediction, 0.0)
-            cv2.imshow("SignBridge Live", frame)  # Display frame in OpenCV window
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                break
+            stop_event.set()
+            return None
+        # The capture time travels with the frame for the end-to-end latency
+        return frame, time.perf_counter()
+
+    pipeline = Pipeline([
+        PipelineStage("capture", capture_frame, None, frames, stop_event),
+        PipelineStage("landmarks", locate_hand, frames, located, stop_event),
+        PipelineStage("inference", classify_hand, located, annotated, stop_event),
+    ], stop_event)
+    display_meter = ThroughputMeter("display")
+    METRICS.watch_meters([stage.meter for stage in pipeline.stages] + [display_meter])
+    last_report = last_metrics_update = time.time()
+    pipeline.start()
+
+    # Profiling mode: stage spans + stack samples of this and the stage threads
+    profile_seconds = requested_duration(settings)
+    profiler = Profiler(os.path.dirname(caption_output_path), profile_seconds).start() if profile_seconds else None
+
+    while is_running and not stop_event.is_set():
+        try:
+            frame, captured_at = annotated.get(timeout=0.1)
+        except queue.Empty:
             continue
 
-        if hand_roi is not None and hand_roi.size > 0:
-            # Enhanced preprocessing
-            gray = cv2.cvtColor(hand_roi, cv2.COLOR_BGR2GRAY)
-            gray = cv2.resize(gray, (IMG_SIZE, IMG_SIZE))
-            gray = gray / 255.0
-            gray = gray.reshape(1, IMG_SIZE, IMG_SIZE, 1)
-            
-            prediction = model.predict(gray, verbose=0)
-            confidence = float(np.max(prediction))
-            pred_class = idx_to_label[np.argmax(prediction)]
-            current_prediction = pred_class
-
-            # Only process if confidence is above threshold
-            if confidence >= settings["confidence_threshold"]:
-                prediction_buffer.append(pred_class)
-                if len(prediction_buffer) > frame_threshold:
-                    prediction_buffer.pop(0)
-
-                if prediction_buffer.count(pred_class) > frame_threshold * 0.8:
-                    current_time = time.time()
-                    if pred_class != prev_prediction or (current_time - last_update_time > repeat_delay):
-                        process_prediction(pred_class)
-                        prev_prediction = pred_class
-                        last_update_time = current_time
-
-            # Update caption display logic
-            time_elapsed = time.time() - last_display_time
-            total_len = sum(len(w) for w in next_caption_words)
-            if ((total_len >= settings["max_caption_length"] or 
-                 len(next_caption_words) >= 1 or 
-                 time_elapsed >= settings["display_interval"]) and next_caption_words):
-                update_display_caption()
-
-        # Update UI elements using thread-safe method
-        queue_gui_update(update_prediction_display, current_prediction, confidence)
-        display_enhanced_overlay(frame, current_prediction, confidence)
-        
-        # Show the frame in OpenCV window
-        cv2.imshow("SignBridge Live", frame)
-
-        # Press 'q' to quit
-        if cv2.waitKey(1) & 0xFF == ord('q'):
+        quit_pressed = False
+        with METRICS.time("output"):
+            if sink:
+                sink.submit(frame)
+            # Show the frame in OpenCV window
+            if preview is None or preview.due():
+                cv2.imshow("SignBridge Live", frame)
+                # Press 'q' to quit
+                quit_pressed = cv2.waitKey(1) & 0xFF == ord('q')
+        METRICS.observe("end_to_end", time.perf_counter() - captured_at)
+        display_meter.tick()
+
+        if time.time() - last_metrics_update >= METRICS_GUI_INTERVAL:
+            set_gui_state("metrics", update_metrics_display)
+            last_metrics_update = time.time()
+
+        if time.time() - last_report >= THROUGHPUT_REPORT_INTERVAL:
+            report = f"{pipeline.report([display_meter])} | {recognizer.tracker.report()}"
+            report += f" | {gui_bus.report()}" + (f" | {sink.report()}" if sink else "")
+            if caption_server:
+                report += f" | {caption_server.report()}"
+            print(f"📊 Pipeline: {report}")
+            print(f"⏱️ Latency: {METRICS.summary_line()}")
+            last_report = time.time()
+
+        if quit_pressed:
             break
 
+    pipeline.stop()
+    if sink:
+        sink.stop()
     cleanup_camera()
     cv2.destroyAllWindows()
-def process_prediction(pred_class):
-    global current_word, next_caption_words, session_stats
+    if profiler and profiler.stop():
+        set_gui_state("status", update_status, f"🔬 Profile saved to {os.path.basename(profiler.path)}",
+                      COLORS["accent_warning"])
+
+def locate_hand(item):
+    """Landmark stage: find the hand and return (frame, Hand or None, capture time)"""
+    frame, captured_at = item
+    return frame, recognizer.locate(frame), captured_at
+
+def classify_hand(item):
+    """Inference stage: classify the hand ROI, update captions and draw the overlay"""
+    frame, hand, captured_at = item
+    events = recognizer.classify(frame, hand)
+
+    for event in events:
+        if event.kind == "prediction":
+            # Update UI elements using thread-safe method
+            set_gui_state("prediction", update_prediction_display, event.value, event.confidence)
+        elif event.kind == "caption":
+            on_caption(event.value)
+        elif caption_server:
+            if event.kind == "letter":
+                caption_server.publish("partial", recognizer.current_word, event.confidence)
+            elif event.kind == "word":
+                caption_server.publish("word", event.value, event.confidence)
+
+    with METRICS.time("overlay"):
+        if hand is not None:
+            # Draw the detection box after cropping so the ROI stays clean
+            draw_hand_box(frame, hand.box)
+        display_enhanced_overlay(frame, recognizer.last_prediction, recognizer.last_confidence)
+    return frame, captured_at
+
+def on_caption(display_caption):
+    """Show a new caption segment in the GUI, the OBS file and the history"""
+    # The writer thread debounces and writes the OBS file + transcript
+    caption_writer.append(display_caption)
+    if caption_server:
+        caption_server.publish("segment", display_caption)
+    if transcript_view:
+        # Appends just this segment; old text is paged out past the visible limit
+        queue_gui_content(transcript_view.append, display_caption)
+    # Queued for the history writer thread; never waits on the database
+    history_store.add(display_caption)
     
-    if pred_class in ["space", "nothing", "del"]:
-        if current_word.strip():
-            end_char = {"space": " ", "nothing": ".", "del": ","}.get(pred_class, "")
-            next_caption_words.append(current_word + end_char)
-            current_word = ""
-            session_stats["words"] += 1
-    else:
-        current_word += pred_class
-
-def update_display_caption():
-    global caption_words, display_caption, next_caption_words, last_display_time, session_stats
-    
-    caption_words = next_caption_words.copy()
-    display_caption = "".join(caption_words).strip()
-    next_caption_words.clear()
-    last_display_time = time.time()
-    session_stats["translations"] += 1
-
-    if translation_text and display_caption:
-        def update_translation_text():
-            # Get existing content from the text widget
-            existing_content = translation_text.get(1.0, tk.END).strip()
-            
-            # Append new translation with space separator
-            if existing_content:
-                updated_content = existing_content + " " + display_caption
-            else:
-                updated_content = display_caption
-            
-            # Update the text widget
-            translation_text.delete(1.0, tk.END)
-            translation_text.insert(1.0, updated_content)
-            
-            # ALWAYS update caption_output.txt with the FULL content for OBS
-            save_translation_to_file(updated_content)
-        
-        queue_gui_update(update_translation_text)
-        
-        # Add to history
-        translation_history.append({
-            "text": display_caption,
-            "timestamp": datetime.now().strftime("%H:%M:%S"),
-            "word_count": len(display_caption.split())
-        })
-    
-    queue_gui_update(update_stats)
+    set_gui_state("stats", update_stats)
 
 def display_enhanced_overlay(frame, prediction, confidence):
-    if display_caption:
-        # Create semi-transparent overlay
-        overlay = frame.copy()
-        h, w = frame.shape[:2]
-        
-        # Background box
-        cv2.rectangle(overlay, (0, h - 80), (w, h), (20, 20, 20), -1)
-        cv2.addWeighted(overlay, 0.8, frame, 0.2, 0, frame)
-        
-        # Main caption text
-        text_size = cv2.getTextSize(display_caption, cv2.FONT_HERSHEY_SIMPLEX, 1.0, 2)[0]
-        text_x = (w - text_size[0]) // 2
-        cv2.putText(frame, display_caption, (text_x, h - 30),
-                    cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255, 255, 255), 2)
-    
-    # Prediction and confidence display
-    pred_text = f"Detecting: {prediction}"
-    conf_text = f"Confidence: {confidence:.2%}" if confidence > 0 else ""
-    
-    cv2.putText(frame, pred_text, (15, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (64, 224, 255), 2)
-    if conf_text and settings["show_confidence"]:
-        color = (0, 255, 0) if confidence >= settings["confidence_threshold"] else (0, 165, 255)
-        cv2.putText(frame, conf_text, (15, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, color, 2)
+    # Only the caption strip is blended; caption rasters are cached (see overlay.py)
+    caption_overlay.draw(frame, recognizer.display_caption, prediction, confidence,
+                         settings["show_confidence"], settings["confidence_threshold"])
 
 def cleanup_camera():
     global cap, is_running
@@ -364,50 +427,17 @@ def cleanup_camera():
     if cap:
         cap.release()
     cv2.destroyAllWindows()
-    queue_gui_update(update_status, "🔴 Camera Inactive", COLORS["accent_danger"])
+    set_gui_state("status", update_status, "🔴 Camera Inactive", COLORS["accent_danger"])
 
 def save_translation_to_file(text):
-    """Save translation to the main caption_output.txt file for OBS integration"""
-    try:
-        with open(caption_output_path, "w", encoding="utf-8") as f:
-            f.write(text)
-        print(f"✅ Caption updated in OBS file: {text[:50]}...")
-    except Exception as e:
-        print(f"[ERROR] Could not write to caption_output.txt: {e}")
-
-def append_to_caption_file(text):
-    """Append new translation to caption_output.txt (for cumulative display)"""
-    try:
-        # Read existing content
-        existing_content = ""
-        if os.path.exists(caption_output_path):
-            with open(caption_output_path, "r", encoding="utf-8") as f:
-                existing_content = f.read().strip()
-        
-        # Append new text with space separator
-        if existing_content:
-            updated_content = existing_content + " " + text
-        else:
-            updated_content = text
-        
-        # Write back the combined content
-        with open(caption_output_path, "w", encoding="utf-8") as f:
-            f.write(updated_content)
-        
-        print(f"✅ Caption appended to OBS file: {text[:30]}...")
-        return updated_content
-    except Exception as e:
-        print(f"[ERROR] Could not append to caption_output.txt: {e}")
-        return text
+    """Show `text` in caption_output.txt for OBS (written by the caption writer thread)"""
+    caption_writer.replace(text)
 
 def clear_caption_file():
     """Clear the caption_output.txt file"""
-    try:
-        with open(caption_output_path, "w", encoding="utf-8") as f:
-            f.write("")
-        print("✅ Caption file cleared for new session")
-    except Exception as e:
-        print(f"[ERROR] Could not clear caption_output.txt: {e}")
+    caption_writer.clear()
+    if caption_server:
+        caption_server.publish("clear", "")
 
 # === UI UPDATE FUNCTIONS ===
 def update_status(text, color):
@@ -423,7 +453,8 @@ def update_prediction_display(prediction, confidence):
         confidence_label.config(text=conf_text, fg=color)
 
 def update_stats():
-    if stats_frame and session_stats["session_start"]:
+    session_stats = recognizer.session_stats if recognizer else {}
+    if stats_frame and session_stats.get("session_start"):
         duration = datetime.now() - session_stats["session_start"]
         duration_str = str(duration).split('.')[0]  # Remove microseconds
         
@@ -433,14 +464,52 @@ def update_stats():
                 widget.config(text=stats_text)
                 break
 
+def update_metrics_display():
+    if metrics_label:
+        metrics_label.config(text=f"⏱️ {METRICS.summary_line() or 'Measuring...'}")
+
+def on_model_ready(ok):
+    """Called on the main thread once background model loading finishes"""
+    if ok:
+        if not is_running:
+            update_status("🔴 Camera Inactive", COLORS["accent_danger"])
+        print("✅ All systems ready!")
+        if STARTUP_BENCH:
+            root.after(0, root.destroy)
+        return
+
+    update_status("⚠️ Model Not Loaded", COLORS["accent_warning"])
+    if STARTUP_BENCH:
+        root.after(0, root.destroy)
+        return
+    error_msg = f"""⚠️ AI Model Loading Issue
+
+The following files are required in your project structure:
+• {model_path}
+• {label_map_path}
+
+Current folder structure should be:
+📁 SIGNBRIDGEPROJECT/
+├── 📁 model/
+│   ├── sign_model.h5
+│   └── label_map.npy
+├── 📁 assets/
+├── 📁 dist/
+└── main.py
+
+Please ensure these files exist and restart the application."""
+    
+    messagebox.showwarning("Model Files Missing", error_msg)
+
 # === MAIN FUNCTIONS ===
 def start_translation():
-    global is_running
+    global is_running, detection_thread
     if not is_running:
         # Clear the caption file for a fresh start
         clear_caption_file()
         is_running = True
-        threading.Thread(target=run_detection, daemon=True).start()
+        detection_thread = threading.Thread(target=run_detection, name="SignBridge-detection", daemon=True)
+        detection_thread.start()
         show_obs_info()
 
 def stop_translation():
@@ -555,9 +624,11 @@ Access the Settings menu to customize:
 def show_settings():
     settings_window = tk.Toplevel(root)
     settings_window.title("SignBridge Pro - Settings")
-    settings_window.geometry("500x600")
+    # 800 px tall at most, and never taller than the screen (768 px laptops); resizable either way
+    height = min(800, settings_window.winfo_screenheight() - 100)
+    settings_window.geometry(f"500x{height}")
+    settings_window.minsize(400, 300)
     settings_window.configure(bg=COLORS["bg_primary"])
-    settings_window.resizable(False, False)
     
     # Make window modal
     settings_window.transient(root)
@@ -569,9 +640,24 @@ def show_settings():
                           bg=COLORS["bg_primary"], fg=COLORS["text_primary"])
     title_label.pack(pady=20)
     
-    # Settings frame
-    settings_frame = tk.Frame(settings_window, bg=COLORS["bg_primary"])
-    settings_frame.pack(fill='both', expand=True, padx=20)
+    # Buttons are packed first, at the bottom, so they stay visible when the rows above don't fit
+    btn_frame = tk.Frame(settings_window, bg=COLORS["bg_primary"])
+    btn_frame.pack(side='bottom', pady=20)
+    
+    # Settings frame, in a canvas so it scrolls when the window is shorter than the rows
+    settings_canvas = tk.Canvas(settings_window, bg=COLORS["bg_primary"], highlightthickness=0)
+    settings_scrollbar = tk.Scrollbar(settings_window, orient='vertical', command=settings_canvas.yview)
+    settings_canvas.configure(yscrollcommand=settings_scrollbar.set)
+    settings_scrollbar.pack(side='right', fill='y')
+    settings_canvas.pack(side='left', fill='both', expand=True, padx=(20, 0))
+    settings_frame = tk.Frame(settings_canvas, bg=COLORS["bg_primary"])
+    settings_frame_id = settings_canvas.create_window((0, 0), window=settings_frame, anchor='nw')
+    settings_frame.bind("<Configure>",
+                        lambda e: settings_canvas.configure(scrollregion=settings_canvas.bbox("all")))
+    settings_canvas.bind("<Configure>",
+                         lambda e: settings_canvas.itemconfigure(settings_frame_id, width=e.width - 20))
+    settings_window.bind("<MouseWheel>",
+                         lambda e: settings_canvas.yview_scroll(-1 if e.delta > 0 else 1, "units"))
     
     # Confidence threshold
     conf_frame = tk.Frame(settings_frame, bg=COLORS["bg_primary"])
@@ -616,6 +702,8 @@ def show_settings():
     auto_save_var = tk.BooleanVar(value=settings["auto_save"])
     show_conf_var = tk.BooleanVar(value=settings["show_confidence"])
     virtual_cam_var = tk.BooleanVar(value=settings.get("virtual_camera", False))  # Default: Virtual camera off
+    caption_server_var = tk.BooleanVar(value=settings.get("caption_server", False))
+    profiling_var = tk.BooleanVar(value=settings.get("profiling", False))
     
     tk.Checkbutton(settings_frame, text="Auto-save translations", variable=auto_save_var,
                    bg=COLORS["bg_primary"], fg=COLORS["text_primary"], 
@@ -632,6 +720,17 @@ def show_settings():
                    selectcolor=COLORS["bg_secondary"],
                    font=("Segoe UI", 11)).pack(anchor='w', pady=5)
     
+    tk.Checkbutton(settings_frame, text="Caption overlay server (OBS Browser Source)", variable=caption_server_var,
+                   bg=COLORS["bg_primary"], fg=COLORS["text_primary"], 
+                   selectcolor=COLORS["bg_secondary"],
+                   font=("Segoe UI", 11)).pack(anchor='w', pady=5)
+    
+    tk.Checkbutton(settings_frame, text=f"Record a performance profile (first {settings['profile_seconds']:.0f} s of each session)",
+                   variable=profiling_var,
+                   bg=COLORS["bg_primary"], fg=COLORS["text_primary"], 
+                   selectcolor=COLORS["bg_secondary"],
+                   font=("Segoe UI", 11)).pack(anchor='w', pady=5)
+    
     # Camera selection
     camera_frame = tk.Frame(settings_frame, bg=COLORS["bg_primary"])
     camera_frame.pack(fill='x', pady=10)
@@ -644,32 +743,19 @@ def show_settings():
                             font=("Segoe UI", 11))
     camera_spin.pack(fill='x', pady=5)
     
-    def save_and_close():
-        global settings
-        settings.update({
-            "confidence_threshold": conf_var.get(),
-            "display_interval": interval_var.get(),
-            "max_caption_length": length_var.get(),
-            "auto_save": auto_save_var.get(),
-            "show_confidence": show_conf_var.get(),
-            "virtual_camera": virtual_cam_var.get(),  # Save virtual camera setting
-            "camera_index": camera_var.get()
-        })
-        save_settings(settings)
-        settings_window.destroy()
-        messagebox.showinfo("Settings", "Settings saved successfully!")
-    
-    # Buttons
-    btn_frame = tk.Frame(settings_window, bg=COLORS["bg_primary"])
-    btn_frame.pack(pady=20)
-    
-    tk.Button(btn_frame, text="💾 Save Settings", command=save_and_close,
-              bg=COLORS["accent_secondary"], fg="white", 
-              font=("Segoe UI", 11, "bold"), padx=20, pady=8, relief="flat").pack(side='left', padx=10)
+    # Hand detection resolution
+    detect_frame = tk.Frame(settings_frame, bg=COLORS["bg_primary"])
+    detect_frame.pack(fill='x', pady=10)
+    tk.Label(detect_frame, text="Hand Detection Width (lower = faster):", 
+             bg=COLORS["bg_primary"], fg=COLORS["text_primary"], 
+             font=("Segoe UI", 11)).pack(anchor='w')
+    detect_choices = [str(width) if width else "Native" for width in DETECT_WIDTHS]
+    detect_var = tk.StringVar(value=str(settings["detection_width"]) if settings["detection_width"] else "Native")
+    detect_menu = tk.OptionMenu(detect_frame, detect_var, *detect_choices)
+    detect_menu.config(bg=COLORS["bg_secondary"], fg=COLORS["text_primary"],
+                       font=("Segoe UI", 11), highlightthickness=0, relief="flat")
+    detect_menu.pack(fill='x', pady=5)
     
-    tk.Button(btn_frame, text="❌ Cancel", command=settings_window.destroy,
-              bg=COLORS["accent_danger"], fg="white", 
-              font=("Segoe UI", 11, "bold"), padx=20, pady=8, relief="flat").pack(side='left', padx=10)
     def save_and_close():
         global settings
         settings.update({
@@ -678,16 +764,18 @@ def show_settings():
             "max_caption_length": length_var.get(),
             "auto_save": auto_save_var.get(),
             "show_confidence": show_conf_var.get(),
-            "camera_index": camera_var.get()
+            "virtual_camera": virtual_cam_var.get(),  # Save virtual camera setting
+            "caption_server": caption_server_var.get(),
+            "profiling": profiling_var.get(),
+            "camera_index": camera_var.get(),
+            "detection_width": 0 if detect_var.get() == "Native" else int(detect_var.get())
         })
         save_settings(settings)
+        apply_caption_server_setting()
         settings_window.destroy()
         messagebox.showinfo("Settings", "Settings saved successfully!")
     
     # Buttons
-    btn_frame = tk.Frame(settings_window, bg=COLORS["bg_primary"])
-    btn_frame.pack(pady=20)
-    
     tk.Button(btn_frame, text="💾 Save Settings", command=save_and_close,
               bg=COLORS["accent_secondary"], fg="white", 
               font=("Segoe UI", 11, "bold"), padx=20, pady=8, relief="flat").pack(side='left', padx=10)
@@ -696,6 +784,17 @@ def show_settings():
               bg=COLORS["accent_danger"], fg="white", 
               font=("Segoe UI", 11, "bold"), padx=20, pady=8, relief="flat").pack(side='left', padx=10)
 
+def apply_caption_server_setting():
+    """Start or stop the browser-source caption server to match the settings"""
+    global caption_server
+    if settings["caption_server"] and not caption_server:
+        server = CaptionServer(port=settings["caption_server_port"], stylesheet_path=website_styles_path)
+        if server.start():
+            caption_server = server
+    elif not settings["caption_server"] and caption_server:
+        caption_server.stop()
+        caption_server = None
+
 def setup_meeting_mode():
     """Configure optimized settings for real-time meetings"""
     global settings
@@ -772,10 +871,10 @@ def restore_settings_backup():
     return False
 
 def show_history():
-    """Show translation history in a new window"""
+    """Show translation history in a new window, one page at a time"""
     history_window = tk.Toplevel(root)
     history_window.title("SignBridge Pro - Translation History")
-    history_window.geometry("700x500")
+    history_window.geometry("760x560")
     history_window.configure(bg=COLORS["bg_primary"])
     
     # Make window modal
@@ -786,9 +885,19 @@ def show_history():
     title_label = tk.Label(history_window, text="📜 Translation History", 
                           font=("Segoe UI", 16, "bold"), 
                           bg=COLORS["bg_primary"], fg=COLORS["text_primary"])
-    title_label.pack(pady=20)
+    title_label.pack(pady=(20, 10))
+    
+    # Search and filter
+    filter_frame = tk.Frame(history_window, bg=COLORS["bg_primary"])
+    filter_frame.pack(fill='x', padx=20, pady=(0, 10))
+    search_var = tk.StringVar()
+    session_only_var = tk.BooleanVar(value=False)
+    search_entry = tk.Entry(filter_frame, textvariable=search_var, font=("Segoe UI", 11),
+                            bg=COLORS["bg_tertiary"], fg=COLORS["text_primary"],
+                            insertbackground=COLORS["text_primary"], relief="flat")
+    search_entry.pack(side='left', fill='x', expand=True, ipady=4)
     
-    # Create treeview for history
+    # Create treeview for history; it only ever holds the current page
     columns = ("Time", "Translation", "Words")
     tree = ttk.Treeview(history_window, columns=columns, show="headings", height=15)
     
@@ -797,22 +906,121 @@ def show_history():
     tree.heading("Translation", text="Translation")
     tree.heading("Words", text="Words")
     
-    tree.column("Time", width=100)
-    tree.column("Translation", width=400)
-    tree.column("Words", width=80)
+    tree.column("Time", width=140)
+    tree.column("Translation", width=460)
+    tree.column("Words", width=60)
     
-    # Add data
-    for item in translation_history:
-        tree.insert("", "end", values=(item["timestamp"], item["text"], item["word_count"]))
+    tree.pack(fill='both', expand=True, padx=20)
     
-    tree.pack(fill='both', expand=True, padx=20, pady=(0, 20))
+    # Paging: keyset cursors into the store, newest first
+    page_frame = tk.Frame(history_window, bg=COLORS["bg_primary"])
+    page_frame.pack(fill='x', padx=20, pady=10)
+    page_label = tk.Label(page_frame, text="", font=("Segoe UI", 10),
+                          bg=COLORS["bg_primary"], fg=COLORS["text_secondary"])
+    view = {"rows": [], "offset": 0, "total": 0, "query": 0}
+    
+    def filters():
+        return {"session": history_store.session if session_only_var.get() else None,
+                "query": search_var.get().strip() or None}
+    
+    def show_rows(rows, offset):
+        view["rows"], view["offset"] = rows, offset
+        tree.delete(*tree.get_children())
+        for _, _, ts, text, word_count in rows:
+            tree.insert("", "end", values=(datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S"),
+                                           text, word_count))
+        if rows:
+            page_label.config(text=f"Showing {offset + 1:,}-{offset + len(rows):,} of {view['total']:,}")
+        else:
+            page_label.config(text="No translations")
+    
+    def run_query(query, apply):
+        """Run `query` on a worker thread, then `apply(result)` on the GUI thread.
+        
+        A search over a long history can take a while, so the window stays
+        responsive; results of a query overtaken by a newer one are dropped.
+        """
+        view["query"] += 1
+        token = view["query"]
+        page_label.config(text="Loading...")
+        
+        def finish(result):
+            if history_window.winfo_exists() and token == view["query"]:
+                apply(result)
+        
+        def worker():
+            try:
+                result = query()
+            except Exception as e:
+                print(f"[ERROR] History query failed: {e}")
+                result = None
+            queue_gui_content(finish, result)
+        
+        threading.Thread(target=worker, name="history-query", daemon=True).start()
+    
+    def refresh(event=None):
+        query_filters = filters()
+        
+        def query():
+            # Show captions still queued for the writer thread too
+            history_store.flush()
+            return history_store.count(**query_filters), history_store.page(**query_filters)
+        
+        def apply(result):
+            view["total"], rows = result or (0, [])
+            show_rows(rows, 0)
+        run_query(query, apply)
+    
+    def older_page():
+        rows, offset = view["rows"], view["offset"]
+        if rows and offset + len(rows) < view["total"]:
+            query_filters = filters()
+            
+            def apply(older):
+                if older:
+                    show_rows(older, offset + len(rows))
+                else:
+                    show_rows(rows, offset)
+            run_query(lambda: history_store.page(before=(rows[-1][2], rows[-1][0]), **query_filters), apply)
+    
+    def newer_page():
+        rows, offset = view["rows"], view["offset"]
+        if rows and offset > 0:
+            query_filters = filters()
+            
+            def apply(newer):
+                if newer:
+                    show_rows(newer, max(0, offset - len(newer)))
+                else:
+                    show_rows(rows, offset)
+            run_query(lambda: history_store.page(after=(rows[0][2], rows[0][0]), **query_filters), apply)
+    
+    tk.Button(filter_frame, text="🔍 Search", command=refresh,
+              bg=COLORS["accent_primary"], fg="white",
+              font=("Segoe UI", 10, "bold"), padx=12, relief="flat").pack(side='left', padx=(10, 0))
+    tk.Checkbutton(filter_frame, text="This session only", variable=session_only_var, command=refresh,
+                   bg=COLORS["bg_primary"], fg=COLORS["text_primary"], selectcolor=COLORS["bg_tertiary"],
+                   activebackground=COLORS["bg_primary"], font=("Segoe UI", 10)).pack(side='left', padx=(10, 0))
+    search_entry.bind("<Return>", refresh)
+    
+    tk.Button(page_frame, text="◀ Newer", command=newer_page,
+              bg=COLORS["bg_tertiary"], fg="white", font=("Segoe UI", 10), padx=12, relief="flat").pack(side='left')
+    tk.Button(page_frame, text="Older ▶", command=older_page,
+              bg=COLORS["bg_tertiary"], fg="white", font=("Segoe UI", 10), padx=12, relief="flat").pack(side='right')
+    page_label.pack(side='left', expand=True)
+    
+    def refresh_if_open():
+        if history_window.winfo_exists():
+            refresh()
+    
+    refresh()
     
     # Buttons
     btn_frame = tk.Frame(history_window, bg=COLORS["bg_primary"])
     btn_frame.pack(pady=(0, 20))
     
     def export_history():
-        if not translation_history:
+        if not view["total"]:
             messagebox.showwarning("Export", "No translation history to export!")
             return
         
@@ -836,61 +1044,50 @@ def show_history():
                 title="Export Translation History"
             )
             if filename:
-                try:
-                    if filename.endswith('.json'):
-                        # Export as JSON for structured data
-                        with open(filename, 'w', encoding='utf-8') as f:
-                            json.dump({
-                                "export_info": {
-                                    "app": "SignBridge Pro",
-                                    "version": "2.0",
-                                    "export_date": datetime.now().isoformat(),
-                                    "total_translations": len(translation_history)
-                                },
-                                "translations": translation_history
-                            }, f, indent=2, ensure_ascii=False)
-                    else:
-                        # Export as text
-                        with open(filename, 'w', encoding='utf-8') as f:
-                            f.write("SignBridge Pro - Translation History\n")
-                            f.write("=" * 50 + "\n")
-                            f.write(f"Export Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                            f.write(f"Total Translations: {len(translation_history)}\n")
-                            f.write("=" * 50 + "\n\n")
-                            for i, item in enumerate(translation_history, 1):
-                                f.write(f"Translation #{i}\n")
-                                f.write(f"Time: {item['timestamp']}\n")
-                                f.write(f"Text: {item['text']}\n")
-                                f.write(f"Word Count: {item['word_count']}\n")
-                                f.write("-" * 30 + "\n")
-                    messagebox.showinfo("Export", f"History exported successfully to:\n{filename}")
-                except Exception as e:
-                    messagebox.showerror("Export Error", f"Failed to export history:\n{str(e)}")
+                # Rows are streamed from the database into the file on a worker thread,
+                # so a long history neither freezes the window nor gets loaded into memory
+                export = history_store.export_json if filename.endswith('.json') else history_store.export_text
+                export_filters = filters()
+                page_label.config(text="Exporting...")
+                
+                def run_export():
+                    try:
+                        history_store.flush()
+                        count = export(filename, **export_filters)
+                        queue_gui_update(messagebox.showinfo, "Export",
+                                         f"{count:,} translations exported successfully to:\n{filename}")
+                    except Exception as e:
+                        queue_gui_update(messagebox.showerror, "Export Error", f"Failed to export history:\n{str(e)}")
+                    queue_gui_update(refresh_if_open)
+                
+                threading.Thread(target=run_export, name="history-export", daemon=True).start()
         else:  # NO - Update main OBS file with full history
             try:
-                # Combine all translations into one text
-                full_history_text = " ".join([item["text"] for item in translation_history])
+                # Only the newest captions fit in the OBS tail and the transcript box,
+                # so only those are read back from the database
+                max_chars = transcript_view.max_chars if transcript_view else settings["caption_tail_chars"]
+                full_history_text = history_store.recent_text(max_chars, session=filters()["session"])
                 save_translation_to_file(full_history_text)
                 
                 # Also update the main text widget
-                if translation_text:
-                    translation_text.delete(1.0, tk.END)
-                    translation_text.insert(1.0, full_history_text)
+                if transcript_view:
+                    transcript_view.set_text(full_history_text)
                 
                 messagebox.showinfo("History Updated", 
-                    f"✅ Full translation history saved to OBS file:\n{caption_output_path}\n\nOBS will now show the complete session text!")
+                    f"✅ Translation history sent to OBS file:\n{caption_output_path}\n\n"
+                    f"OBS shows the latest {settings['caption_tail_chars']} characters; "
+                    f"the full text is kept in:\n{caption_transcript_path}")
             except Exception as e:
                 messagebox.showerror("Update Error", f"Failed to update OBS file:\n{str(e)}")
     
     def clear_history():
-        global translation_history
         if messagebox.askyesno("Clear History", "Are you sure you want to clear all translation history?"):
-            translation_history.clear()
-            tree.delete(*tree.get_children())
+            history_store.clear()
+            refresh()   # Waits for the clear on its worker thread
             # Also clear the main caption file
             clear_caption_file()
-            if translation_text:
-                translation_text.delete(1.0, tk.END)
+            if transcript_view:
+                transcript_view.clear()
             messagebox.showinfo("Cleared", "History and OBS caption file cleared!")
     
     tk.Button(btn_frame, text="📤 Export", command=export_history,
@@ -912,12 +1109,23 @@ def on_closing():
         if cap:
             cap.release()
         cv2.destroyAllWindows()
+        # Let the pipeline finish its current frame before closing MediaPipe
+        if detection_thread:
+            detection_thread.join(timeout=5)
+        close_shared_hands()
+        caption_writer.close()
+        history_store.close()
+        if caption_server:
+            caption_server.stop()
+        if metrics_server:
+            metrics_server.stop()
         root.quit()
         root.destroy()
 
 # === ENHANCED GUI SETUP ===
 def create_gui():
-    global root, status_label, prediction_label, translation_text, confidence_label, stats_frame
+    global root, status_label, prediction_label, translation_text, transcript_view, confidence_label, stats_frame
+    global metrics_label
 
     root = tk.Tk()
     root.title("SignBridge Pro - AI Sign Language Translator")
@@ -935,7 +1143,7 @@ def create_gui():
         print(f"Could not load icon: {e}")
 
     # Start GUI queue processing
-    root.after(100, process_gui_queue)
+    root.after(GUI_UPDATE_INTERVAL_MS, process_gui_queue)
 
     # Create main container
     main_container = tk.Frame(root, bg=COLORS["bg_primary"])
@@ -1052,19 +1260,16 @@ def create_gui():
     restore_btn.pack(side='left', padx=5)
 
     def clear_translation():
-        if translation_text:
-            translation_text.delete(1.0, tk.END)
+        if transcript_view:
+            transcript_view.clear()
         # Also clear the caption file for OBS
         clear_caption_file()
-        global display_caption, current_word, caption_words, next_caption_words
-        display_caption = ""
-        current_word = ""
-        caption_words.clear()
-        next_caption_words.clear()
+        if recognizer:
+            recognizer.clear_caption()
 
     def save_translation():
-        if translation_text:
-            content = translation_text.get(1.0, tk.END).strip()
+        if transcript_view:
+            content = transcript_view.text()
             if content:
                 # Update caption_output.txt with current content (for OBS)
                 save_translation_to_file(content)
@@ -1158,6 +1363,8 @@ Would you like to ALSO export a backup copy to a separate file?""")
     
     scrollbar.pack(side='right', fill='y')
     translation_text.pack(side='left', fill='both', expand=True)
+    transcript_view = TranscriptView(translation_text, paged_note=os.path.basename(caption_transcript_path),
+                                     muted_color=COLORS["text_muted"])
 
     # Update word count function
     def update_word_count(*args):
@@ -1181,6 +1388,12 @@ Would you like to ALSO export a backup copy to a separate file?""")
                           bg=COLORS["bg_secondary"], fg=COLORS["text_muted"])
     stats_label.pack()
 
+    # Live FPS / latency percentiles (see metrics.py)
+    metrics_label = tk.Label(stats_frame, text="", 
+                             font=("Segoe UI", 10), 
+                             bg=COLORS["bg_secondary"], fg=COLORS["text_muted"])
+    metrics_label.pack()
+
     # Footer info
     footer_info = tk.Frame(footer_frame, bg=COLORS["bg_secondary"])
     footer_info.pack(pady=(0, 15))
@@ -1271,30 +1484,6 @@ Would you like to ALSO export a backup copy to a separate file?""")
                         pady=5)
     tip_label.pack(side='bottom', fill='x')
 
-    # Initial model status check and setup
-    if not model_loaded:
-        status_label.config(text="⚠️ Model Not Loaded", fg=COLORS["accent_warning"])
-        error_msg = f"""⚠️ AI Model Loading Issue
-
-The following files are required in your project structure:
-• {model_path}
-• {label_map_path}
-
-Current folder structure should be:
-📁 SIGNBRIDGEPROJECT/
-├── 📁 model/
-│   ├── sign_model.h5
-│   └── label_map.npy
-├── 📁 assets/
-├── 📁 dist/
-└── main.py
-
-Please ensure these files exist and restart the application."""
-        
-        messagebox.showwarning("Model Files Missing", error_msg)
-    else:
-        print("✅ All systems ready!")
-
     return root
 
 # === MAIN EXECUTION ===
@@ -1313,6 +1502,17 @@ if __name__ == "__main__":
         settings = load_settings()
         print(f"⚙️ Settings loaded: {settings}")
         
+        # Caption files for OBS are written on a background thread
+        caption_writer = CaptionWriter(caption_output_path, caption_transcript_path,
+                                       settings["caption_tail_chars"]).start()
+        history_store = HistoryStore(history_db_path).start()
+        print(f"📜 Translation history: {history_db_path}")
+        apply_caption_server_setting()
+        if settings["metrics_server"]:
+            metrics_server = MetricsServer(port=settings["metrics_port"])
+            if not metrics_server.start():
+                metrics_server = None
+        
         # Create and setup GUI
         root = create_gui()
         
@@ -1324,9 +1524,13 @@ if __name__ == "__main__":
         y = (root.winfo_screenheight() // 2) - (height // 2)
         root.geometry(f"{width}x{height}+{x}+{y}")
         
-        # Show welcome message only if model is loaded
-        if model_loaded:
-            welcome_msg = """🎉 Welcome to SignBridge Pro v2.0!
+        # Window is up - now load TF, MediaPipe and the model in the background
+        root.after(0, startup_event, "window")
+        start_model_loading()
+
+        # The welcome message no longer waits for the model; a load failure
+        # is reported separately by on_model_ready()
+        welcome_msg = """🎉 Welcome to SignBridge Pro v2.0!
 
 ✨ Enhanced Features:
 • Real-time AI sign language translation
@@ -1345,24 +1549,8 @@ if __name__ == "__main__":
 • Ctrl+S to save current translation
 
 Click 'Instructions' for complete guidance or 'Start Translation' to begin your session."""
-        else:
-            welcome_msg = """⚠️ SignBridge Pro - Setup Required
-
-Please ensure your project has the required AI model files:
-
-📁 Required Structure:
-SIGNBRIDGEPROJECT/
-├── 📁 model/
-│   ├── sign_model.h5      ← AI model file
-│   └── label_map.npy      ← Label mapping
-├── 📁 assets/
-├── 📁 dist/
-└── main.py
-
-Once you have these files, restart the application.
-Contact support if you need the model files."""
-        
-        messagebox.showinfo("SignBridge Pro v2.0", welcome_msg)
+        if not STARTUP_BENCH:
+            messagebox.showinfo("SignBridge Pro v2.0", welcome_msg)
         
         print("✅ GUI initialized successfully!")
         print("🎯 Application ready for use!")
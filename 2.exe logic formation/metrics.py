@@ -0,0 +1,237 @@
+"""Low-overhead latency histograms for the recognition hot path.
+
+Every pipeline step wraps its work in `with METRICS.time("name"):`, which
+records the monotonic (perf_counter) duration in a LatencyHistogram. A
+histogram is a fixed array of log-spaced buckets (each ~9% wider than the
+last, 10 us to 100 s), so recording costs one log() and one increment. Memory
+stays constant however long the session runs, and p50/p95/p99 are accurate to
+one bucket width.
+
+The stages recorded by the app are:
+
+    capture      cap.read()
+    color        BGR -> RGB conversion for MediaPipe
+    hands        hands.process()
+    roi_crop     cutting the hand out of the frame
+    preprocess   grayscale/resize/normalize of the crop
+    inference    the classifier
+    stabilizer   stabilizer update and letter/word commit
+    overlay      hand box and caption overlay
+    output       virtual camera hand-off and preview window
+    end_to_end   camera frame read -> frame shown
+
+METRICS.snapshot() returns everything as a dict, and MetricsServer exposes it
+on localhost as JSON (/metrics.json) and Prometheus text (/metrics).
+"""
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_PORT = 8766
+BUCKET_MIN = 1e-5           # 10 us: everything faster lands in the first bucket
+BUCKET_GROWTH = 2 ** 0.125  # ~9% per bucket
+BUCKET_COUNT = 188          # Up to ~100 s
+QUANTILES = (0.5, 0.95, 0.99)
+_INV_LOG_GROWTH = 1 / math.log(BUCKET_GROWTH)
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram of durations in seconds"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.buckets = [0] * BUCKET_COUNT
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    def record(self, seconds):
+        if seconds <= BUCKET_MIN:
+            index = 0
+        else:
+            index = min(BUCKET_COUNT - 1, int(math.log(seconds / BUCKET_MIN) * _INV_LOG_GROWTH) + 1)
+        with self._lock:
+            self.buckets[index] += 1
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+
+    def percentile(self, q):
+        """Upper edge of the bucket holding the q-th quantile (never above the max seen)"""
+        with self._lock:
+            if not self.count:
+                return 0.0
+            target = q * self.count
+            seen = 0
+            for index, n in enumerate(self.buckets):
+                seen += n
+                if seen >= target and n:
+                    return min(BUCKET_MIN * BUCKET_GROWTH ** index, self.max)
+            return self.max
+
+    def summary(self):
+        """Dict of count, mean/max and p50/p95/p99 in milliseconds"""
+        summary = {"count": self.count,
+                   "mean_ms": round(self.total / self.count * 1e3, 3) if self.count else 0.0,
+                   "max_ms": round(self.max * 1e3, 3)}
+        for q in QUANTILES:
+            summary[f"p{int(q * 100)}_ms"] = round(self.percentile(q) * 1e3, 3)
+        return summary
+
+
+class _Timer:
+    __slots__ = ("metrics", "name", "start")
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        self.metrics.histogram(self.name).record(end - self.start)
+        tracer = self.metrics.tracer
+        if tracer is not None:
+            tracer.add_span(self.name, self.start, end)
+        return False
+
+
+class Metrics:
+    """Named latency histograms plus the FPS of the pipeline's ThroughputMeters"""
+
+    def __init__(self):
+        self.histograms = {}
+        self.meters = []
+        self.started = time.time()
+        # Set by profiler.Profiler to also receive every timed span
+        self.tracer = None
+        self._lock = threading.Lock()
+
+    def histogram(self, name):
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self.histograms.setdefault(name, LatencyHistogram())
+        return histogram
+
+    def time(self, name):
+        """Context manager recording the duration of the block under `name`"""
+        return _Timer(self, name)
+
+    def observe(self, name, seconds):
+        self.histogram(name).record(seconds)
+        tracer = self.tracer
+        if tracer is not None:
+            end = time.perf_counter()
+            tracer.add_span(name, end - seconds, end)
+
+    def watch_meters(self, meters):
+        """Report the rates of these ThroughputMeters (replaces the previous ones)"""
+        self.meters = list(meters)
+
+    def reset(self):
+        """Start a new session: clear the histograms and the watched meters"""
+        for histogram in list(self.histograms.values()):
+            histogram.reset()
+        self.meters = []
+        self.started = time.time()
+
+    def snapshot(self):
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "fps": {meter.name: round(meter.fps, 2) for meter in self.meters},
+            "stages": {name: histogram.summary() for name, histogram in list(self.histograms.items())
+                       if histogram.count},
+        }
+
+    def summary_line(self):
+        """One line for the GUI stats bar"""
+        fps = {meter.name: meter.fps for meter in self.meters}
+        parts = []
+        if "display" in fps:
+            parts.append(f"{fps['display']:.1f} fps")
+        for name, label in (("end_to_end", "latency"), ("hands", "hands"), ("inference", "inference")):
+            histogram = self.histograms.get(name)
+            if histogram and histogram.count:
+                parts.append(f"{label} p50 {histogram.percentile(0.5) * 1e3:.0f} / "
+                              f"p95 {histogram.percentile(0.95) * 1e3:.0f} ms")
+        return " | ".join(parts)
+
+    def prometheus(self):
+        """The snapshot in the Prometheus text exposition format"""
+        lines = ["# HELP signbridge_stage_seconds Time spent per frame in each recognition stage",
+                 "# TYPE signbridge_stage_seconds summary"]
+        for name, histogram in list(self.histograms.items()):
+            if not histogram.count:
+                continue
+            for q in QUANTILES:
+                lines.append(f'signbridge_stage_seconds{{stage="{name}",quantile="{q}"}} {histogram.percentile(q):.6f}')
+            lines.append(f'signbridge_stage_seconds_sum{{stage="{name}"}} {histogram.total:.6f}')
+            lines.append(f'signbridge_stage_seconds_count{{stage="{name}"}} {histogram.count}')
+        lines += ["# HELP signbridge_fps Items per second processed by each pipeline stage",
+                  "# TYPE signbridge_fps gauge"]
+        lines += [f'signbridge_fps{{stage="{meter.name}"}} {meter.fps:.2f}' for meter in self.meters]
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry used by the app, the recognizer and the benchmarks
+METRICS = Metrics()
+
+
+class MetricsServer:
+    """Serves a Metrics registry on localhost: /metrics (Prometheus) and /metrics.json"""
+
+    def __init__(self, metrics=METRICS, host="127.0.0.1", port=DEFAULT_PORT):
+        self.metrics = metrics
+        self.host = host
+        self.port = port
+        self._server = None
+
+    def start(self):
+        metrics = self.metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split("?")[0]
+                if path == "/metrics":
+                    body, content_type = metrics.prometheus().encode(), "text/plain; version=0.0.4"
+                elif path in ("/", "/metrics.json"):
+                    body, content_type = json.dumps(metrics.snapshot(), indent=2).encode(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # Keep scrapes out of the console
+
+        try:
+            self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            print(f"⚠️ Metrics server unavailable: {e}")
+            return False
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, name="SignBridge-metrics", daemon=True).start()
+        print(f"📈 Metrics: http://{self.host}:{self.port}/metrics (Prometheus), /metrics.json")
+        return True
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
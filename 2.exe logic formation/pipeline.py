@@ -0,0 +1,173 @@
+"""Threaded stage pipeline used by the live detection loop.
+
+Each stage runs in its own thread and hands results to the next one through a
+bounded FrameQueue. In live mode the queues drop the oldest frame when full, so
+a slow stage (e.g. inference) never stalls the camera - it simply works on the
+freshest frame available. Offline tools use lossless queues instead and end
+the stream with END_OF_STREAM, which every stage forwards before exiting.
+"""
+import collections
+import queue
+import threading
+import time
+
+# Returned by a source stage (or received by any stage) to mark the end of a
+# finite stream; it is forwarded downstream and then the stage exits
+END_OF_STREAM = object()
+
+
+class FrameQueue:
+    """Bounded hand-off queue between two pipeline stages.
+
+    With drop_oldest=True (live camera) put() never blocks: when the queue is
+    full the oldest item is discarded and counted in `dropped`. With
+    drop_oldest=False (offline files) put() waits for room so no frame is lost.
+    """
+
+    def __init__(self, maxsize=2, drop_oldest=True):
+        self.maxsize = maxsize
+        self.drop_oldest = drop_oldest
+        self.dropped = 0
+        self._items = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item, timeout=None):
+        """Add an item; returns False only if a blocking put timed out"""
+        with self._lock:
+            if len(self._items) >= self.maxsize:
+                if self.drop_oldest:
+                    self._items.popleft()
+                    self.dropped += 1
+                elif not self._not_full.wait_for(lambda: len(self._items) < self.maxsize, timeout):
+                    return False
+            self._items.append(item)
+            self._not_empty.notify()
+            return True
+
+    def get(self, timeout=None):
+        """Remove and return the oldest item, raising queue.Empty on timeout"""
+        with self._lock:
+            if not self._not_empty.wait_for(lambda: self._items, timeout):
+                raise queue.Empty
+            item = self._items.popleft()
+            self._not_full.notify()
+            return item
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+
+class ThroughputMeter:
+    """Counts processed items and reports a rolling items-per-second rate"""
+
+    def __init__(self, name, window=2.0):
+        self.name = name
+        self.window = window
+        self.count = 0
+        self._window_start = time.perf_counter()
+        self._window_count = 0
+        self._rate = 0.0
+
+    def tick(self):
+        self.count += 1
+        self._window_count += 1
+        now = time.perf_counter()
+        elapsed = now - self._window_start
+        if elapsed >= self.window:
+            self._rate = self._window_count / elapsed
+            self._window_start = now
+            self._window_count = 0
+
+    @property
+    def fps(self):
+        """Rate over the last full window; decays toward 0 once a stalled stage stops ticking"""
+        elapsed = time.perf_counter() - self._window_start
+        if elapsed >= self.window:
+            return self._window_count / elapsed
+        return self._rate
+
+
+class PipelineStage(threading.Thread):
+    """Runs `func` on every item taken from `inbox` and forwards the result.
+
+    A stage without an inbox is a source: `func()` is called repeatedly and
+    whatever it returns is pushed downstream. Returning None drops the item.
+    Any exception stops the whole pipeline through the shared stop event.
+    """
+
+    def __init__(self, name, func, inbox, outbox, stop_event):
+        super().__init__(name=f"SignBridge-{name}", daemon=True)
+        self.stage_name = name
+        self.func = func
+        self.inbox = inbox
+        self.outbox = outbox
+        self.stop_event = stop_event
+        self.meter = ThroughputMeter(name)
+        self.error = None
+
+    def run(self):
+        try:
+            while not self.stop_event.is_set():
+                if self.inbox is None:
+                    result = self.func()
+                else:
+                    try:
+                        item = self.inbox.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    result = END_OF_STREAM if item is END_OF_STREAM else self.func(item)
+
+                if result is None:
+                    continue
+                if result is not END_OF_STREAM:
+                    self.meter.tick()
+                if self.outbox is not None:
+                    while not self.outbox.put(result, timeout=0.1):
+                        if self.stop_event.is_set():
+                            return
+                if result is END_OF_STREAM:
+                    return
+        except Exception as e:
+            self.error = e
+            print(f"❌ Pipeline stage '{self.stage_name}' failed: {e}")
+            self.stop_event.set()
+
+
+class Pipeline:
+    """A chain of PipelineStages sharing one stop event"""
+
+    def __init__(self, stages, stop_event):
+        self.stages = stages
+        self.stop_event = stop_event
+
+    def start(self):
+        for stage in self.stages:
+            stage.start()
+
+    def stop(self, timeout=2.0):
+        self.stop_event.set()
+        for stage in self.stages:
+            stage.join(timeout)
+
+    def join(self, timeout=None):
+        """Wait for every stage to finish on its own (e.g. after END_OF_STREAM)"""
+        for stage in self.stages:
+            stage.join(timeout)
+
+    def throughput(self):
+        """Return {stage name: items per second} for every stage"""
+        return {stage.stage_name: stage.meter.fps for stage in self.stages}
+
+    def dropped(self):
+        """Return the number of frames discarded by each stage's inbox"""
+        return {stage.stage_name: stage.inbox.dropped
+                for stage in self.stages if stage.inbox is not None}
+
+    def report(self, extra_meters=()):
+        parts = [f"{stage.stage_name} {stage.meter.fps:.1f} fps" for stage in self.stages]
+        parts += [f"{meter.name} {meter.fps:.1f} fps" for meter in extra_meters]
+        dropped = sum(self.dropped().values())
+        return " | ".join(parts) + f" (dropped {dropped})"
@@ -0,0 +1,180 @@
+"""Profiling mode: one trace file that shows where a session's time goes.
+
+When a user reports lag, turn on "Record a performance profile" in Settings
+(or set SIGNBRIDGE_PROFILE=1, or a number of seconds) and start the camera.
+For the first `duration` seconds the Profiler records two things:
+
+- every METRICS stage span (capture, hands, inference, overlay, ...; see
+  metrics.py), one row per pipeline thread, so each frame's path through
+  the pipeline is visible;
+- a stack sample of the detection and pipeline threads every `interval`
+  seconds (sys._current_frames), drawn as a flame chart, plus a table of
+  the hottest functions.
+
+Both go into one Chrome trace-event JSON next to caption_output.txt
+(signbridge_profile_<time>.json). Open it in chrome://tracing or
+https://ui.perfetto.dev.
+"""
+import collections
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+from metrics import METRICS
+
+PROFILE_ENV = "SIGNBRIDGE_PROFILE"
+DEFAULT_DURATION = 30.0     # Seconds recorded per session
+DEFAULT_INTERVAL = 0.005    # Seconds between stack samples
+THREAD_PREFIX = "SignBridge-"
+TOP_FUNCTIONS = 40
+SPAN_PID, SAMPLE_PID = 1, 2
+
+
+def requested_duration(settings):
+    """Seconds to profile this session (0 = off), from SIGNBRIDGE_PROFILE or the settings"""
+    value = os.environ.get(PROFILE_ENV, "").strip().lower()
+    if value:
+        if value in ("true", "yes", "on"):
+            return DEFAULT_DURATION
+        if value in ("false", "no", "off"):
+            return 0.0
+        try:
+            seconds = float(value)
+        except ValueError:
+            print(f"⚠️ Ignoring {PROFILE_ENV}={value!r}: use 1/on, 0/off or a number of seconds")
+            seconds = 0.0
+        # "1" means on (the default duration); "0" and negative numbers mean off
+        return DEFAULT_DURATION if seconds == 1 else max(0.0, seconds)
+    return settings.get("profile_seconds", DEFAULT_DURATION) if settings.get("profiling") else 0.0
+
+
+class Profiler:
+    def __init__(self, output_dir, duration=DEFAULT_DURATION, interval=DEFAULT_INTERVAL,
+                 metrics=METRICS, thread_prefix=THREAD_PREFIX):
+        self.output_dir = output_dir
+        self.duration = duration
+        self.interval = interval
+        self.metrics = metrics
+        self.thread_prefix = thread_prefix
+        self.path = None
+        self.samples = 0
+        self._spans = []            # (name, start, end, thread id); list.append is thread-safe
+        self._events = []           # Sampled stack begin/end events
+        self._self_counts = collections.Counter()
+        self._total_counts = collections.Counter()
+        self._thread_names = {}
+        self._origin = 0.0
+        self._stop = threading.Event()
+        self._owner = None
+        self._thread = None
+
+    def start(self):
+        """Start recording; the calling thread is sampled too"""
+        self._owner = threading.get_ident()
+        self._origin = time.perf_counter()
+        self.metrics.tracer = self
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+        self._thread.start()
+        print(f"🔬 Profiling for {self.duration:.0f} s...")
+        return self
+
+    def add_span(self, name, start, end):
+        self._spans.append((name, start, end, threading.get_ident()))
+
+    def stop(self):
+        """End the recording early (e.g. the camera was stopped) and write the file"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        return self.path
+
+    # === SAMPLER THREAD ===
+    def _run(self):
+        stacks = {}                 # thread id -> stack of the previous sample
+        deadline = self._origin + self.duration
+        try:
+            while not self._stop.is_set() and time.perf_counter() < deadline:
+                self._sample(stacks)
+                self._stop.wait(self.interval)
+        finally:
+            self.metrics.tracer = None
+            now = self._ts(time.perf_counter())
+            for ident, stack in stacks.items():
+                self._events += [{"ph": "E", "pid": SAMPLE_PID, "tid": ident, "ts": now} for _ in stack]
+            self._write()
+
+    def _sample(self, stacks):
+        now = self._ts(time.perf_counter())
+        names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            name = names.get(ident, "")
+            if ident != self._owner and not name.startswith(self.thread_prefix):
+                continue
+            self._thread_names[ident] = name
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            stack.reverse()
+            self.samples += 1
+            self._self_counts[stack[-1]] += 1
+            self._total_counts.update(set(stack))
+
+            # Flame chart: close the frames that changed since the last sample, open the new ones
+            previous = stacks.get(ident, [])
+            common = 0
+            while common < min(len(previous), len(stack)) and previous[common] == stack[common]:
+                common += 1
+            self._events += [{"ph": "E", "pid": SAMPLE_PID, "tid": ident, "ts": now}
+                             for _ in previous[common:]]
+            self._events += [{"ph": "B", "pid": SAMPLE_PID, "tid": ident, "ts": now, "name": function}
+                             for function in stack[common:]]
+            stacks[ident] = stack
+
+    # === OUTPUT ===
+    def _ts(self, perf_time):
+        return round((perf_time - self._origin) * 1e6, 1)
+
+    def _write(self):
+        events = [{"ph": "M", "pid": SPAN_PID, "name": "process_name", "args": {"name": "Frame timings"}},
+                  {"ph": "M", "pid": SAMPLE_PID, "name": "process_name", "args": {"name": "Sampled stacks"}}]
+        for ident, name in self._thread_names.items():
+            for pid in (SPAN_PID, SAMPLE_PID):
+                events.append({"ph": "M", "pid": pid, "tid": ident, "name": "thread_name", "args": {"name": name}})
+        for name, start, end, ident in self._spans:
+            if start >= self._origin:
+                events.append({"ph": "X", "pid": SPAN_PID, "tid": ident, "name": name,
+                               "ts": self._ts(start), "dur": round((end - start) * 1e6, 1)})
+        events += self._events
+
+        hottest = [{"function": function, "self_samples": count,
+                    "total_samples": self._total_counts[function]}
+                   for function, count in self._self_counts.most_common(TOP_FUNCTIONS)]
+        trace = {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {
+                "app": "SignBridge Pro",
+                "recorded": datetime.now().isoformat(timespec="seconds"),
+                "duration_s": round(time.perf_counter() - self._origin, 2),
+                "sample_interval_ms": self.interval * 1000,
+                "samples": self.samples,
+                "spans": len(self._spans),
+                "stages": self.metrics.snapshot()["stages"],
+                "hottest_functions": hottest,
+            },
+        }
+        path = os.path.join(self.output_dir, f"signbridge_profile_{datetime.now():%Y%m%d_%H%M%S}.json")
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(trace, f)
+            os.replace(path + ".tmp", path)
+            self.path = path
+            print(f"🔬 Profile saved: {path} ({self.samples} samples, {len(self._spans)} spans)")
+        except OSError as e:
+            print(f"[ERROR] Could not write profile: {e}")
@@ -0,0 +1,195 @@
+"""Headless sign recognition engine.
+
+SignRecognizer owns everything one recognition session needs - the hand
+tracker, the classifier engine and the letter/word/caption state - and
+turns frames into events. It has no Tkinter or module-global state, so the GUI,
+the CLI tools and the benchmarks all drive the same code, and several
+independent recognizers can run in one process:
+
+    recognizer = SignRecognizer(engine, idx_to_label, settings)
+    for event in recognizer.process_frame(frame):
+        if event.kind == "caption":
+            print(event.value)
+
+The live pipeline calls the two halves separately: locate() in the landmark
+thread and classify() in the inference thread.
+
+Passing a LandmarkClassifier as the engine switches from classifying the
+cropped hand image to classifying the landmarks directly.
+"""
+import collections
+import time
+
+import numpy as np
+
+from detection import SPECIAL_GESTURES, Preprocessor, hand_roi_box, predict_roi
+from hand_tracking import DETECT_WIDTH, HandTracker, create_hand_models
+from inference import DEFAULT_BACKEND
+from landmark_classifier import LandmarkClassifier
+from metrics import METRICS
+from stabilizer import DEFAULT_MODE, PredictionStabilizer
+
+# kind: "prediction" (every classified hand), "letter" (a committed letter or
+# gesture), "word" (a finished word incl. its end character) or "caption"
+# (a caption segment ready to display)
+Event = collections.namedtuple("Event", "kind value confidence timestamp")
+# A located hand: padded pixel box (x_min, y_min, x_max, y_max) and (21, 3) landmarks
+Hand = collections.namedtuple("Hand", "box landmarks frame_size")
+
+REPEAT_DELAY = 2            # Seconds before the same letter can be committed again
+
+# Defaults for the settings the recognition pipeline reads; main.py and the CLI
+# tools (transcribe_video.py, the benches) all start from these
+DEFAULT_SETTINGS = {
+    "confidence_threshold": 0.8,
+    "display_interval": 2.5,
+    "max_caption_length": 35,
+    "inference_backend": DEFAULT_BACKEND,  # keras | tf_function | tflite | onnx
+    "model_variant": "",  # "" = sign_model.h5 | auto | float32 | dynamic | float16 | int8
+    "recognition_mode": "image",  # image = CNN on the hand crop | landmarks = MLP on hand landmarks
+    "stabilizer_mode": DEFAULT_MODE,  # majority | ema | hysteresis (see stabilizer.py)
+    "detection_width": DETECT_WIDTH,  # Width hand detection runs at; the ROI is still cut at full resolution (0 = native)
+}
+
+
+class SignRecognizer:
+    def __init__(self, engine, idx_to_label, settings, tracker=None):
+        self.engine = engine
+        self.idx_to_label = idx_to_label
+        self.settings = settings
+        self.tracker = tracker
+        self._owns_tracker = tracker is None
+        self.mode = "landmarks" if isinstance(engine, LandmarkClassifier) else "image"
+        self.stabilizer = None
+        self._stabilizer_key = None
+        self.preprocess = Preprocessor()     # Reused input buffers for the image model
+        self.reset()
+
+    def reset(self):
+        """Forget all caption state and statistics"""
+        self.current_word = ""
+        self.caption_words = []
+        self.next_caption_words = []
+        self.display_caption = ""
+        self.last_display_time = 0.0
+        if self.stabilizer:
+            self.stabilizer.reset()
+        self.prev_prediction = ""
+        self.last_update_time = 0.0
+        self.last_prediction = "None"
+        self.last_confidence = 0.0
+        self.session_stats = {"translations": 0, "words": 0, "session_start": None}
+
+    def clear_caption(self):
+        """Drop the caption on screen and any word in progress"""
+        self.display_caption = ""
+        self.current_word = ""
+        self.caption_words.clear()
+        self.next_caption_words.clear()
+
+    # === FRAME PROCESSING ===
+    def locate(self, frame):
+        """Landmark step: the Hand found in the frame, or None"""
+        if self.tracker is None:
+            self.tracker = HandTracker(create_hand_models())
+        # Follows the setting, so a change in the settings dialog applies on the next frame
+        self.tracker.detect_width = self.settings.get("detection_width", DETECT_WIDTH)
+        landmarks = self.tracker.locate(frame)
+        if landmarks is None:
+            return None
+        h, w = frame.shape[:2]
+        return Hand(hand_roi_box(landmarks, w, h), landmarks, (w, h))
+
+    def classify(self, frame, hand, now=None):
+        """Classification step: classify the located hand and advance the caption state"""
+        if hand is None:
+            self.last_prediction, self.last_confidence = "No hand detected", 0.0
+            return []
+
+        now = time.time() if now is None else now
+        if self.mode == "landmarks":
+            with METRICS.time("inference"):
+                probs = self.engine.probabilities(hand.landmarks, hand.frame_size)
+        else:
+            with METRICS.time("roi_crop"):
+                x_min, y_min, x_max, y_max = hand.box
+                hand_roi = frame[y_min:y_max, x_min:x_max]
+            if hand_roi.size == 0:
+                self.last_prediction, self.last_confidence = "None", 0.0
+                return [Event("prediction", "None", 0.0, now)]
+            probs = predict_roi(self.engine, hand_roi, self.preprocess)
+        index = int(np.argmax(probs))
+        pred_class, confidence = self.idx_to_label[index], float(probs[index])
+        self.last_prediction, self.last_confidence = pred_class, confidence
+        events = [Event("prediction", pred_class, confidence, now)]
+
+        with METRICS.time("stabilizer"):
+            stable = self._sync_stabilizer().update(probs)
+            if stable is not None:
+                stable_class = self.idx_to_label[stable]
+                if stable_class != self.prev_prediction or (now - self.last_update_time > REPEAT_DELAY):
+                    events += self._commit(stable_class, confidence, now)
+                    self.prev_prediction = stable_class
+                    self.last_update_time = now
+
+        # Update caption display logic
+        time_elapsed = now - self.last_display_time
+        total_len = sum(len(w) for w in self.next_caption_words)
+        if ((total_len >= self.settings["max_caption_length"] or
+             len(self.next_caption_words) >= 1 or
+             time_elapsed >= self.settings["display_interval"]) and self.next_caption_words):
+            events += self._update_display_caption(now)
+        return events
+
+    def process_frame(self, frame, now=None):
+        """Run both steps on one BGR frame and return the resulting events"""
+        return self.classify(frame, self.locate(frame), now)
+
+    def finish(self, now=None):
+        """End of input: flush the word in progress as a last caption"""
+        now = time.time() if now is None else now
+        if self.current_word.strip():
+            self.next_caption_words.append(self.current_word)
+            self.current_word = ""
+            self.session_stats["words"] += 1
+        if self.next_caption_words:
+            return self._update_display_caption(now)
+        return []
+
+    def close(self):
+        """Close the MediaPipe graphs unless the tracker was passed in (and is shared)"""
+        if self.tracker is not None and self._owns_tracker:
+            self.tracker.close()
+        self.tracker = None
+
+    # === CAPTION STATE ===
+    def _sync_stabilizer(self):
+        """(Re)build the stabilizer when its settings change, e.g. from the settings dialog"""
+        key = (self.settings.get("stabilizer_mode", DEFAULT_MODE), self.settings["confidence_threshold"])
+        if key != self._stabilizer_key:
+            self.stabilizer = PredictionStabilizer(len(self.idx_to_label), mode=key[0], threshold=key[1])
+            self._stabilizer_key = key
+        return self.stabilizer
+
+    def _commit(self, pred_class, confidence, now):
+        events = [Event("letter", pred_class, confidence, now)]
+        if pred_class in SPECIAL_GESTURES:
+            if self.current_word.strip():
+                word = self.current_word + SPECIAL_GESTURES[pred_class]
+                self.next_caption_words.append(word)
+                self.current_word = ""
+                self.session_stats["words"] += 1
+                events.append(Event("word", word, confidence, now))
+        else:
+            self.current_word += pred_class
+        return events
+
+    def _update_display_caption(self, now):
+        self.caption_words = self.next_caption_words.copy()
+        self.display_caption = "".join(self.caption_words).strip()
+        self.next_caption_words.clear()
+        self.last_display_time = now
+        self.session_stats["translations"] += 1
+        if not self.display_caption:
+            return []
+        return [Event("caption", self.display_caption, 1.0, now)]
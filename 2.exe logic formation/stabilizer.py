@@ -0,0 +1,83 @@
+"""Temporal stabilizer that turns noisy per-frame predictions into stable letters.
+
+Every update is O(1) in the window size: a fixed ring buffer of recent class
+indices with a running per-class histogram (for majority voting), and a NumPy
+exponential moving average of the full softmax vector (so a frame that is 60%
+"A" still counts towards "A" instead of being thrown away).
+
+Commit rules ("stabilizer_mode" in settings.json):
+
+    majority    the class appears in more than MAJORITY_RATIO of the last
+                WINDOW confident frames (the original 13-of-15 rule)
+    ema         the EMA probability of the top class reaches the threshold;
+                with the defaults a clean sign is stable after ~5 frames
+    hysteresis  like ema to enter, but the held class stays stable until its
+                EMA drops below threshold - HYSTERESIS_GAP, which stops a
+                letter from flickering in and out at the threshold
+"""
+import numpy as np
+
+MODES = ("majority", "ema", "hysteresis")
+DEFAULT_MODE = "majority"    # Unchanged behaviour for existing settings.json files
+WINDOW = 15                 # Frames in the majority-vote ring buffer
+MAJORITY_RATIO = 0.8        # Share of the window the class must hold
+EMA_ALPHA = 0.35            # Weight of the newest frame in the moving average
+HYSTERESIS_GAP = 0.3        # How far below the threshold a held class may drop
+
+
+class PredictionStabilizer:
+    def __init__(self, num_classes, mode=DEFAULT_MODE, threshold=0.8, window=WINDOW,
+                 majority_ratio=MAJORITY_RATIO, alpha=EMA_ALPHA, gap=HYSTERESIS_GAP):
+        if mode not in MODES:
+            print(f"⚠️ Unknown stabilizer mode '{mode}', using '{DEFAULT_MODE}'")
+            mode = DEFAULT_MODE
+        self.mode = mode
+        self.num_classes = num_classes
+        self.threshold = threshold
+        self.window = window
+        self.min_votes = int(window * majority_ratio)
+        self.alpha = alpha
+        self.exit_threshold = threshold - gap
+        self._ema = np.zeros(num_classes, dtype=np.float32)
+        self.reset()
+
+    def reset(self):
+        # Plain lists: indexing them is cheaper than NumPy scalars at this size
+        self._ring = [-1] * self.window
+        self._hist = [0] * self.num_classes
+        self._ema.fill(0.0)
+        self._pos = 0
+        self.held = None
+
+    def update(self, probs):
+        """Add one frame's probability vector; return the stable class index or None"""
+        probs = np.asarray(probs, dtype=np.float32).reshape(self.num_classes)
+        if self.mode == "majority":
+            return self._update_majority(probs)
+
+        self._ema *= 1.0 - self.alpha
+        self._ema += self.alpha * probs
+        top = int(np.argmax(self._ema))
+        if self.mode == "ema":
+            return top if self._ema[top] >= self.threshold else None
+
+        if self.held is not None and self._ema[self.held] >= self.exit_threshold:
+            return self.held
+        self.held = top if self._ema[top] >= self.threshold else None
+        return self.held
+
+    def _update_majority(self, probs):
+        top = int(probs.argmax())
+        if probs[top] < self.threshold:
+            return None  # Low-confidence frames don't vote, as before
+        evicted = self._ring[self._pos]
+        if evicted >= 0:
+            self._hist[evicted] -= 1
+        self._ring[self._pos] = top
+        self._hist[top] += 1
+        self._pos = (self._pos + 1) % self.window
+        return top if self._hist[top] > self.min_votes else None
+
+    @property
+    def ema(self):
+        return self._ema
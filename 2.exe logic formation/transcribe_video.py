@@ -0,0 +1,178 @@
+"""Caption a recorded video offline with the live detection pipeline.
+
+Runs the same capture -> MediaPipe landmarks -> ROI -> classifier stages as the
+app, but reads frames from a video file as fast as the CPU allows (lossless
+queues, no real-time pacing, no preview window) and writes timestamped
+captions as SRT or WebVTT. Caption timing follows video time, not wall time.
+
+    python transcribe_video.py meeting.mp4 -o meeting.srt
+    python transcribe_video.py meeting.mp4 -o meeting.vtt --backend tflite
+"""
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import cv2
+import numpy as np
+
+from inference import TFLiteEngine, create_engine, resolve_model_variant
+from landmark_classifier import load_landmark_classifier
+from pipeline import END_OF_STREAM, FrameQueue, Pipeline, PipelineStage
+from recognizer import DEFAULT_SETTINGS, SignRecognizer
+
+if getattr(sys, 'frozen', False):
+    base_path = sys._MEIPASS
+else:
+    base_path = os.path.dirname(os.path.abspath(__file__))
+
+model_path = os.path.join(base_path, "model", "sign_model.h5")
+label_map_path = os.path.join(base_path, "model", "label_map.npy")
+settings_path = os.path.join(base_path, "settings.json")
+
+CAPTION_HOLD = 3.0          # Max seconds a caption stays on screen without a successor
+QUEUE_SIZE = 8
+
+
+def load_settings():
+    try:
+        with open(settings_path, 'r') as f:
+            return {**DEFAULT_SETTINGS, **json.load(f)}
+    except (OSError, ValueError):
+        return DEFAULT_SETTINGS.copy()
+
+
+def format_timestamp(seconds, vtt=False):
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3600000)
+    minutes, millis = divmod(millis, 60000)
+    secs, millis = divmod(millis, 1000)
+    separator = "." if vtt else ","
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def write_captions(captions, path, end_time, vtt=False):
+    with open(path, "w", encoding="utf-8") as f:
+        if vtt:
+            f.write("WEBVTT\n\n")
+        for i, (start, text) in enumerate(captions):
+            next_start = captions[i + 1][0] if i + 1 < len(captions) else end_time
+            end = max(start + 0.5, min(next_start, start + CAPTION_HOLD))
+            if not vtt:
+                f.write(f"{i + 1}\n")
+            f.write(f"{format_timestamp(start, vtt)} --> {format_timestamp(end, vtt)}\n{text}\n\n")
+
+
+def load_engine(settings):
+    """Return (engine, idx_to_label) for the configured recognition mode"""
+    if settings["recognition_mode"] == "landmarks":
+        classifier = load_landmark_classifier(os.path.dirname(model_path))
+        if classifier:
+            return classifier, classifier.idx_to_label
+    label_map = np.load(label_map_path, allow_pickle=True).item()
+    idx_to_label = {v: k for k, v in label_map.items()}
+    variant_path = resolve_model_variant(os.path.dirname(model_path), settings["model_variant"])
+    if variant_path:
+        return TFLiteEngine(variant_path), idx_to_label
+    return create_engine(settings["inference_backend"], model_path), idx_to_label
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Caption a recorded video with SignBridge")
+    parser.add_argument("video", help="Input video file")
+    parser.add_argument("-o", "--output", help="Caption file (.srt or .vtt); defaults to <video>.srt")
+    parser.add_argument("--format", choices=("srt", "vtt"), help="Override the format implied by --output")
+    parser.add_argument("--backend", help="Inference backend (defaults to settings.json)")
+    parser.add_argument("--mode", choices=("image", "landmarks"), help="Recognition mode (defaults to settings.json)")
+    parser.add_argument("--detection-width", type=int, help="Width MediaPipe detection runs at (0 = native)")
+    args = parser.parse_args()
+
+    settings = load_settings()
+    if args.backend:
+        settings["inference_backend"] = args.backend
+    if args.mode:
+        settings["recognition_mode"] = args.mode
+    if args.detection_width is not None:
+        settings["detection_width"] = args.detection_width
+    output = args.output or os.path.splitext(args.video)[0] + ".srt"
+    vtt = (args.format or os.path.splitext(output)[1].lstrip(".").lower()) == "vtt"
+
+    cap = cv2.VideoCapture(args.video)
+    if not cap.isOpened():
+        print(f"❌ Could not open video: {args.video}")
+        return 1
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    engine, idx_to_label = load_engine(settings)
+    recognizer = SignRecognizer(engine, idx_to_label, settings)
+    captions = []               # [(video seconds, caption text)]
+    frame_index = [0]
+
+    # Same stage split as the live app, but lossless and ended by END_OF_STREAM
+    def read_frame():
+        ret, frame = cap.read()
+        if not ret:
+            return END_OF_STREAM
+        timestamp = frame_index[0] / fps
+        frame_index[0] += 1
+        return timestamp, frame
+
+    def locate(item):
+        timestamp, frame = item
+        return timestamp, frame, recognizer.locate(frame)
+
+    def classify(item):
+        timestamp, frame, hand = item
+        return timestamp, recognizer.classify(frame, hand, now=timestamp)
+
+    stop_event = threading.Event()
+    frames = FrameQueue(QUEUE_SIZE, drop_oldest=False)
+    located = FrameQueue(QUEUE_SIZE, drop_oldest=False)
+    predictions = FrameQueue(QUEUE_SIZE, drop_oldest=False)
+    pipeline = Pipeline([
+        PipelineStage("decode", read_frame, None, frames, stop_event),
+        PipelineStage("landmarks", locate, frames, located, stop_event),
+        PipelineStage("inference", classify, located, predictions, stop_event),
+    ], stop_event)
+
+    print(f"🎬 Transcribing {args.video} ({total_frames} frames @ {fps:.1f} fps)")
+    start = time.perf_counter()
+    pipeline.start()
+    processed, last_timestamp = 0, 0.0
+    while True:
+        try:
+            item = predictions.get(timeout=0.5)
+        except queue.Empty:
+            if stop_event.is_set():  # A stage failed before reaching the end
+                break
+            continue
+        if item is END_OF_STREAM:
+            break
+        last_timestamp, events = item
+        captions += [(e.timestamp, e.value) for e in events if e.kind == "caption"]
+        processed += 1
+        if processed % 300 == 0:
+            elapsed = time.perf_counter() - start
+            print(f"  {processed}/{total_frames} frames ({processed / elapsed:.1f} fps)")
+    pipeline.stop()
+    elapsed = time.perf_counter() - start
+
+    captions += [(e.timestamp, e.value) for e in recognizer.finish(last_timestamp) if e.kind == "caption"]
+    write_captions(captions, output, last_timestamp + 1.0 / fps, vtt)
+    cap.release()
+    recognizer.close()
+
+    print(f"\n✅ {len(captions)} captions written to: {output}")
+    print(f"⚡ {processed} frames in {elapsed:.2f}s = {processed / elapsed:.1f} frames/sec "
+          f"({processed / fps / elapsed:.1f}x real time)")
+    for stage in pipeline.stages:
+        print(f"   {stage.stage_name:<10} {stage.meter.count} items")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Incremental transcript view for the "Real-time Translation" text box.
+
+The old update read the whole widget, concatenated the new caption and
+deleted/re-inserted everything, which made each caption O(session length) on
+the Tk main loop. TranscriptView only inserts the new segment at the end. Once
+the widget holds more than `max_chars`, the oldest text is trimmed at a word
+boundary and replaced by a one-line marker. The full session is still on disk
+in caption_transcript.txt (see caption_writer.py).
+
+The widget stays editable (the user can correct the text before saving it),
+so the character count is read back from the widget rather than tracked.
+"""
+
+DEFAULT_VISIBLE_CHARS = 20000
+TRIM_SLACK = 0.1            # Let the text grow 10% past the limit before trimming
+PAGED_TAG = "paged"
+
+
+class TranscriptView:
+    def __init__(self, widget, max_chars=DEFAULT_VISIBLE_CHARS, paged_note="earlier text", muted_color=None):
+        self.widget = widget
+        self.max_chars = max_chars
+        self.paged_note = paged_note
+        self.chars = 0              # Characters of text in the widget, below the paged-out marker
+        self.word_count = 0         # Words added this session, including paged-out ones
+        self.paged_out = 0          # Characters trimmed from the top
+        if muted_color:
+            widget.tag_configure(PAGED_TAG, foreground=muted_color)
+
+    def append(self, segment):
+        """Add a caption segment after the existing text and keep the view bounded"""
+        if not segment:
+            return
+        text = f" {segment}" if self._body_chars() else segment
+        # Only follow the new text if the user hasn't scrolled up to read
+        at_bottom = self.widget.yview()[1] >= 0.999
+        self.widget.insert("end-1c", text)
+        # Counted by Tk, so edits made by the user are included
+        self.chars = self._body_chars()
+        self.word_count += len(segment.split())
+        if self.chars > self.max_chars * (1 + TRIM_SLACK):
+            self._trim()
+        if at_bottom:
+            self.widget.see("end")
+
+    def set_text(self, text):
+        """Replace everything (e.g. when the history is loaded back into the view)"""
+        self.clear()
+        self.append(text.strip())
+
+    def clear(self):
+        self.widget.delete("1.0", "end")
+        self.chars = self.word_count = self.paged_out = 0
+
+    def text(self):
+        """The caption text currently shown, without the paged-out marker"""
+        return self.widget.get(self._body_start(), "end-1c").strip()
+
+    def _body_chars(self):
+        count = self.widget.count(self._body_start(), "end-1c", "chars")
+        if isinstance(count, tuple):    # Tk returns a 1-tuple, or None for an empty range
+            count = count[0]
+        return count or 0
+
+    def _body_start(self):
+        ranges = self.widget.tag_ranges(PAGED_TAG)
+        return ranges[1] if ranges else "1.0"
+
+    def _trim(self):
+        start = self._body_start()
+        end = self.widget.index(f"{start} + {self.chars - self.max_chars} chars")
+        space = self.widget.search(" ", end, stopindex="end")
+        if space:
+            end = self.widget.index(f"{space} + 1 chars")
+        removed = len(self.widget.get(start, end))
+        self.widget.delete(start, end)
+        self.chars -= removed
+        self.paged_out += removed
+
+        note = f"[… {self.paged_out:,} earlier characters in {self.paged_note}]\n"
+        if self.widget.tag_ranges(PAGED_TAG):
+            self.widget.delete("1.0", self._body_start())
+        self.widget.insert("1.0", note, PAGED_TAG)
@@ -0,0 +1,118 @@
+"""Virtual camera output for OBS, Zoom, Teams & co.
+
+Instead of showing frames in an OpenCV window that OBS has to screen-capture,
+VirtualCameraSink pushes the annotated frames straight into a
+pyvirtualcam.Camera (OBS Virtual Camera on Windows). It runs its own pacing
+thread: the pipeline just drops the newest frame into a single slot with
+submit(), and the sink converts it once into a pre-allocated RGB buffer and
+sends it at the camera's frame rate. If no new frame arrived in time, the last
+buffer is sent again without any conversion, so meeting apps always get a
+steady stream.
+
+    sink = VirtualCameraSink(1280, 720, fps=30)
+    if sink.start():
+        sink.submit(frame)      # From the display loop, never blocks
+    sink.stop()
+
+`camera_factory` lets tests and benchmarks swap in a stub device.
+"""
+import threading
+import time
+
+import cv2
+import numpy as np
+
+
+def open_pyvirtualcam(width, height, fps):
+    import pyvirtualcam  # Optional dependency, only needed when the sink is used
+    return pyvirtualcam.Camera(width=width, height=height, fps=fps,
+                               fmt=pyvirtualcam.PixelFormat.RGB)
+
+
+class VirtualCameraSink:
+    def __init__(self, width, height, fps=30, camera_factory=open_pyvirtualcam):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.camera_factory = camera_factory
+        self.camera = None
+        # Written only by the pacing thread; the camera reads it on send()
+        self._rgb = np.zeros((height, width, 3), dtype=np.uint8)
+        self._scaled = np.zeros((height, width, 3), dtype=np.uint8)
+        self._latest = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.submitted = 0      # Frames handed over by the pipeline
+        self.sent = 0           # Frames sent to the device (incl. repeats)
+        self.repeated = 0       # Sends that reused the previous buffer
+        self.conversions = 0    # BGR -> RGB copies into the buffer
+        self.overwritten = 0    # Submitted frames replaced before they were sent
+
+    def start(self):
+        """Open the device and start pacing; returns False if no virtual camera is available"""
+        try:
+            self.camera = self.camera_factory(self.width, self.height, self.fps)
+        except Exception as e:
+            print(f"⚠️ Virtual camera unavailable: {e}")
+            return False
+        print(f"🎥 Virtual camera started: {getattr(self.camera, 'device', 'virtual camera')} "
+              f"({self.width}x{self.height} @ {self.fps} fps)")
+        self._thread = threading.Thread(target=self._run, name="SignBridge-vcam", daemon=True)
+        self._thread.start()
+        return True
+
+    def submit(self, frame):
+        """Hand over the newest BGR frame; the caller must not modify it afterwards"""
+        with self._lock:
+            if self._latest is not None:
+                self.overwritten += 1
+            self._latest = frame
+            self.submitted += 1
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+        if self.camera:
+            self.camera.close()
+            self.camera = None
+
+    def report(self):
+        return (f"vcam sent {self.sent} (repeats {self.repeated}, conversions {self.conversions}, "
+                f"skipped {self.overwritten})")
+
+    def _run(self):
+        while not self._stop.is_set():
+            with self._lock:
+                frame, self._latest = self._latest, None
+            if frame is None:
+                self.repeated += 1
+            else:
+                self._convert(frame)
+            self.camera.send(self._rgb)
+            self.sent += 1
+            self.camera.sleep_until_next_frame()
+
+    def _convert(self, frame):
+        if frame.shape[1] != self.width or frame.shape[0] != self.height:
+            frame = cv2.resize(frame, (self.width, self.height), dst=self._scaled)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        self.conversions += 1
+
+
+class PreviewThrottle:
+    """Limits the local OpenCV preview window to `fps` frames per second"""
+
+    def __init__(self, fps):
+        self.interval = 1.0 / fps if fps > 0 else None
+        self._next = 0.0
+
+    def due(self):
+        if self.interval is None:
+            return False
+        now = time.perf_counter()
+        if now < self._next:
+            return False
+        self._next = now + self.interval
+        return True